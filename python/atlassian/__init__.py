@@ -1,95 +1,74 @@
-from .auth import AuthProvider, BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
-from .canonical_models import (
-    AtlassianOpsAlert,
-    AtlassianOpsIncident,
-    AtlassianOpsSchedule,
-    CanonicalProjectWithOpsgenieTeams,
-    JiraChangelogEvent,
-    JiraChangelogItem,
-    JiraIssue,
-    JiraProject,
-    JiraSprint,
-    JiraUser,
-    JiraWorklog,
-    OpsgenieTeamRef,
-    TeamworkProject,
-    TeamworkUserRelation,
-)
-from .errors import (
-    GraphQLError,
-    GraphQLOperationError,
-    LocalRateLimitError,
-    RateLimitError,
-    SerializationError,
-    TransportError,
-)
-from .graph.api.jira_projects import (
-    iter_projects_with_opsgenie_linkable_teams,
-    list_projects_with_opsgenie_linkable_teams,
-)
-from .graph.client import GraphQLClient
-from .graph.schema_fetcher import fetch_schema_introspection
-from .models import GraphQLErrorItem, GraphQLResult
-from .oauth_3lo import (
-    OAuthRefreshTokenAuth,
-    OAuthToken,
-    build_authorize_url,
-    exchange_authorization_code,
-    fetch_accessible_resources,
-    refresh_access_token,
-)
-from .rest.api.jira_changelog import iter_issue_changelog_via_rest
-from .rest.api.jira_issues import iter_issues_via_rest, list_issues_via_rest
-from .rest.api.jira_projects import iter_projects_via_rest, list_projects_via_rest
-from .rest.api.jira_sprints import iter_board_sprints_via_rest
-from .rest.api.jira_worklogs import iter_issue_worklogs_via_rest
-from .rest.client import JiraRestClient
-from .rest.openapi_fetcher import fetch_jira_rest_openapi
+"""Top-level package exports, resolved lazily (PEP 562).
 
-__all__ = [
-    "GraphQLClient",
-    "AuthProvider",
-    "OAuthBearerAuth",
-    "OAuthRefreshTokenAuth",
-    "BasicApiTokenAuth",
-    "CookieAuth",
-    "fetch_schema_introspection",
-    "fetch_jira_rest_openapi",
-    "OAuthToken",
-    "build_authorize_url",
-    "exchange_authorization_code",
-    "refresh_access_token",
-    "fetch_accessible_resources",
-    "GraphQLResult",
-    "GraphQLErrorItem",
-    "TransportError",
-    "RateLimitError",
-    "LocalRateLimitError",
-    "GraphQLError",
-    "GraphQLOperationError",
-    "SerializationError",
-    "JiraUser",
-    "JiraProject",
-    "JiraSprint",
-    "JiraIssue",
-    "JiraChangelogEvent",
-    "JiraChangelogItem",
-    "JiraWorklog",
-    "AtlassianOpsIncident",
-    "AtlassianOpsAlert",
-    "AtlassianOpsSchedule",
-    "OpsgenieTeamRef",
-    "CanonicalProjectWithOpsgenieTeams",
-    "TeamworkProject",
-    "TeamworkUserRelation",
-    "iter_projects_with_opsgenie_linkable_teams",
-    "list_projects_with_opsgenie_linkable_teams",
-    "JiraRestClient",
-    "iter_projects_via_rest",
-    "list_projects_via_rest",
-    "iter_issues_via_rest",
-    "list_issues_via_rest",
-    "iter_issue_changelog_via_rest",
-    "iter_issue_worklogs_via_rest",
-    "iter_board_sprints_via_rest",
-]
+Importing `atlassian` used to pull in httpx, the REST client, and the OAuth
+helpers even for scripts that only touch the canonical models. Attributes are
+now imported from their defining module on first access and cached in module
+globals, so `from atlassian import JiraIssue` no longer pays for the full
+client stack.
+"""
+
+from importlib import import_module
+
+_LAZY = {
+    "GraphQLClient": ".graph.client",
+    "AuthProvider": ".auth",
+    "OAuthBearerAuth": ".auth",
+    "OAuthRefreshTokenAuth": ".oauth_3lo",
+    "BasicApiTokenAuth": ".auth",
+    "CookieAuth": ".auth",
+    "fetch_schema_introspection": ".graph.schema_fetcher",
+    "fetch_jira_rest_openapi": ".rest.openapi_fetcher",
+    "OAuthToken": ".oauth_3lo",
+    "build_authorize_url": ".oauth_3lo",
+    "exchange_authorization_code": ".oauth_3lo",
+    "refresh_access_token": ".oauth_3lo",
+    "fetch_accessible_resources": ".oauth_3lo",
+    "GraphQLResult": ".models",
+    "GraphQLErrorItem": ".models",
+    "TransportError": ".errors",
+    "RateLimitError": ".errors",
+    "LocalRateLimitError": ".errors",
+    "GraphQLError": ".errors",
+    "GraphQLOperationError": ".errors",
+    "SerializationError": ".errors",
+    "JiraUser": ".canonical_models",
+    "JiraProject": ".canonical_models",
+    "JiraSprint": ".canonical_models",
+    "JiraIssue": ".canonical_models",
+    "JiraChangelogEvent": ".canonical_models",
+    "JiraChangelogItem": ".canonical_models",
+    "JiraWorklog": ".canonical_models",
+    "AtlassianOpsIncident": ".canonical_models",
+    "AtlassianOpsAlert": ".canonical_models",
+    "AtlassianOpsSchedule": ".canonical_models",
+    "OpsgenieTeamRef": ".canonical_models",
+    "CanonicalProjectWithOpsgenieTeams": ".canonical_models",
+    "TeamworkProject": ".canonical_models",
+    "TeamworkUserRelation": ".canonical_models",
+    "iter_projects_with_opsgenie_linkable_teams": ".graph.api.jira_projects",
+    "list_projects_with_opsgenie_linkable_teams": ".graph.api.jira_projects",
+    "JiraRestClient": ".rest.client",
+    "iter_projects_via_rest": ".rest.api.jira_projects",
+    "list_projects_via_rest": ".rest.api.jira_projects",
+    "iter_issues_via_rest": ".rest.api.jira_issues",
+    "list_issues_via_rest": ".rest.api.jira_issues",
+    "iter_issue_changelog_via_rest": ".rest.api.jira_changelog",
+    "iter_issue_worklogs_via_rest": ".rest.api.jira_worklogs",
+    "iter_board_sprints_via_rest": ".rest.api.jira_sprints",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
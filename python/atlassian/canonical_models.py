@@ -1,17 +1,25 @@
+"""Canonical provider-agnostic models shared by the graph and REST layers.
+
+All models are frozen, slotted dataclasses: `slots=True` gives the compact
+fixed-layout instances a Struct-style library would, without adding a compiled
+runtime dependency, and keeps this module eligible for the optional mypyc
+speedups build (`tools/build_speedups.py`).
+"""
+
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraUser:
     account_id: str
     display_name: str
     email: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProject:
     cloud_id: str
     key: str
@@ -19,7 +27,7 @@ class JiraProject:
     type: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraSprint:
     id: str
     name: str
@@ -29,7 +37,7 @@ class JiraSprint:
     complete_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraIssue:
     cloud_id: str
     key: str
@@ -41,13 +49,13 @@ class JiraIssue:
     resolved_at: Optional[str] = None
     assignee: Optional[JiraUser] = None
     reporter: Optional[JiraUser] = None
-    labels: List[str] = field(default_factory=list)
-    components: List[str] = field(default_factory=list)
+    labels: Tuple[str, ...] = ()
+    components: Tuple[str, ...] = ()
     story_points: Optional[float] = None
-    sprint_ids: List[str] = field(default_factory=list)
+    sprint_ids: Tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraChangelogItem:
     field: str
     from_value: Optional[str] = None
@@ -56,7 +64,7 @@ class JiraChangelogItem:
     to_string: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraChangelogEvent:
     issue_key: str
     event_id: str
@@ -65,7 +73,7 @@ class JiraChangelogEvent:
     author: Optional[JiraUser] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraWorklog:
     issue_key: str
     worklog_id: str
@@ -76,26 +84,26 @@ class JiraWorklog:
     author: Optional[JiraUser] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamRef:
     id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalProjectWithOpsgenieTeams:
     project: JiraProject
-    opsgenie_teams: List[OpsgenieTeamRef] = field(default_factory=list)
+    opsgenie_teams: Tuple[OpsgenieTeamRef, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraBoard:
     id: str
     name: str
     type: str  # scrum, kanban
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraVersion:
     id: str
     name: str
@@ -104,7 +112,7 @@ class JiraVersion:
     release_date: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlassianOpsIncident:
     id: str
     url: Optional[str]
@@ -116,7 +124,7 @@ class AtlassianOpsIncident:
     provider_id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlassianOpsAlert:
     id: str
     status: str
@@ -127,14 +135,14 @@ class AtlassianOpsAlert:
     closed_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlassianOpsSchedule:
     id: str
     name: str
     timezone: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassComponent:
     id: str
     cloud_id: str
@@ -143,12 +151,12 @@ class CompassComponent:
     description: Optional[str] = None
     owner_team_id: Optional[str] = None
     owner_team_name: Optional[str] = None
-    labels: List[str] = field(default_factory=list)
+    labels: Tuple[str, ...] = ()
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassRelationship:
     id: str
     type: str  # DEPENDS_ON, OWNED_BY, etc.
@@ -156,7 +164,7 @@ class CompassRelationship:
     end_component_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassScorecardScore:
     component_id: str
     scorecard_id: str
@@ -166,7 +174,7 @@ class CompassScorecardScore:
     evaluated_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlassianTeam:
     id: str  # ARI format: ari:cloud:identity::team/{uuid}
     display_name: str
@@ -176,7 +184,7 @@ class AtlassianTeam:
     member_count: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlassianTeamMember:
     team_id: str
     account_id: str
@@ -184,7 +192,7 @@ class AtlassianTeamMember:
     role: Optional[str] = None  # REGULAR, ADMIN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamworkProject:
     team_id: str
     project_id: str
@@ -192,7 +200,7 @@ class TeamworkProject:
     project_name: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamworkUserRelation:
     subject_user_id: str
     relation_type: str  # TEAM_MEMBER, REPORTS_TO, MANAGES
@@ -22,23 +22,28 @@ class RateLimitError(Exception):
         wait_seconds: Optional[float] = None,
         max_wait_seconds: Optional[float] = None,
     ):
-        message = "Rate limited"
-        if retry_after:
-            message = f"{message}; retry_at={retry_after.isoformat()}"
-        if header_value:
-            message = f"{message}; Retry-After={header_value}"
-        if wait_seconds is not None and max_wait_seconds is not None:
-            message = (
-                f"{message}; wait_seconds={round(wait_seconds, 3)}"
-                f"; max_wait_seconds={max_wait_seconds}"
-            )
-        super().__init__(message)
+        super().__init__("Rate limited")
         self.retry_after = retry_after
         self.attempts = attempts
         self.header_value = header_value
         self.wait_seconds = wait_seconds
         self.max_wait_seconds = max_wait_seconds
 
+    def __str__(self) -> str:
+        # Formatted on demand: retried-and-swallowed instances never pay for
+        # the message assembly.
+        message = "Rate limited"
+        if self.retry_after:
+            message = f"{message}; retry_at={self.retry_after.isoformat()}"
+        if self.header_value:
+            message = f"{message}; Retry-After={self.header_value}"
+        if self.wait_seconds is not None and self.max_wait_seconds is not None:
+            message = (
+                f"{message}; wait_seconds={round(self.wait_seconds, 3)}"
+                f"; max_wait_seconds={self.max_wait_seconds}"
+            )
+        return message
+
 
 class LocalRateLimitError(Exception):
     def __init__(
@@ -47,15 +52,18 @@ class LocalRateLimitError(Exception):
         wait_seconds: float,
         max_wait_seconds: float,
     ):
-        super().__init__(
-            f"local rate limit exceeded; estimated_cost={estimated_cost}; "
-            f"wait_seconds={round(wait_seconds, 3)} exceeds "
-            f"max_wait_seconds={max_wait_seconds}"
-        )
+        super().__init__("local rate limit exceeded")
         self.estimated_cost = estimated_cost
         self.wait_seconds = wait_seconds
         self.max_wait_seconds = max_wait_seconds
 
+    def __str__(self) -> str:
+        return (
+            f"local rate limit exceeded; estimated_cost={self.estimated_cost}; "
+            f"wait_seconds={round(self.wait_seconds, 3)} exceeds "
+            f"max_wait_seconds={self.max_wait_seconds}"
+        )
+
 
 class GraphQLOperationError(Exception):
     def __init__(
@@ -0,0 +1,24 @@
+"""Helpers for composing multi-alias GraphQL batch queries.
+
+Batching N single-key lookups into one aliased document collapses N network
+round-trips into one. The per-alias selection set is lifted from the generated
+single-item query so batched and unbatched paths stay in sync.
+"""
+
+from __future__ import annotations
+
+
+def field_selection(query: str, field: str) -> str:
+    """Return the balanced-brace selection set following `field` in `query`."""
+    start = query.index(field)
+    brace = query.index("{", start)
+    depth = 0
+    for idx in range(brace, len(query)):
+        ch = query[idx]
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return query[brace : idx + 1]
+    raise ValueError(f"Unbalanced selection set for field {field!r}")
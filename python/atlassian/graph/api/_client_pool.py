@@ -0,0 +1,42 @@
+"""Shared `GraphQLClient` instances for the `fetch_*` convenience helpers.
+
+Building a fresh client per call pays the TCP+TLS handshake on every fetch.
+Clients are pooled per (base_url, auth, timeout) so the underlying httpx
+connection pool is retained between calls; everything is closed at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Dict, Tuple
+
+from ..client import GraphQLClient
+
+_pool_lock = threading.Lock()
+_pool: Dict[Tuple[str, int, float], GraphQLClient] = {}
+
+
+def _close_pool() -> None:
+    with _pool_lock:
+        for client in _pool.values():
+            client.close()
+        _pool.clear()
+
+
+atexit.register(_close_pool)
+
+
+def get_shared_client(base_url: str, auth, timeout_seconds: float = 30.0) -> GraphQLClient:
+    """Return a pooled client for the given endpoint/auth, creating it on first use.
+
+    Auth objects are cached per env snapshot (see `_env_auth`), so keying on
+    `id(auth)` keeps one client per distinct credential set.
+    """
+    key = (base_url, id(auth), timeout_seconds)
+    with _pool_lock:
+        client = _pool.get(key)
+        if client is None:
+            client = GraphQLClient(base_url, auth=auth, timeout_seconds=timeout_seconds)
+            _pool[key] = client
+        return client
@@ -0,0 +1,99 @@
+"""Shared environment-based auth resolution for the `fetch_*` convenience helpers.
+
+The auth object is cached on a snapshot of the relevant environment variables so
+repeated fetches reuse the same instance instead of re-reading `os.environ` and
+re-parsing ``ATLASSIAN_COOKIES_JSON`` on every call.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Optional, Tuple
+
+from ...auth import BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
+from ...oauth_3lo import OAuthRefreshTokenAuth
+
+try:  # optional speedup for large ATLASSIAN_COOKIES_JSON payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_AUTH_ENV_VARS = (
+    "ATLASSIAN_OAUTH_ACCESS_TOKEN",
+    "ATLASSIAN_OAUTH_REFRESH_TOKEN",
+    "ATLASSIAN_CLIENT_ID",
+    "ATLASSIAN_CLIENT_SECRET",
+    "ATLASSIAN_EMAIL",
+    "ATLASSIAN_API_TOKEN",
+    "ATLASSIAN_COOKIES_JSON",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_env_snapshot() -> Tuple[Optional[str], ...]:
+    environ = os.environ
+    return tuple(environ.get(name) for name in _AUTH_ENV_VARS)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_from_snapshot(snapshot: Tuple[Optional[str], ...]):
+    token, refresh_token, client_id, client_secret, email, api_token, cookies_json = snapshot
+
+    if refresh_token and client_id and client_secret:
+        return OAuthRefreshTokenAuth(
+            client_id=client_id,
+            client_secret=client_secret,
+            refresh_token=refresh_token,
+        )
+    if token:
+        if client_secret and token.strip() == client_secret.strip():
+            raise ValueError(
+                "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
+                "set an OAuth access token (not the client secret)."
+            )
+        return OAuthBearerAuth(lambda: token)
+    if email and api_token:
+        return BasicApiTokenAuth(email, api_token)
+    if cookies_json:
+        try:
+            cookies = _json_loads(cookies_json)
+        except ValueError:
+            return None
+        if isinstance(cookies, dict) and all(
+            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
+        ):
+            return CookieAuth(cookies)
+    return None
+
+
+def get_env_auth():
+    """Return the auth object implied by the environment, reusing a cached instance.
+
+    The environment snapshot is taken once per process; call reload_env() after
+    mutating os.environ (e.g. in tests) so the next call re-reads the environment.
+    """
+    return _auth_from_snapshot(_auth_env_snapshot())
+
+
+@functools.lru_cache(maxsize=1)
+def _experimental_apis_env() -> Tuple[str, ...]:
+    raw = os.environ.get("ATLASSIAN_GQL_EXPERIMENTAL_APIS")
+    if not raw:
+        return ()
+    return tuple(part for part in (p.strip() for p in raw.split(",")) if part)
+
+
+def get_env_experimental_apis() -> list[str]:
+    return list(_experimental_apis_env())
+
+
+def reload_env() -> None:
+    """Forget the cached environment snapshots.
+
+    The snapshots are taken once per process; call this after mutating
+    os.environ (e.g. in tests) so the next fetch re-reads the environment.
+    """
+    _auth_env_snapshot.cache_clear()
+    _auth_from_snapshot.cache_clear()
+    _experimental_apis_env.cache_clear()
@@ -0,0 +1,21 @@
+"""Argument validation shared by the graph API entrypoints.
+
+Entrypoints clean their string arguments exactly once and pass the cleaned
+values downstream; strip() is only called when a boundary character actually
+needs trimming.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+def require_nonempty(value: Optional[str], name: str) -> str:
+    """Return `value` trimmed, raising ValueError when nothing remains."""
+    if value:
+        if not value[0].isspace() and not value[-1].isspace():
+            return value
+        cleaned = value.strip()
+        if cleaned:
+            return cleaned
+    raise ValueError(f"{name} is required")
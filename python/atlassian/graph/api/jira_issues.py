@@ -1,57 +1,33 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from typing import Optional, Sequence
 
-from ...auth import BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
 from ...canonical_models import JiraIssue
 from ...errors import GraphQLOperationError, SerializationError
-from ...oauth_3lo import OAuthRefreshTokenAuth
+from ..async_client import AsyncGraphQLClient
 from ..client import GraphQLClient
 from ..gen import jira_issues_api as api
 from ..mappers.jira_issues import map_issue
+from ._batch import field_selection
+from ._client_pool import get_shared_client
+from ._env_auth import get_env_auth, get_env_experimental_apis
+from ._validate import require_nonempty
 
+_ISSUE_SELECTION = field_selection(api.JIRA_ISSUE_BY_KEY_QUERY, "issueByKey")
 
-def _env_experimental_apis() -> list[str]:
-    raw = os.getenv("ATLASSIAN_GQL_EXPERIMENTAL_APIS", "")
-    return [part.strip() for part in raw.split(",") if part.strip()]
 
-
-def _auth_from_env():
-    token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
-    refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
-    client_id = os.getenv("ATLASSIAN_CLIENT_ID")
-    client_secret = os.getenv("ATLASSIAN_CLIENT_SECRET")
-    email = os.getenv("ATLASSIAN_EMAIL")
-    api_token = os.getenv("ATLASSIAN_API_TOKEN")
-    cookies_json = os.getenv("ATLASSIAN_COOKIES_JSON")
-
-    if refresh_token and client_id and client_secret:
-        return OAuthRefreshTokenAuth(
-            client_id=client_id,
-            client_secret=client_secret,
-            refresh_token=refresh_token,
-        )
-    if token:
-        if client_secret and token.strip() == client_secret.strip():
-            raise ValueError(
-                "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
-                "set an OAuth access token (not the client secret)."
-            )
-        return OAuthBearerAuth(lambda: token)
-    if email and api_token:
-        return BasicApiTokenAuth(email, api_token)
-    if cookies_json:
-        try:
-            cookies = json.loads(cookies_json)
-        except json.JSONDecodeError:
-            return None
-        if isinstance(cookies, dict) and all(
-            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
-        ):
-            return CookieAuth(cookies)
-    return None
+def _issue_from_result(result, cloud_id_clean: str) -> JiraIssue:
+    if result.data is None:
+        raise SerializationError("Missing GraphQL data in response")
+    try:
+        issue = api.parse_jira_issue_by_key(result.data)
+    except SerializationError as exc:
+        if result.errors:
+            raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+        raise
+    return map_issue(cloud_id=cloud_id_clean, issue=issue)
 
 
 def get_issue_by_key(
@@ -61,12 +37,8 @@ def get_issue_by_key(
     *,
     experimental_apis: Optional[Sequence[str]] = None,
 ) -> JiraIssue:
-    cloud_id_clean = (cloud_id or "").strip()
-    if not cloud_id_clean:
-        raise ValueError("cloud_id is required")
-    key_clean = (issue_key or "").strip()
-    if not key_clean:
-        raise ValueError("issue_key is required")
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    key_clean = require_nonempty(issue_key, "issue_key")
 
     result = client.execute(
         api.JIRA_ISSUE_BY_KEY_QUERY,
@@ -74,17 +46,107 @@ def get_issue_by_key(
         operation_name="JiraIssueByKey",
         experimental_apis=list(experimental_apis) if experimental_apis else None,
     )
+    return _issue_from_result(result, cloud_id_clean)
+
+
+async def aget_issue_by_key(
+    client: AsyncGraphQLClient,
+    cloud_id: str,
+    issue_key: str,
+    *,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> JiraIssue:
+    """Async variant of `get_issue_by_key` for use with `AsyncGraphQLClient`."""
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    key_clean = require_nonempty(issue_key, "issue_key")
+
+    result = await client.execute(
+        api.JIRA_ISSUE_BY_KEY_QUERY,
+        variables={"cloudId": cloud_id_clean, "key": key_clean},
+        operation_name="JiraIssueByKey",
+        experimental_apis=list(experimental_apis) if experimental_apis else None,
+    )
+    return _issue_from_result(result, cloud_id_clean)
+
+
+async def aget_issues_by_keys(
+    client: AsyncGraphQLClient,
+    cloud_id: str,
+    issue_keys: Sequence[str],
+    *,
+    concurrency: int = 10,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> list[JiraIssue]:
+    """Fetch several issues concurrently, at most `concurrency` requests in flight."""
+    if concurrency <= 0:
+        raise ValueError("concurrency must be > 0")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(issue_key: str) -> JiraIssue:
+        async with semaphore:
+            return await aget_issue_by_key(
+                client,
+                cloud_id=cloud_id,
+                issue_key=issue_key,
+                experimental_apis=experimental_apis,
+            )
+
+    return list(await asyncio.gather(*(fetch(key) for key in issue_keys)))
+
+
+def get_issues_by_keys(
+    client: GraphQLClient,
+    cloud_id: str,
+    issue_keys: Sequence[str],
+    *,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> list[JiraIssue]:
+    """Fetch several issues in one round-trip via an aliased GraphQL document."""
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    keys_clean = [require_nonempty(issue_key, "issue_key") for issue_key in issue_keys]
+    if not keys_clean:
+        return []
+
+    var_defs = ["$cloudId: ID!"]
+    selections = []
+    variables: dict[str, str] = {"cloudId": cloud_id_clean}
+    for idx, key_clean in enumerate(keys_clean):
+        var_defs.append(f"$k{idx}: String!")
+        selections.append(
+            f"  i{idx}: issueByKey(key: $k{idx}, cloudId: $cloudId) {_ISSUE_SELECTION}"
+        )
+        variables[f"k{idx}"] = key_clean
+    query = (
+        f"query JiraIssuesByKeys({', '.join(var_defs)}) {{\n"
+        + "\n".join(selections)
+        + "\n}\n"
+    )
+
+    result = client.execute(
+        query,
+        variables=variables,
+        operation_name="JiraIssuesByKeys",
+        experimental_apis=list(experimental_apis) if experimental_apis else None,
+    )
     if result.data is None:
         raise SerializationError("Missing GraphQL data in response")
 
-    try:
-        issue = api.parse_jira_issue_by_key(result.data)
-    except SerializationError as exc:
-        if result.errors:
-            raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
-        raise
-
-    return map_issue(cloud_id=cloud_id_clean, issue=issue)
+    issues: list[JiraIssue] = []
+    for idx in range(len(keys_clean)):
+        alias = f"i{idx}"
+        node = result.data.get(alias)
+        if node is None:
+            if result.errors:
+                raise GraphQLOperationError(errors=result.errors, partial_data=result.data)
+            raise SerializationError(f"Missing data.{alias}")
+        try:
+            issue = api.JiraIssueNode.from_dict(node, f"data.{alias}")
+        except SerializationError as exc:
+            if result.errors:
+                raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+            raise
+        issues.append(map_issue(cloud_id=cloud_id_clean, issue=issue))
+    return issues
 
 
 def fetch_issue_by_key(
@@ -92,7 +154,7 @@ def fetch_issue_by_key(
     issue_key: str,
 ) -> JiraIssue:
     base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
-    auth = _auth_from_env()
+    auth = get_env_auth()
     if not base_url and (
         os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
     ):
@@ -105,11 +167,39 @@ def fetch_issue_by_key(
             "(ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON."
         )
 
-    experimental_apis = _env_experimental_apis()
-    with GraphQLClient(base_url, auth=auth, timeout_seconds=30.0) as client:
-        return get_issue_by_key(
-            client,
-            cloud_id=cloud_id,
-            issue_key=issue_key,
-            experimental_apis=experimental_apis or None,
+    experimental_apis = get_env_experimental_apis()
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0)
+    return get_issue_by_key(
+        client,
+        cloud_id=cloud_id,
+        issue_key=issue_key,
+        experimental_apis=experimental_apis or None,
+    )
+
+
+def fetch_issues_by_keys(
+    cloud_id: str,
+    issue_keys: Sequence[str],
+) -> list[JiraIssue]:
+    base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
+    auth = get_env_auth()
+    if not base_url and (
+        os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
+    ):
+        base_url = "https://api.atlassian.com"
+    if not base_url or auth is None:
+        raise ValueError(
+            "Missing ATLASSIAN_GQL_BASE_URL and/or credentials. "
+            "Set ATLASSIAN_OAUTH_ACCESS_TOKEN, or ATLASSIAN_OAUTH_REFRESH_TOKEN + "
+            "(ATLASSIAN_CLIENT_ID + ATLASSIAN_CLIENT_SECRET), or "
+            "(ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON."
         )
+
+    experimental_apis = get_env_experimental_apis()
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0)
+    return get_issues_by_keys(
+        client,
+        cloud_id=cloud_id,
+        issue_keys=issue_keys,
+        experimental_apis=experimental_apis or None,
+    )
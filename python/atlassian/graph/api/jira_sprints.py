@@ -1,57 +1,32 @@
 from __future__ import annotations
 
-import json
 import os
 from typing import Optional, Sequence
 
-from ...auth import BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
 from ...canonical_models import JiraSprint
 from ...errors import GraphQLOperationError, SerializationError
-from ...oauth_3lo import OAuthRefreshTokenAuth
+from ..async_client import AsyncGraphQLClient
 from ..client import GraphQLClient
 from ..gen import jira_sprints_api as api
 from ..mappers.jira_sprints import map_sprint
+from ._batch import field_selection
+from ._client_pool import get_shared_client
+from ._env_auth import get_env_auth, get_env_experimental_apis
+from ._validate import require_nonempty
 
+_SPRINT_SELECTION = field_selection(api.JIRA_SPRINT_BY_ID_QUERY, "sprintById")
 
-def _env_experimental_apis() -> list[str]:
-    raw = os.getenv("ATLASSIAN_GQL_EXPERIMENTAL_APIS", "")
-    return [part.strip() for part in raw.split(",") if part.strip()]
 
-
-def _auth_from_env():
-    token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
-    refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
-    client_id = os.getenv("ATLASSIAN_CLIENT_ID")
-    client_secret = os.getenv("ATLASSIAN_CLIENT_SECRET")
-    email = os.getenv("ATLASSIAN_EMAIL")
-    api_token = os.getenv("ATLASSIAN_API_TOKEN")
-    cookies_json = os.getenv("ATLASSIAN_COOKIES_JSON")
-
-    if refresh_token and client_id and client_secret:
-        return OAuthRefreshTokenAuth(
-            client_id=client_id,
-            client_secret=client_secret,
-            refresh_token=refresh_token,
-        )
-    if token:
-        if client_secret and token.strip() == client_secret.strip():
-            raise ValueError(
-                "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
-                "set an OAuth access token (not the client secret)."
-            )
-        return OAuthBearerAuth(lambda: token)
-    if email and api_token:
-        return BasicApiTokenAuth(email, api_token)
-    if cookies_json:
-        try:
-            cookies = json.loads(cookies_json)
-        except json.JSONDecodeError:
-            return None
-        if isinstance(cookies, dict) and all(
-            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
-        ):
-            return CookieAuth(cookies)
-    return None
+def _sprint_from_result(result) -> JiraSprint:
+    if result.data is None:
+        raise SerializationError("Missing GraphQL data in response")
+    try:
+        sprint = api.parse_jira_sprint_by_id(result.data)
+    except SerializationError as exc:
+        if result.errors:
+            raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+        raise
+    return map_sprint(sprint=sprint)
 
 
 def get_sprint_by_id(
@@ -60,9 +35,7 @@ def get_sprint_by_id(
     *,
     experimental_apis: Optional[Sequence[str]] = None,
 ) -> JiraSprint:
-    sprint_id_clean = (sprint_id or "").strip()
-    if not sprint_id_clean:
-        raise ValueError("sprint_id is required")
+    sprint_id_clean = require_nonempty(sprint_id, "sprint_id")
 
     result = client.execute(
         api.JIRA_SPRINT_BY_ID_QUERY,
@@ -70,24 +43,83 @@ def get_sprint_by_id(
         operation_name="JiraSprintById",
         experimental_apis=list(experimental_apis) if experimental_apis else None,
     )
+    return _sprint_from_result(result)
+
+
+async def aget_sprint_by_id(
+    client: AsyncGraphQLClient,
+    sprint_id: str,
+    *,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> JiraSprint:
+    """Async variant of `get_sprint_by_id` for use with `AsyncGraphQLClient`."""
+    sprint_id_clean = require_nonempty(sprint_id, "sprint_id")
+
+    result = await client.execute(
+        api.JIRA_SPRINT_BY_ID_QUERY,
+        variables={"id": sprint_id_clean},
+        operation_name="JiraSprintById",
+        experimental_apis=list(experimental_apis) if experimental_apis else None,
+    )
+    return _sprint_from_result(result)
+
+
+def get_sprints_by_ids(
+    client: GraphQLClient,
+    sprint_ids: Sequence[str],
+    *,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> list[JiraSprint]:
+    """Fetch several sprints in one round-trip via an aliased GraphQL document."""
+    ids_clean = [require_nonempty(sprint_id, "sprint_id") for sprint_id in sprint_ids]
+    if not ids_clean:
+        return []
+
+    var_defs = []
+    selections = []
+    variables: dict[str, str] = {}
+    for idx, sprint_id_clean in enumerate(ids_clean):
+        var_defs.append(f"$id{idx}: ID!")
+        selections.append(f"  s{idx}: sprintById(id: $id{idx}) {_SPRINT_SELECTION}")
+        variables[f"id{idx}"] = sprint_id_clean
+    query = (
+        f"query JiraSprintsByIds({', '.join(var_defs)}) {{\n"
+        + "\n".join(selections)
+        + "\n}\n"
+    )
+
+    result = client.execute(
+        query,
+        variables=variables,
+        operation_name="JiraSprintsByIds",
+        experimental_apis=list(experimental_apis) if experimental_apis else None,
+    )
     if result.data is None:
         raise SerializationError("Missing GraphQL data in response")
 
-    try:
-        sprint = api.parse_jira_sprint_by_id(result.data)
-    except SerializationError as exc:
-        if result.errors:
-            raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
-        raise
-
-    return map_sprint(sprint=sprint)
+    sprints: list[JiraSprint] = []
+    for idx in range(len(ids_clean)):
+        alias = f"s{idx}"
+        node = result.data.get(alias)
+        if node is None:
+            if result.errors:
+                raise GraphQLOperationError(errors=result.errors, partial_data=result.data)
+            raise SerializationError(f"Missing data.{alias}")
+        try:
+            sprint = api.JiraSprintNode.from_dict(node, f"data.{alias}")
+        except SerializationError as exc:
+            if result.errors:
+                raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+            raise
+        sprints.append(map_sprint(sprint=sprint))
+    return sprints
 
 
 def fetch_sprint_by_id(
     sprint_id: str,
 ) -> JiraSprint:
     base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
-    auth = _auth_from_env()
+    auth = get_env_auth()
     if not base_url and (
         os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
     ):
@@ -100,10 +132,36 @@ def fetch_sprint_by_id(
             "(ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON."
         )
 
-    experimental_apis = _env_experimental_apis()
-    with GraphQLClient(base_url, auth=auth, timeout_seconds=30.0) as client:
-        return get_sprint_by_id(
-            client,
-            sprint_id=sprint_id,
-            experimental_apis=experimental_apis or None,
+    experimental_apis = get_env_experimental_apis()
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0)
+    return get_sprint_by_id(
+        client,
+        sprint_id=sprint_id,
+        experimental_apis=experimental_apis or None,
+    )
+
+
+def fetch_sprints_by_ids(
+    sprint_ids: Sequence[str],
+) -> list[JiraSprint]:
+    base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
+    auth = get_env_auth()
+    if not base_url and (
+        os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
+    ):
+        base_url = "https://api.atlassian.com"
+    if not base_url or auth is None:
+        raise ValueError(
+            "Missing ATLASSIAN_GQL_BASE_URL and/or credentials. "
+            "Set ATLASSIAN_OAUTH_ACCESS_TOKEN, or ATLASSIAN_OAUTH_REFRESH_TOKEN + "
+            "(ATLASSIAN_CLIENT_ID + ATLASSIAN_CLIENT_SECRET), or "
+            "(ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON."
         )
+
+    experimental_apis = get_env_experimental_apis()
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0)
+    return get_sprints_by_ids(
+        client,
+        sprint_ids=sprint_ids,
+        experimental_apis=experimental_apis or None,
+    )
@@ -1,57 +1,20 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import Iterator, Optional, Sequence
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Iterator, Optional, Sequence
 
-from ...auth import BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
 from ...canonical_models import JiraWorklog
 from ...errors import GraphQLOperationError, SerializationError
-from ...oauth_3lo import OAuthRefreshTokenAuth
+from ..async_client import AsyncGraphQLClient
 from ..client import GraphQLClient
 from ..gen import jira_worklogs_api as api
 from ..mappers.jira_worklogs import map_worklog
-
-
-def _env_experimental_apis() -> list[str]:
-    raw = os.getenv("ATLASSIAN_GQL_EXPERIMENTAL_APIS", "")
-    return [part.strip() for part in raw.split(",") if part.strip()]
-
-
-def _auth_from_env():
-    token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
-    refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
-    client_id = os.getenv("ATLASSIAN_CLIENT_ID")
-    client_secret = os.getenv("ATLASSIAN_CLIENT_SECRET")
-    email = os.getenv("ATLASSIAN_EMAIL")
-    api_token = os.getenv("ATLASSIAN_API_TOKEN")
-    cookies_json = os.getenv("ATLASSIAN_COOKIES_JSON")
-
-    if refresh_token and client_id and client_secret:
-        return OAuthRefreshTokenAuth(
-            client_id=client_id,
-            client_secret=client_secret,
-            refresh_token=refresh_token,
-        )
-    if token:
-        if client_secret and token.strip() == client_secret.strip():
-            raise ValueError(
-                "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
-                "set an OAuth access token (not the client secret)."
-            )
-        return OAuthBearerAuth(lambda: token)
-    if email and api_token:
-        return BasicApiTokenAuth(email, api_token)
-    if cookies_json:
-        try:
-            cookies = json.loads(cookies_json)
-        except json.JSONDecodeError:
-            return None
-        if isinstance(cookies, dict) and all(
-            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
-        ):
-            return CookieAuth(cookies)
-    return None
+from ._client_pool import get_shared_client
+from ._env_auth import get_env_auth, get_env_experimental_apis
+from ._validate import require_nonempty
 
 
 def _next_after_from_pageinfo(
@@ -59,7 +22,7 @@ def _next_after_from_pageinfo(
     has_next_page: bool,
     end_cursor: Optional[str],
     edge_has_cursor: bool,
-    edges_cursors: Sequence[Optional[str]],
+    edges: Sequence[api.JiraWorklogEdge],
     path: str,
 ) -> Optional[str]:
     if not has_next_page:
@@ -67,9 +30,9 @@ def _next_after_from_pageinfo(
     if api.PAGEINFO_HAS_END_CURSOR and end_cursor:
         return end_cursor
     if edge_has_cursor:
-        for cursor in reversed(edges_cursors):
-            if cursor:
-                return cursor
+        for edge in reversed(edges):
+            if edge.cursor:
+                return edge.cursor
     raise SerializationError(f"Pagination cursor missing for {path}")
 
 
@@ -81,29 +44,93 @@ def iter_issue_worklogs_via_graphql(
     page_size: int = 50,
     experimental_apis: Optional[Sequence[str]] = None,
 ) -> Iterator[JiraWorklog]:
-    cloud_id_clean = (cloud_id or "").strip()
-    if not cloud_id_clean:
-        raise ValueError("cloud_id is required")
-    issue_key_clean = (issue_key or "").strip()
-    if not issue_key_clean:
-        raise ValueError("issue_key is required")
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    issue_key_clean = require_nonempty(issue_key, "issue_key")
     if page_size <= 0:
         raise ValueError("page_size must be > 0")
 
+    experimental = list(experimental_apis) if experimental_apis else None
+    _map_worklog = partial(map_worklog, issue_key=issue_key_clean)
     after: Optional[str] = None
-    seen_after: set[str] = set()
+    # Built once and mutated per page: only "after" changes between requests,
+    # and execute() serializes the payload before returning, so reuse is safe.
+    variables: dict[str, object] = {
+        "cloudId": cloud_id_clean,
+        "key": issue_key_clean,
+        "first": page_size,
+        "after": None,
+    }
+    # Bounded cycle detector: cursors effectively only repeat within a recent
+    # window, so a capped ring buffer keeps memory O(1) over long histories.
+    seen_after: deque[str] = deque(maxlen=2048)
 
     while True:
+        variables["after"] = after
         result = client.execute(
             api.JIRA_ISSUE_WORKLOGS_PAGE_QUERY,
-            variables={
-                "cloudId": cloud_id_clean,
-                "key": issue_key_clean,
-                "first": page_size,
-                "after": after,
-            },
+            variables=variables,
+            operation_name="JiraIssueWorklogsPage",
+            experimental_apis=experimental,
+        )
+        if result.data is None:
+            raise SerializationError("Missing GraphQL data in response")
+
+        try:
+            conn = api.parse_issue_worklogs_page(result.data)
+        except SerializationError as exc:
+            if result.errors:
+                raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+            raise
+
+        yield from [_map_worklog(worklog=edge.node) for edge in conn.edges]
+
+        next_after = _next_after_from_pageinfo(
+            has_next_page=conn.page_info.has_next_page,
+            end_cursor=conn.page_info.end_cursor,
+            edge_has_cursor=api.WORKLOGS_EDGE_HAS_CURSOR,
+            edges=conn.edges,
+            path=f"jira.issue[{issue_key_clean}].worklogs",
+        )
+        if next_after is None:
+            break
+        if next_after == after or next_after in seen_after:
+            raise SerializationError("Pagination cursor repeated; aborting to prevent infinite loop")
+        seen_after.append(next_after)
+        after = next_after
+
+
+async def aiter_issue_worklogs_via_graphql(
+    client: AsyncGraphQLClient,
+    *,
+    cloud_id: str,
+    issue_key: str,
+    page_size: int = 50,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> AsyncIterator[JiraWorklog]:
+    """Async variant of `iter_issue_worklogs_via_graphql`."""
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    issue_key_clean = require_nonempty(issue_key, "issue_key")
+    if page_size <= 0:
+        raise ValueError("page_size must be > 0")
+
+    experimental = list(experimental_apis) if experimental_apis else None
+    _map_worklog = partial(map_worklog, issue_key=issue_key_clean)
+    after: Optional[str] = None
+    variables: dict[str, object] = {
+        "cloudId": cloud_id_clean,
+        "key": issue_key_clean,
+        "first": page_size,
+        "after": None,
+    }
+    seen_after: deque[str] = deque(maxlen=2048)
+
+    while True:
+        variables["after"] = after
+        result = await client.execute(
+            api.JIRA_ISSUE_WORKLOGS_PAGE_QUERY,
+            variables=variables,
             operation_name="JiraIssueWorklogsPage",
-            experimental_apis=list(experimental_apis) if experimental_apis else None,
+            experimental_apis=experimental,
         )
         if result.data is None:
             raise SerializationError("Missing GraphQL data in response")
@@ -115,31 +142,109 @@ def iter_issue_worklogs_via_graphql(
                 raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
             raise
 
-        for edge in conn.edges:
-            yield map_worklog(issue_key=issue_key_clean, worklog=edge.node)
+        for worklog in [_map_worklog(worklog=edge.node) for edge in conn.edges]:
+            yield worklog
 
         next_after = _next_after_from_pageinfo(
             has_next_page=conn.page_info.has_next_page,
             end_cursor=conn.page_info.end_cursor,
             edge_has_cursor=api.WORKLOGS_EDGE_HAS_CURSOR,
-            edges_cursors=[e.cursor for e in conn.edges],
+            edges=conn.edges,
             path=f"jira.issue[{issue_key_clean}].worklogs",
         )
         if next_after is None:
             break
-        if next_after in seen_after:
+        if next_after == after or next_after in seen_after:
             raise SerializationError("Pagination cursor repeated; aborting to prevent infinite loop")
-        seen_after.add(next_after)
+        seen_after.append(next_after)
         after = next_after
 
 
+def iter_issue_worklogs_via_graphql_parallel(
+    client: GraphQLClient,
+    *,
+    cloud_id: str,
+    issue_key: str,
+    page_size: int = 50,
+    experimental_apis: Optional[Sequence[str]] = None,
+) -> Iterator[JiraWorklog]:
+    """Iterate worklogs with the next page fetched while the current one is consumed.
+
+    The worklogs connection exposes cursor paging only (no totalCount or offset
+    variables), so pages cannot be requested truly in parallel; each request
+    needs the previous page's cursor. This variant overlaps the next page's
+    network round-trip with mapping and consumption of the current page, which
+    hides most of the per-page latency for slow consumers.
+    """
+    cloud_id_clean = require_nonempty(cloud_id, "cloud_id")
+    issue_key_clean = require_nonempty(issue_key, "issue_key")
+    if page_size <= 0:
+        raise ValueError("page_size must be > 0")
+
+    experimental = list(experimental_apis) if experimental_apis else None
+    # Template shared across pages; each fetch takes a shallow copy because the
+    # prefetch thread may still be posting the previous page's variables.
+    variables_template: dict[str, object] = {
+        "cloudId": cloud_id_clean,
+        "key": issue_key_clean,
+        "first": page_size,
+        "after": None,
+    }
+
+    def fetch_page(after: Optional[str]):
+        return client.execute(
+            api.JIRA_ISSUE_WORKLOGS_PAGE_QUERY,
+            variables={**variables_template, "after": after},
+            operation_name="JiraIssueWorklogsPage",
+            experimental_apis=experimental,
+        )
+
+    _map_worklog = partial(map_worklog, issue_key=issue_key_clean)
+    after: Optional[str] = None
+    seen_after: deque[str] = deque(maxlen=2048)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch_page, None)
+        while True:
+            result = future.result()
+            if result.data is None:
+                raise SerializationError("Missing GraphQL data in response")
+
+            try:
+                conn = api.parse_issue_worklogs_page(result.data)
+            except SerializationError as exc:
+                if result.errors:
+                    raise GraphQLOperationError(errors=result.errors, partial_data=result.data) from exc
+                raise
+
+            next_after = _next_after_from_pageinfo(
+                has_next_page=conn.page_info.has_next_page,
+                end_cursor=conn.page_info.end_cursor,
+                edge_has_cursor=api.WORKLOGS_EDGE_HAS_CURSOR,
+                edges=conn.edges,
+                path=f"jira.issue[{issue_key_clean}].worklogs",
+            )
+            if next_after is not None:
+                if next_after == after or next_after in seen_after:
+                    raise SerializationError(
+                        "Pagination cursor repeated; aborting to prevent infinite loop"
+                    )
+                seen_after.append(next_after)
+                after = next_after
+                future = executor.submit(fetch_page, next_after)
+
+            yield from [_map_worklog(worklog=edge.node) for edge in conn.edges]
+
+            if next_after is None:
+                break
+
+
 def list_issue_worklogs_via_graphql(
     cloud_id: str,
     issue_key: str,
     page_size: int = 50,
 ) -> Iterator[JiraWorklog]:
     base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
-    auth = _auth_from_env()
+    auth = get_env_auth()
     if not base_url and (
         os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
     ):
@@ -152,12 +257,12 @@ def list_issue_worklogs_via_graphql(
             "(ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON."
         )
 
-    experimental_apis = _env_experimental_apis()
-    with GraphQLClient(base_url, auth=auth, timeout_seconds=30.0) as client:
-        yield from iter_issue_worklogs_via_graphql(
-            client,
-            cloud_id=cloud_id,
-            issue_key=issue_key,
-            page_size=page_size,
-            experimental_apis=experimental_apis or None,
-        )
+    experimental_apis = get_env_experimental_apis()
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0)
+    yield from iter_issue_worklogs_via_graphql(
+        client,
+        cloud_id=cloud_id,
+        issue_key=issue_key,
+        page_size=page_size,
+        experimental_apis=experimental_apis or None,
+    )
@@ -20,6 +20,11 @@ from ..models import GraphQLErrorItem, GraphQLResult, parse_error_items
 from ..retry import parse_retry_after
 from .throttle import TokenBucket
 
+try:  # optional speedup for request serialization
+    from orjson import dumps as _json_dumps
+except ImportError:
+    _json_dumps = None
+
 
 class GraphQLClient:
     def __init__(
@@ -63,11 +68,18 @@ class GraphQLClient:
         )
         self._bucket_capacity = 10000.0
         self._bucket_refill_rate = self._bucket_capacity / 60.0
+        # The bucket runs on a monotonic float clock; an injected datetime
+        # time_provider (fake clocks in tests) is adapted via timestamp().
+        bucket_clock = (
+            (lambda: time_provider().timestamp())
+            if time_provider is not None
+            else time.monotonic
+        )
         self._token_bucket = (
             TokenBucket(
                 capacity=self._bucket_capacity,
                 refill_rate_per_sec=self._bucket_refill_rate,
-                now=self._now,
+                now=bucket_clock,
                 sleeper=self._sleeper,
             )
             if self.enable_local_throttling
@@ -137,6 +149,13 @@ class GraphQLClient:
         if operation_name:
             payload["operationName"] = operation_name
 
+        # Serialize once up front; retries after 429 re-send the same bytes
+        # instead of re-encoding the (large, static) query string each time.
+        if _json_dumps is not None:
+            body = _json_dumps(payload)
+        else:
+            body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
         cost_value = 1 if estimated_cost is None else estimated_cost
         if cost_value < 0:
             cost_value = 0
@@ -152,7 +171,7 @@ class GraphQLClient:
                 response = self._client.post(
                     self._graphql_url,
                     headers=headers,
-                    json=payload,
+                    content=body,
                     cookies=cookies,
                 )
             except httpx.RequestError as exc:
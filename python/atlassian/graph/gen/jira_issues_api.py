@@ -29,25 +29,25 @@ JIRA_ISSUE_BY_KEY_QUERY = """query JiraIssueByKey(
 """
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
+        raise SerializationError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     return obj
 
 
-def _expect_optional_str(obj: Any, path: str) -> Optional[str]:
+def _expect_optional_str(obj: Any, path: str, suffix: str = "") -> Optional[str]:
     if obj is None:
         return None
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     if not obj:
-        raise SerializationError(f"Expected non-empty string at {path}")
+        raise SerializationError(f"Expected non-empty string at {path}{suffix}")
     return obj
 
 
@@ -60,8 +60,8 @@ class JiraUser:
     def from_dict(obj: Any, path: str) -> "JiraUser":
         raw = _expect_dict(obj, path)
         return JiraUser(
-            account_id=_expect_str(raw.get("accountId"), f"{path}.accountId"),
-            name=_expect_str(raw.get("name"), f"{path}.name"),
+            account_id=_expect_str(raw.get("accountId"), path, ".accountId"),
+            name=_expect_str(raw.get("name"), path, ".name"),
         )
 
 
@@ -72,7 +72,7 @@ class JiraIssueType:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "JiraIssueType":
         raw = _expect_dict(obj, path)
-        return JiraIssueType(name=_expect_str(raw.get("name"), f"{path}.name"))
+        return JiraIssueType(name=_expect_str(raw.get("name"), path, ".name"))
 
 
 @dataclass(frozen=True)
@@ -82,7 +82,7 @@ class JiraStatus:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "JiraStatus":
         raw = _expect_dict(obj, path)
-        return JiraStatus(name=_expect_str(raw.get("name"), f"{path}.name"))
+        return JiraStatus(name=_expect_str(raw.get("name"), path, ".name"))
 
 
 @dataclass(frozen=True)
@@ -94,8 +94,8 @@ class JiraProject:
     def from_dict(obj: Any, path: str) -> "JiraProject":
         raw = _expect_dict(obj, path)
         return JiraProject(
-            key=_expect_str(raw.get("key"), f"{path}.key"),
-            cloud_id=_expect_str(raw.get("cloudId"), f"{path}.cloudId"),
+            key=_expect_str(raw.get("key"), path, ".key"),
+            cloud_id=_expect_str(raw.get("cloudId"), path, ".cloudId"),
         )
 
 
@@ -154,7 +154,7 @@ class JiraIssueNode:
         assignee_raw = raw.get("assigneeField")
         reporter_raw = raw.get("reporter")
         return JiraIssueNode(
-            key=_expect_str(raw.get("key"), f"{path}.key"),
+            key=_expect_str(raw.get("key"), path, ".key"),
             issue_type=JiraIssueType.from_dict(raw.get("issueType"), f"{path}.issueType"),
             status=JiraStatus.from_dict(raw.get("status"), f"{path}.status"),
             project_field=JiraProjectField.from_dict(raw.get("projectField"), f"{path}.projectField"),
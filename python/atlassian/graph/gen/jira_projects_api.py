@@ -86,27 +86,27 @@ def build_jira_projects_page_query(project_types: Sequence[str]) -> str:
     return JIRA_PROJECTS_PAGE_QUERY_TEMPLATE.replace("__PROJECT_TYPES__", ", ".join(cleaned))
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
+        raise SerializationError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = "") -> List[Any]:
     if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {path}")
+        raise SerializationError(f"Expected list at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
+def _expect_bool(obj: Any, path: str, suffix: str = "") -> bool:
     if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {path}")
+        raise SerializationError(f"Expected boolean at {path}{suffix}")
     return obj
 
 
@@ -118,12 +118,12 @@ class PageInfo:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageInfo":
         raw = _expect_dict(obj, path)
-        has_next = _expect_bool(raw.get("hasNextPage"), f"{path}.hasNextPage")
+        has_next = _expect_bool(raw.get("hasNextPage"), path, ".hasNextPage")
         end_cursor: Optional[str] = None
         if PAGEINFO_HAS_END_CURSOR:
             value = raw.get("endCursor")
             if value is not None:
-                end_cursor = _expect_str(value, f"{path}.endCursor")
+                end_cursor = _expect_str(value, path, ".endCursor")
         return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
 
 
@@ -136,8 +136,8 @@ class OpsgenieTeamNode:
     def from_dict(obj: Any, path: str) -> "OpsgenieTeamNode":
         raw = _expect_dict(obj, path)
         return OpsgenieTeamNode(
-            id=_expect_str(raw.get("id"), f"{path}.id"),
-            name=_expect_str(raw.get("name"), f"{path}.name"),
+            id=_expect_str(raw.get("id"), path, ".id"),
+            name=_expect_str(raw.get("name"), path, ".name"),
         )
 
 
@@ -153,7 +153,7 @@ class OpsgenieTeamEdge:
         if OPSGENIE_EDGE_HAS_CURSOR:
             value = raw.get("cursor")
             if value is not None:
-                cursor = _expect_str(value, f"{path}.cursor")
+                cursor = _expect_str(value, path, ".cursor")
         node = OpsgenieTeamNode.from_dict(raw.get("node"), f"{path}.node")
         return OpsgenieTeamEdge(cursor=cursor, node=node)
 
@@ -167,7 +167,7 @@ class OpsgenieTeamsConnection:
     def from_dict(obj: Any, path: str) -> "OpsgenieTeamsConnection":
         raw = _expect_dict(obj, path)
         page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{path}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{path}.edges")
+        edges_list = _expect_list(raw.get("edges"), path, ".edges")
         edges = [
             OpsgenieTeamEdge.from_dict(item, f"{path}.edges[{idx}]")
             for idx, item in enumerate(edges_list)
@@ -189,11 +189,11 @@ class JiraProjectNode:
         if PROJECT_HAS_ID:
             value = raw.get("id")
             if value is not None:
-                project_id = _expect_str(value, f"{path}.id")
+                project_id = _expect_str(value, path, ".id")
         return JiraProjectNode(
             id=project_id,
-            key=_expect_str(raw.get("key"), f"{path}.key"),
-            name=_expect_str(raw.get("name"), f"{path}.name"),
+            key=_expect_str(raw.get("key"), path, ".key"),
+            name=_expect_str(raw.get("name"), path, ".name"),
             opsgenie_teams=OpsgenieTeamsConnection.from_dict(
                 raw.get("opsgenieTeams"), f"{path}.opsgenieTeams"
             ),
@@ -212,7 +212,7 @@ class JiraProjectEdge:
         if PROJECTS_EDGE_HAS_CURSOR:
             value = raw.get("cursor")
             if value is not None:
-                cursor = _expect_str(value, f"{path}.cursor")
+                cursor = _expect_str(value, path, ".cursor")
         node = JiraProjectNode.from_dict(raw.get("node"), f"{path}.node")
         return JiraProjectEdge(cursor=cursor, node=node)
 
@@ -226,7 +226,7 @@ class JiraProjectsConnection:
     def from_dict(obj: Any, path: str) -> "JiraProjectsConnection":
         raw = _expect_dict(obj, path)
         page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{path}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{path}.edges")
+        edges_list = _expect_list(raw.get("edges"), path, ".edges")
         edges = [
             JiraProjectEdge.from_dict(item, f"{path}.edges[{idx}]")
             for idx, item in enumerate(edges_list)
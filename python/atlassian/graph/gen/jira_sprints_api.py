@@ -21,25 +21,25 @@ JIRA_SPRINT_BY_ID_QUERY = """query JiraSprintById(
 """
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
+        raise SerializationError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     return obj
 
 
-def _expect_optional_str(obj: Any, path: str) -> Optional[str]:
+def _expect_optional_str(obj: Any, path: str, suffix: str = "") -> Optional[str]:
     if obj is None:
         return None
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     if not obj:
-        raise SerializationError(f"Expected non-empty string at {path}")
+        raise SerializationError(f"Expected non-empty string at {path}{suffix}")
     return obj
 
 
@@ -56,7 +56,7 @@ class JiraSprintNode:
     def from_dict(obj: Any, path: str) -> "JiraSprintNode":
         raw = _expect_dict(obj, path)
         return JiraSprintNode(
-            sprint_id=_expect_str(raw.get("sprintId"), f"{path}.sprintId"),
+            sprint_id=_expect_str(raw.get("sprintId"), path, ".sprintId"),
             name=_expect_optional_str(raw.get("name"), f"{path}.name"),
             state=_expect_optional_str(raw.get("state"), f"{path}.state"),
             start_date=_expect_optional_str(raw.get("startDate"), f"{path}.startDate"),
@@ -0,0 +1,40 @@
+"""String helpers for per-node mapper hot paths.
+
+`str.strip()` always allocates a new string, even when there is nothing to
+trim. These helpers pay only a boundary-character check in the common
+already-clean case, and intern enum-like values so downstream comparisons and
+set membership are pointer-equal.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Optional
+
+
+def clean_str(value: Optional[str]) -> str:
+    """Return `value` trimmed, or "" for None/empty; skips strip() when clean."""
+    if not value:
+        return ""
+    if not value[0].isspace() and not value[-1].isspace():
+        return value
+    return value.strip()
+
+
+def clean_optional_str(value) -> Optional[str]:
+    """Return `value` trimmed, or None when nothing remains; skips strip() when clean."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = str(value)
+    if not value:
+        return None
+    if not value[0].isspace() and not value[-1].isspace():
+        return value
+    cleaned = value.strip()
+    return cleaned or None
+
+
+def intern_enum(value: str) -> str:
+    """Intern enum-like values ("SERVICE", "ACTIVE", ...) for pointer-equal compares."""
+    return sys.intern(value)
@@ -0,0 +1,20 @@
+"""Required-field validation shared by the mapper hot paths.
+
+Mappers run once per node over large paginated result sets, so the validator
+strips at most once and uses an exact `type()` check instead of `isinstance`
+to keep the common already-valid case cheap; the error message is only
+formatted on the cold failure branch.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+def _require_non_empty(value: Optional[str], path: str, suffix: str = "") -> str:
+    # `suffix` lets callers with a dynamic path prefix (e.g. _map_user) skip
+    # concatenating the full path on the success branch.
+    stripped = value.strip() if type(value) is str else None
+    if not stripped:
+        raise ValueError(f"{path}{suffix} is required")
+    return stripped
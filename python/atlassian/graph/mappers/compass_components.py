@@ -1,62 +1,60 @@
-from typing import Any, List, Optional
+from typing import Any
 
 from ...canonical_models import (
     CompassComponent,
     CompassRelationship,
     CompassScorecardScore,
 )
-
+from ._fast_strings import clean_optional_str as _clean_optional_str
+from ._fast_strings import clean_str, intern_enum
+
+# Parser node types declare every selected field (optional fields are None, not
+# absent), so the mappers read required/optional fields with direct attribute
+# access. getattr guards remain only for polymorphic shapes: flat legacy fields
+# (owner_team_id, start_component_id, scorecard_id, ...) versus nested objects
+# (owner_team, start_node, scorecard).
 CompassComponentNode = Any
 
 
-def _clean_optional_str(value: Optional[str]) -> Optional[str]:
-    if value is None:
-        return None
-    cleaned = str(value).strip()
-    return cleaned or None
-
-
 def map_compass_component(
     *, cloud_id: str, component: CompassComponentNode
 ) -> CompassComponent:
-    cloud_id_clean = (cloud_id or "").strip()
+    cloud_id_clean = clean_str(cloud_id)
     if not cloud_id_clean:
         raise ValueError("cloud_id is required")
 
-    component_id = (getattr(component, "id", "") or "").strip()
-    if not component_id:
-        raise ValueError("component.id is required")
-
-    component_name = (getattr(component, "name", "") or "").strip()
-    if not component_name:
-        raise ValueError("component.name is required")
-
-    component_type = (getattr(component, "type", "") or "").strip()
-    if not component_type:
-        raise ValueError("component.type is required")
-
-    description = _clean_optional_str(getattr(component, "description", None))
+    component_id = clean_str(component.id)
+    component_name = clean_str(component.name)
+    component_type = clean_str(component.type)
+    # One fused truth test on the happy path; the tuple walk runs only on
+    # failure to raise the message for the first missing field.
+    if not (component_id and component_name and component_type):
+        for value, message in (
+            (component_id, "component.id is required"),
+            (component_name, "component.name is required"),
+            (component_type, "component.type is required"),
+        ):
+            if not value:
+                raise ValueError(message)
+    component_type = intern_enum(component_type)
+
+    description = _clean_optional_str(component.description)
 
     owner_team_id = _clean_optional_str(getattr(component, "owner_team_id", None))
     owner_team_name = _clean_optional_str(getattr(component, "owner_team_name", None))
     owner_team = getattr(component, "owner_team", None)
     if owner_team is not None:
-        owner_team_id = (
-            _clean_optional_str(getattr(owner_team, "id", None)) or owner_team_id
-        )
-        owner_team_name = (
-            _clean_optional_str(getattr(owner_team, "name", None)) or owner_team_name
-        )
-
-    labels: List[str] = []
-    labels_raw = getattr(component, "labels", None) or []
-    for label in labels_raw:
-        label_clean = (label or "").strip()
-        if label_clean:
-            labels.append(label_clean)
-
-    created_at = _clean_optional_str(getattr(component, "created_at", None))
-    updated_at = _clean_optional_str(getattr(component, "updated_at", None))
+        owner_team_id = _clean_optional_str(owner_team.id) or owner_team_id
+        owner_team_name = _clean_optional_str(owner_team.name) or owner_team_name
+
+    labels = tuple(
+        label_clean
+        for label in component.labels or ()
+        if (label_clean := clean_str(label))
+    )
+
+    created_at = _clean_optional_str(component.created_at)
+    updated_at = _clean_optional_str(component.updated_at)
 
     return CompassComponent(
         id=component_id,
@@ -76,13 +74,14 @@ def map_compass_relationship(relationship: Any) -> CompassRelationship:
     if relationship is None:
         raise ValueError("relationship is required")
 
-    relationship_id = (getattr(relationship, "id", "") or "").strip()
+    relationship_id = clean_str(relationship.id)
     if not relationship_id:
         raise ValueError("relationship.id is required")
 
-    relationship_type = (getattr(relationship, "type", "") or "").strip()
+    relationship_type = clean_str(relationship.type)
     if not relationship_type:
         raise ValueError("relationship.type is required")
+    relationship_type = intern_enum(relationship_type)
 
     start_component_id = _clean_optional_str(
         getattr(relationship, "start_component_id", None)
@@ -93,15 +92,11 @@ def map_compass_relationship(relationship: Any) -> CompassRelationship:
 
     start_node = getattr(relationship, "start_node", None)
     if start_node is not None:
-        start_component_id = (
-            _clean_optional_str(getattr(start_node, "id", None)) or start_component_id
-        )
+        start_component_id = _clean_optional_str(start_node.id) or start_component_id
 
     end_node = getattr(relationship, "end_node", None)
     if end_node is not None:
-        end_component_id = (
-            _clean_optional_str(getattr(end_node, "id", None)) or end_component_id
-        )
+        end_component_id = _clean_optional_str(end_node.id) or end_component_id
 
     if not start_component_id:
         raise ValueError("relationship.start_component_id is required")
@@ -119,41 +114,37 @@ def map_compass_relationship(relationship: Any) -> CompassRelationship:
 def map_compass_scorecard_score(
     component_id: str, score_data: Any
 ) -> CompassScorecardScore:
-    component_id_clean = (component_id or "").strip()
+    component_id_clean = clean_str(component_id)
     if not component_id_clean:
         raise ValueError("component_id is required")
     if score_data is None:
         raise ValueError("score_data is required")
 
-    score_value = getattr(score_data, "score", None)
-    if (
-        score_value is None
-        or not isinstance(score_value, (int, float))
-        or isinstance(score_value, bool)
-    ):
+    score_value = score_data.score
+    # Exact type check: the JSON parser only ever produces int/float/None here,
+    # and it also rejects bool without a separate isinstance probe.
+    score_type = type(score_value)
+    if score_type is not int and score_type is not float:
         raise ValueError("score_data.score is required")
 
     scorecard_id = _clean_optional_str(getattr(score_data, "scorecard_id", None))
     scorecard_name = _clean_optional_str(getattr(score_data, "scorecard_name", None))
     scorecard = getattr(score_data, "scorecard", None)
     if scorecard is not None:
-        scorecard_id = (
-            _clean_optional_str(getattr(scorecard, "id", None)) or scorecard_id
-        )
-        scorecard_name = (
-            _clean_optional_str(getattr(scorecard, "name", None)) or scorecard_name
-        )
+        scorecard_id = _clean_optional_str(scorecard.id) or scorecard_id
+        scorecard_name = _clean_optional_str(scorecard.name) or scorecard_name
 
     if not scorecard_id:
         raise ValueError("score_data.scorecard_id is required")
 
-    max_score = getattr(score_data, "max_score", None)
+    max_score = score_data.max_score
     if max_score is not None:
-        if not isinstance(max_score, (int, float)) or isinstance(max_score, bool):
+        max_score_type = type(max_score)
+        if max_score_type is not int and max_score_type is not float:
             raise ValueError("score_data.max_score must be a number")
         max_score = float(max_score)
 
-    evaluated_at = _clean_optional_str(getattr(score_data, "evaluated_at", None))
+    evaluated_at = _clean_optional_str(score_data.evaluated_at)
 
     return CompassScorecardScore(
         component_id=component_id_clean,
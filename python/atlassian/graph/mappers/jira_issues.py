@@ -4,19 +4,14 @@ from typing import Optional
 
 from ...canonical_models import JiraIssue, JiraUser
 from ..gen import jira_issues_api as api
-
-
-def _require_non_empty(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{path} is required")
-    return value.strip()
+from ._validate import _require_non_empty
 
 
 def _map_user(user: Optional[api.JiraUser], path: str) -> Optional[JiraUser]:
     if user is None:
         return None
-    account_id = _require_non_empty(user.account_id, f"{path}.accountId")
-    display_name = _require_non_empty(user.name, f"{path}.name")
+    account_id = _require_non_empty(user.account_id, path, ".accountId")
+    display_name = _require_non_empty(user.name, path, ".name")
     return JiraUser(account_id=account_id, display_name=display_name, email=None)
 
 
@@ -27,41 +22,54 @@ def map_issue(*, cloud_id: str, issue: api.JiraIssueNode) -> JiraIssue:
     if issue is None:
         raise ValueError("issue is required")
 
-    issue_key = _require_non_empty(issue.key, "issue.key")
-    issue_type = _require_non_empty(issue.issue_type.name, "issue.issueType.name")
-    status = _require_non_empty(issue.status.name, "issue.status.name")
-
+    # Hot path: this runs once per issue over multi-thousand-issue syncs.
+    # The required fields are gathered into one flat tuple and validated in a
+    # single comprehension, and JiraIssue is built positionally (field order
+    # mirrors the canonical model) to skip the kwargs dict.
+    require = _require_non_empty
     project = issue.project_field.project
-    project_key = _require_non_empty(project.key, "issue.projectField.project.key")
-    project_cloud_id = _require_non_empty(project.cloud_id, "issue.projectField.project.cloudId")
+    fields = (
+        (issue.key, "issue.key"),
+        (issue.issue_type.name, "issue.issueType.name"),
+        (issue.status.name, "issue.status.name"),
+        (project.key, "issue.projectField.project.key"),
+        (project.cloud_id, "issue.projectField.project.cloudId"),
+        (issue.created_field.date_time, "issue.createdField.dateTime"),
+        (issue.updated_field.date_time, "issue.updatedField.dateTime"),
+    )
+    (
+        issue_key,
+        issue_type,
+        status,
+        project_key,
+        project_cloud_id,
+        created_at,
+        updated_at,
+    ) = tuple(require(value, path) for value, path in fields)
     if project_cloud_id != cloud_id_clean:
         raise ValueError("issue.projectField.project.cloudId does not match cloud_id")
 
-    created_at = _require_non_empty(issue.created_field.date_time, "issue.createdField.dateTime")
-    updated_at = _require_non_empty(issue.updated_field.date_time, "issue.updatedField.dateTime")
-
     resolved_at = None
-    if issue.resolution_date_field is not None and issue.resolution_date_field.date_time:
-        resolved_at = issue.resolution_date_field.date_time.strip()
+    resolution_field = issue.resolution_date_field
+    if resolution_field is not None and resolution_field.date_time:
+        resolved_at = resolution_field.date_time.strip()
 
-    assignee_user = (
-        issue.assignee_field.user if issue.assignee_field is not None else None
-    )
-    reporter_user = issue.reporter
+    assignee_field = issue.assignee_field
+    assignee_user = assignee_field.user if assignee_field is not None else None
 
     return JiraIssue(
-        cloud_id=project_cloud_id,
-        key=issue_key,
-        project_key=project_key,
-        issue_type=issue_type,
-        status=status,
-        created_at=created_at,
-        updated_at=updated_at,
-        resolved_at=resolved_at,
-        assignee=_map_user(assignee_user, "issue.assigneeField.user"),
-        reporter=_map_user(reporter_user, "issue.reporter"),
-        labels=[],
-        components=[],
-        story_points=None,
-        sprint_ids=[],
+        project_cloud_id,
+        issue_key,
+        project_key,
+        issue_type,
+        status,
+        created_at,
+        updated_at,
+        resolved_at,
+        _map_user(assignee_user, "issue.assigneeField.user"),
+        _map_user(issue.reporter, "issue.reporter"),
+        (),
+        (),
+        None,
+        (),
     )
@@ -45,5 +45,5 @@ def map_project_with_opsgenie_teams(
 
     return CanonicalProjectWithOpsgenieTeams(
         project=JiraProject(cloud_id=cloud_id_clean, key=project_key, name=project_name),
-        opsgenie_teams=teams,
+        opsgenie_teams=tuple(teams),
     )
@@ -1,15 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
-
 from ...canonical_models import JiraSprint
 from ..gen import jira_sprints_api as api
-
-
-def _require_non_empty(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{path} is required")
-    return value.strip()
+from ._validate import _require_non_empty
 
 
 def map_sprint(*, sprint: api.JiraSprintNode) -> JiraSprint:
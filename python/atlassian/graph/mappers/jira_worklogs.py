@@ -4,19 +4,14 @@ from typing import Optional
 
 from ...canonical_models import JiraUser, JiraWorklog
 from ..gen import jira_worklogs_api as api
-
-
-def _require_non_empty(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{path} is required")
-    return value.strip()
+from ._validate import _require_non_empty
 
 
 def _map_user(user: Optional[api.JiraUser], path: str) -> Optional[JiraUser]:
     if user is None:
         return None
-    account_id = _require_non_empty(user.account_id, f"{path}.accountId")
-    display_name = _require_non_empty(user.name, f"{path}.name")
+    account_id = _require_non_empty(user.account_id, path, ".accountId")
+    display_name = _require_non_empty(user.name, path, ".name")
     return JiraUser(account_id=account_id, display_name=display_name, email=None)
 
 
@@ -35,7 +30,8 @@ def map_worklog(*, issue_key: str, worklog: api.JiraWorklogNode) -> JiraWorklog:
     time_spent = worklog.time_spent.time_in_seconds
     if time_spent is None:
         raise ValueError("worklog.timeSpent.timeInSeconds is required")
-    if not isinstance(time_spent, int) or isinstance(time_spent, bool) or time_spent < 0:
+    # Exact type check: rejects bool in the same comparison.
+    if type(time_spent) is not int or time_spent < 0:
         raise ValueError("worklog.timeSpent.timeInSeconds must be >= 0")
 
     return JiraWorklog(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import operator
+import sys
 from typing import Any, Iterable, Optional
 
 from ...canonical_models import (
@@ -14,33 +16,41 @@ from ..gen.teamwork_graph_api import (
     GraphStoreCypherQueryV2Node,
     GraphStoreCypherQueryV2NodeList,
 )
-
-
-def _require_non_empty(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{path} is required")
-    return value.strip()
+from ._validate import _require_non_empty
 
 
 def _optional_str(value: Any) -> Optional[str]:
-    return value.strip() if isinstance(value, str) and value.strip() else None
+    stripped = value.strip() if type(value) is str else ""
+    return stripped or None
 
 
 def _optional_int(value: Any) -> Optional[int]:
-    if isinstance(value, bool):
-        return None
-    return value if isinstance(value, int) else None
+    # Exact type check: bools are ints but are not valid counts.
+    return value if type(value) is int else None
+
+
+# Required attributes are pulled in one C-level attrgetter call; the optional
+# ones below keep getattr defaults because absence is legal for them.
+_team_required = operator.attrgetter("id", "display_name", "state")
+_TEAM_ATTR_PATHS = {
+    "id": "team.id",
+    "display_name": "team.displayName",
+    "state": "team.state",
+}
 
 
 def map_team(team: Any) -> AtlassianTeam:
     if team is None:
         raise ValueError("team is required")
 
-    team_id = _require_non_empty(getattr(team, "id", None), "team.id")
-    display_name = _require_non_empty(
-        getattr(team, "display_name", None), "team.displayName"
-    )
-    state = _require_non_empty(getattr(team, "state", None), "team.state")
+    try:
+        raw_id, raw_display_name, raw_state = _team_required(team)
+    except AttributeError as exc:
+        path = _TEAM_ATTR_PATHS.get(exc.name, "team attribute")
+        raise ValueError(f"{path} is required") from exc
+    team_id = _require_non_empty(raw_id, "team.id")
+    display_name = _require_non_empty(raw_display_name, "team.displayName")
+    state = _require_non_empty(raw_state, "team.state")
 
     return AtlassianTeam(
         id=team_id,
@@ -57,9 +67,11 @@ def map_team_member(*, team_id: str, member: Any) -> AtlassianTeamMember:
         raise ValueError("member is required")
 
     canonical_team_id = _require_non_empty(team_id, "teamId")
-    account_id = _require_non_empty(
-        getattr(member, "account_id", None), "member.accountId"
-    )
+    try:
+        raw_account_id = member.account_id
+    except AttributeError:
+        raw_account_id = None
+    account_id = _require_non_empty(raw_account_id, "member.accountId")
 
     return AtlassianTeamMember(
         team_id=canonical_team_id,
@@ -71,15 +83,18 @@ def map_team_member(*, team_id: str, member: Any) -> AtlassianTeamMember:
 
 TEAM_ARI_PREFIX = "ari:cloud:identity::team/"
 USER_ARI_PREFIX = "ari:cloud:identity::user/"
-TEAM_TYPENAMES = {"TeamV2"}
-USER_TYPENAMES = {"AtlassianAccountUser"}
-PROJECT_TYPENAMES = {"JiraProject", "TownsquareProject"}
-
+# Single-element typename sets collapse to interned constants so the per-node
+# checks are pointer compares; PROJECT keeps a (frozen) set as it has two.
+_TEAM_TYPENAME = sys.intern("TeamV2")
+_USER_TYPENAME = sys.intern("AtlassianAccountUser")
+PROJECT_TYPENAMES = frozenset({"JiraProject", "TownsquareProject"})
 
-def _require_non_empty_str(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"{path} is required")
-    return value.strip()
+# Candidate column keys, pre-normalized, so key matching is one O(1) set
+# membership per column instead of a linear scan over the candidates.
+_TEAM_KEYS = frozenset({"team", "teamid", "team_id"})
+_PROJECT_KEYS = frozenset({"project", "projectid", "project_id"})
+_USER_KEYS = frozenset({"user", "userid", "user_id", "member"})
+_RELATED_USER_KEYS = frozenset({"manager", "report", "directreport", "direct_report"})
 
 
 def _iter_nodes_from_value(value: Any) -> Iterable[GraphStoreCypherQueryV2AriNode]:
@@ -89,60 +104,74 @@ def _iter_nodes_from_value(value: Any) -> Iterable[GraphStoreCypherQueryV2AriNod
         yield from value.nodes
 
 
-def _iter_nodes_from_columns(
-    columns: Iterable[GraphStoreCypherQueryV2Column],
-) -> Iterable[GraphStoreCypherQueryV2AriNode]:
-    for column in columns:
-        if column.value is None:
-            continue
-        yield from _iter_nodes_from_value(column.value)
-
-
-def _column_key_matches(
-    column: GraphStoreCypherQueryV2Column, keys: Iterable[str]
-) -> bool:
-    key = column.key.strip().lower()
-    return any(key == candidate for candidate in keys)
-
-
-def _select_node_by_key(
-    columns: Iterable[GraphStoreCypherQueryV2Column],
-    keys: Iterable[str],
-    predicate,
-) -> Optional[GraphStoreCypherQueryV2AriNode]:
-    candidates = []
-    for column in columns:
-        if not _column_key_matches(column, keys):
-            continue
-        if column.value is None:
-            continue
-        for node in _iter_nodes_from_value(column.value):
-            if predicate(node):
-                return node
-            candidates.append(node)
-    if candidates:
-        return candidates[0]
-    return None
-
-
-def _select_node(
-    columns: Iterable[GraphStoreCypherQueryV2Column],
-    predicate,
-) -> Optional[GraphStoreCypherQueryV2AriNode]:
-    for node in _iter_nodes_from_columns(columns):
-        if predicate(node):
-            return node
-    return None
+# Positions of the role flags inside an index entry tuple.
+_ROLE_TEAM = 2
+_ROLE_USER = 3
+_ROLE_PROJECT = 4
+
+
+class _ColumnIndex:
+    """One-pass index over a Cypher row's columns.
+
+    Columns used to be re-traversed (and nodes re-classified) once per
+    lookup; this walks them a single time, classifying each node once and
+    keeping traversal order so key-preference semantics are unchanged.
+    """
+
+    __slots__ = ("entries", "teams", "users", "projects", "nodes")
+
+    def __init__(self, columns: Iterable[GraphStoreCypherQueryV2Column]):
+        entries: list[tuple] = []
+        teams: list[GraphStoreCypherQueryV2AriNode] = []
+        users: list[GraphStoreCypherQueryV2AriNode] = []
+        projects: list[GraphStoreCypherQueryV2AriNode] = []
+        nodes: list[GraphStoreCypherQueryV2AriNode] = []
+        for column in columns:
+            if column.value is None:
+                continue
+            norm_key = column.key.strip().lower()
+            for node in _iter_nodes_from_value(column.value):
+                is_team = _is_team_node(node)
+                is_user = _is_user_node(node)
+                is_project = _is_project_node(node)
+                entries.append((norm_key, node, is_team, is_user, is_project))
+                nodes.append(node)
+                if is_team:
+                    teams.append(node)
+                if is_user:
+                    users.append(node)
+                if is_project:
+                    projects.append(node)
+        self.entries = entries
+        self.teams = teams
+        self.users = users
+        self.projects = projects
+        self.nodes = nodes
+
+    def select_by_key(
+        self, keys: frozenset[str], role: int
+    ) -> Optional[GraphStoreCypherQueryV2AriNode]:
+        """First node under a matching key with the given role, else the
+        first node under any matching key, else None."""
+        first_candidate = None
+        for entry in self.entries:
+            if entry[0] not in keys:
+                continue
+            if entry[role]:
+                return entry[1]
+            if first_candidate is None:
+                first_candidate = entry[1]
+        return first_candidate
 
 
 def _is_team_node(node: GraphStoreCypherQueryV2AriNode) -> bool:
-    if node.data and node.data.typename in TEAM_TYPENAMES:
+    if node.data and node.data.typename == _TEAM_TYPENAME:
         return True
     return node.id.startswith(TEAM_ARI_PREFIX)
 
 
 def _is_user_node(node: GraphStoreCypherQueryV2AriNode) -> bool:
-    if node.data and node.data.typename in USER_TYPENAMES:
+    if node.data and node.data.typename == _USER_TYPENAME:
         return True
     return node.id.startswith(USER_ARI_PREFIX)
 
@@ -156,17 +185,14 @@ def map_teamwork_project(node: GraphStoreCypherQueryV2Node) -> TeamworkProject:
     if node is None:
         raise ValueError("node is required")
 
-    team_node = _select_node_by_key(
-        node.columns, ("team", "teamid", "team_id"), _is_team_node
-    )
+    index = _ColumnIndex(node.columns)
+    team_node = index.select_by_key(_TEAM_KEYS, _ROLE_TEAM)
     if team_node is None:
-        team_node = _select_node(node.columns, _is_team_node)
+        team_node = index.teams[0] if index.teams else None
 
-    project_node = _select_node_by_key(
-        node.columns, ("project", "projectid", "project_id"), _is_project_node
-    )
+    project_node = index.select_by_key(_PROJECT_KEYS, _ROLE_PROJECT)
     if project_node is None:
-        project_node = _select_node(node.columns, _is_project_node)
+        project_node = index.projects[0] if index.projects else None
 
     if team_node is None or project_node is None:
         raise ValueError("teamwork project mapping requires team and project nodes")
@@ -178,8 +204,8 @@ def map_teamwork_project(node: GraphStoreCypherQueryV2Node) -> TeamworkProject:
         project_key = project_node.data.key
 
     return TeamworkProject(
-        team_id=_require_non_empty_str(team_node.id, "team.id"),
-        project_id=_require_non_empty_str(project_node.id, "project.id"),
+        team_id=_require_non_empty(team_node.id, "team.id"),
+        project_id=_require_non_empty(project_node.id, "project.id"),
         project_key=_optional_str(project_key),
         project_name=_optional_str(project_name),
     )
@@ -199,38 +225,32 @@ def map_teamwork_user_relation(
 
     relation_type = relation_type.strip()
 
+    index = _ColumnIndex(node.columns)
+
     subject_node = None
     if subject_user_id:
         subject_user_id = subject_user_id.strip()
-        for candidate in _iter_nodes_from_columns(node.columns):
+        for candidate in index.nodes:
             if candidate.id == subject_user_id:
                 subject_node = candidate
                 break
 
     if subject_node is None:
-        subject_node = _select_node_by_key(
-            node.columns, ("user", "userid", "user_id", "member"), _is_user_node
-        )
+        subject_node = index.select_by_key(_USER_KEYS, _ROLE_USER)
     if subject_node is None:
-        subject_node = _select_node(node.columns, _is_user_node)
+        subject_node = index.users[0] if index.users else None
 
     if subject_node is None:
         raise ValueError("teamwork user relation requires a subject user")
 
-    team_node = _select_node_by_key(
-        node.columns, ("team", "teamid", "team_id"), _is_team_node
-    )
+    team_node = index.select_by_key(_TEAM_KEYS, _ROLE_TEAM)
     if team_node is None:
-        team_node = _select_node(node.columns, _is_team_node)
+        team_node = index.teams[0] if index.teams else None
 
-    related_user_node = _select_node_by_key(
-        node.columns,
-        ("manager", "report", "directreport", "direct_report"),
-        _is_user_node,
-    )
+    related_user_node = index.select_by_key(_RELATED_USER_KEYS, _ROLE_USER)
     if related_user_node is None:
-        for candidate in _iter_nodes_from_columns(node.columns):
-            if _is_user_node(candidate) and candidate.id != subject_node.id:
+        for candidate in index.users:
+            if candidate.id != subject_node.id:
                 related_user_node = candidate
                 break
 
@@ -238,9 +258,9 @@ def map_teamwork_user_relation(
         if team_node is None:
             raise ValueError("TEAM_MEMBER relation requires team node")
         return TeamworkUserRelation(
-            subject_user_id=_require_non_empty_str(subject_node.id, "user.id"),
+            subject_user_id=_require_non_empty(subject_node.id, "user.id"),
             relation_type=relation_type,
-            team_id=_require_non_empty_str(team_node.id, "team.id"),
+            team_id=_require_non_empty(team_node.id, "team.id"),
             related_user_id=None,
         )
 
@@ -248,8 +268,8 @@ def map_teamwork_user_relation(
         raise ValueError("manager relation requires a related user node")
 
     return TeamworkUserRelation(
-        subject_user_id=_require_non_empty_str(subject_node.id, "user.id"),
+        subject_user_id=_require_non_empty(subject_node.id, "user.id"),
         relation_type=relation_type,
         team_id=None,
-        related_user_id=_require_non_empty_str(related_user_node.id, "related_user.id"),
+        related_user_id=_require_non_empty(related_user_node.id, "related_user.id"),
     )
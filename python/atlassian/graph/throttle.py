@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import threading
-from datetime import datetime, timedelta
+import time
 from typing import Callable
 
 from ..errors import LocalRateLimitError
 
 
 class TokenBucket:
+    """Token bucket keyed to a monotonic float clock.
+
+    The clock returns seconds as a float (``time.monotonic`` by default) so the
+    lock-held refill path is plain float arithmetic with no datetime/timedelta
+    allocations; tests inject a float-returning fake clock instead.
+    """
+
     def __init__(
         self,
         capacity: float,
         refill_rate_per_sec: float,
-        now: Callable[[], datetime],
-        sleeper: Callable[[float], None],
+        now: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
     ):
         if capacity <= 0:
             raise ValueError("capacity must be positive")
@@ -27,8 +34,8 @@ class TokenBucket:
         self._lock = threading.Lock()
         self._last_refill = now()
 
-    def _refill_locked(self, now: datetime) -> None:
-        elapsed = (now - self._last_refill).total_seconds()
+    def _refill_locked(self, now: float) -> None:
+        elapsed = now - self._last_refill
         if elapsed > 0:
             self._tokens = min(
                 self.capacity,
@@ -43,12 +50,17 @@ class TokenBucket:
         """
         if cost <= 0:
             return 0.0
-        deadline = self._now() + timedelta(seconds=max_wait_seconds)
         waited = 0.0
         last_wait_needed = 0.0
+        deadline = None
 
+        # The lock stays: _tokens is read-modify-write shared state, so an
+        # unlocked fast path could double-spend the budget. The per-pass cost
+        # is kept to one clock read and plain float math instead.
         while True:
             now = self._now()
+            if deadline is None:
+                deadline = now + max_wait_seconds
             with self._lock:
                 self._refill_locked(now)
                 if self._tokens >= cost:
@@ -57,7 +69,7 @@ class TokenBucket:
                 needed = cost - self._tokens
                 last_wait_needed = needed / self.refill_rate_per_sec
 
-            remaining = (deadline - self._now()).total_seconds()
+            remaining = deadline - now
             if remaining <= 0 or last_wait_needed <= 0:
                 raise LocalRateLimitError(cost, last_wait_needed, max_wait_seconds)
             sleep_for = min(last_wait_needed, remaining)
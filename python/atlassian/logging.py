@@ -8,12 +8,16 @@ def get_logger(logger: logging.Logger | None = None) -> logging.Logger:
     return logger if logger is not None else logging.getLogger("atlassian")
 
 
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie"})
+
+
 def sanitize_headers(headers: Mapping[str, str]) -> Dict[str, str]:
-    sensitive = {"authorization", "cookie"}
-    sanitized: Dict[str, str] = {}
-    for key, value in headers.items():
-        if key.lower() in sensitive:
-            sanitized[key] = "<redacted>"
-        else:
-            sanitized[key] = value
-    return sanitized
+    # Lowercase each key once; when nothing is sensitive (unauthenticated
+    # requests) a plain copy avoids the per-key redaction branch.
+    lowered = [(key, key.lower()) for key in headers]
+    if not any(low in _SENSITIVE_HEADERS for _, low in lowered):
+        return dict(headers)
+    return {
+        key: "<redacted>" if low in _SENSITIVE_HEADERS else headers[key]
+        for key, low in lowered
+    }
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphQLErrorItem:
     message: str
     path: Optional[List[Any]] = None
@@ -12,7 +12,7 @@ class GraphQLErrorItem:
     locations: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphQLResult:
     data: Optional[Dict[str, Any]]
     errors: Optional[List[GraphQLErrorItem]]
@@ -20,23 +20,24 @@ class GraphQLResult:
 
 
 def parse_error_items(raw_errors: Any) -> Optional[List[GraphQLErrorItem]]:
-    if raw_errors is None:
-        return None
-    items: List[GraphQLErrorItem] = []
     if not isinstance(raw_errors, list):
         return None
+    items: List[GraphQLErrorItem] = []
+    append = items.append
     for err in raw_errors:
-        if not isinstance(err, dict):
+        # Exact type checks: JSON decoding only ever yields plain dict/str,
+        # and type() is cheaper than isinstance on this per-error path.
+        if type(err) is not dict:
             continue
         message = err.get("message")
-        if not isinstance(message, str):
+        if type(message) is not str:
             continue
-        items.append(
+        append(
             GraphQLErrorItem(
-                message=message,
-                path=err.get("path"),
-                extensions=err.get("extensions"),
-                locations=err.get("locations"),
+                message,
+                err.get("path"),
+                err.get("extensions"),
+                err.get("locations"),
             )
         )
     return items
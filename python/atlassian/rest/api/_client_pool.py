@@ -0,0 +1,52 @@
+"""Shared `JiraRestClient` instances for the env-driven one-shot helpers.
+
+Building a fresh client per call pays the TCP+TLS handshake on every request.
+Clients are pooled per (base_url, auth, timeout, retries) so the underlying
+httpx connection pool is retained between calls; everything is closed at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Dict, Tuple
+
+from ..client import JiraRestClient
+
+_pool_lock = threading.Lock()
+_pool: Dict[Tuple[str, int, float, int], JiraRestClient] = {}
+
+
+def _close_pool() -> None:
+    with _pool_lock:
+        for client in _pool.values():
+            client.close()
+        _pool.clear()
+
+
+atexit.register(_close_pool)
+
+
+def get_shared_client(
+    base_url: str,
+    auth,
+    timeout_seconds: float = 15.0,
+    max_retries_429: int = 2,
+) -> JiraRestClient:
+    """Return a pooled client for the given endpoint/auth, creating it on first use.
+
+    Auth objects are cached per env snapshot (see `rest.env`), so keying on
+    `id(auth)` keeps one client per distinct credential set.
+    """
+    key = (base_url, id(auth), timeout_seconds, max_retries_429)
+    with _pool_lock:
+        client = _pool.get(key)
+        if client is None:
+            client = JiraRestClient(
+                base_url,
+                auth=auth,
+                timeout_seconds=timeout_seconds,
+                max_retries_429=max_retries_429,
+            )
+            _pool[key] = client
+        return client
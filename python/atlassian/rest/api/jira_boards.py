@@ -6,8 +6,8 @@ from ...canonical_models import JiraBoard
 from ...errors import SerializationError
 from ..client import JiraRestClient
 from ..env import auth_from_env, jira_rest_base_url_from_env
-from ..gen import jira_agile_api as api
-from ..mappers.jira_boards import map_rest_board
+from ..mappers.jira_boards import map_rest_board_from_dict, read_board_page
+from ._client_pool import get_shared_client
 
 
 def iter_boards_via_rest(
@@ -18,27 +18,28 @@ def iter_boards_via_rest(
         raise ValueError("page_size must be > 0")
 
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
+        if start_at <= prev_start_at:
             raise SerializationError(
-                "Pagination startAt repeated; aborting to prevent infinite loop"
+                "Pagination startAt did not advance; aborting to prevent infinite loop"
             )
-        seen_start_at.add(start_at)
+        prev_start_at = start_at
 
         payload = client.get_json(
             "/rest/agile/1.0/board",
             params={"startAt": start_at, "maxResults": page_size},
         )
-        page = api.BoardPage.from_dict(payload, "data")
-        values = page.values
+        values, is_last = read_board_page(payload)
 
-        for item in values:
-            yield map_rest_board(board=item)
+        yield from [
+            map_rest_board_from_dict(item, f"data.values[{idx}]")
+            for idx, item in enumerate(values)
+        ]
 
-        has_is_last = isinstance(page.is_last, bool)
-        if has_is_last and page.is_last:
+        has_is_last = is_last is not None
+        if has_is_last and is_last:
             break
 
         if len(values) < page_size:
@@ -61,5 +62,5 @@ def list_boards_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        yield from iter_boards_via_rest(client, page_size)
+    client = get_shared_client(base_url, auth=auth)
+    yield from iter_boards_via_rest(client, page_size)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Iterator
 
 from ...canonical_models import JiraChangelogEvent
@@ -21,13 +22,14 @@ def iter_issue_changelog_via_rest(
     if page_size <= 0:
         raise ValueError("page_size must be > 0")
 
+    _map_event = partial(map_changelog_event, issue_key=issue_key_clean)
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
-            raise SerializationError("Pagination startAt repeated; aborting to prevent infinite loop")
-        seen_start_at.add(start_at)
+        if start_at <= prev_start_at:
+            raise SerializationError("Pagination startAt did not advance; aborting to prevent infinite loop")
+        prev_start_at = start_at
 
         payload = client.get_json(
             f"/rest/api/3/issue/{issue_key_clean}/changelog",
@@ -36,8 +38,7 @@ def iter_issue_changelog_via_rest(
         page = api.PageBeanChangelog.from_dict(payload, "data")
         values = page.values
 
-        for item in values:
-            yield map_changelog_event(issue_key=issue_key_clean, changelog=item)
+        yield from [_map_event(changelog=item) for item in values]
 
         has_is_last = isinstance(page.is_last, bool)
         if has_is_last and page.is_last:
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import Iterator, List, Optional, Sequence
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 
 from ...canonical_models import JiraIssue
 from ...errors import SerializationError
 from ..client import JiraRestClient
 from ..env import auth_from_env, jira_rest_base_url_from_env
 from ..gen import jira_api as api
-from ..mappers.jira_issues import map_issue
+from ..mappers.jira_issues import map_issue, map_issues
+from ._client_pool import get_shared_client
 
 
 _DEFAULT_SEARCH_FIELDS = (
@@ -81,35 +83,35 @@ def iter_issues_via_rest(
     field_list = _build_field_list(fields, story_points_field, sprint_ids_field)
     fields_param = ",".join(field_list)
 
+    _map_page = partial(
+        map_issues,
+        cloud_id=cloud_id_clean,
+        story_points_field=story_points_field,
+        sprint_ids_field=sprint_ids_field,
+    )
+    # Built once; only startAt changes between pages.
+    params: Dict[str, Union[str, int]] = {
+        "jql": jql_clean,
+        "startAt": 0,
+        "maxResults": page_size,
+        "fields": fields_param,
+    }
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
+        if start_at <= prev_start_at:
             raise SerializationError(
-                "Pagination startAt repeated; aborting to prevent infinite loop"
+                "Pagination startAt did not advance; aborting to prevent infinite loop"
             )
-        seen_start_at.add(start_at)
-
-        payload = client.get_json(
-            "/rest/api/3/search",
-            params={
-                "jql": jql_clean,
-                "startAt": start_at,
-                "maxResults": page_size,
-                "fields": fields_param,
-            },
-        )
+        prev_start_at = start_at
+
+        params["startAt"] = start_at
+        payload = client.get_json("/rest/api/3/search", params=params)
         page = api.SearchResults.from_dict(payload, "data")
         issues = page.issues
 
-        for issue in issues:
-            yield map_issue(
-                cloud_id=cloud_id_clean,
-                issue=issue,
-                story_points_field=story_points_field,
-                sprint_ids_field=sprint_ids_field,
-            )
+        yield from _map_page(issues=issues)
 
         has_total = isinstance(page.total, int) and page.total >= 0
         if has_total:
@@ -158,18 +160,16 @@ def list_issues_via_rest(
     if sprint_ids_field is None:
         sprint_ids_field = _env_custom_field("ATLASSIAN_JIRA_SPRINT_IDS_FIELD")
 
-    with JiraRestClient(
-        base_url, auth=auth, timeout_seconds=30.0, max_retries_429=1
-    ) as client:
-        yield from iter_issues_via_rest(
-            client,
-            cloud_id=cloud_id_clean,
-            jql=jql,
-            page_size=page_size,
-            fields=fields,
-            story_points_field=story_points_field,
-            sprint_ids_field=sprint_ids_field,
-        )
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0, max_retries_429=1)
+    yield from iter_issues_via_rest(
+        client,
+        cloud_id=cloud_id_clean,
+        jql=jql,
+        page_size=page_size,
+        fields=fields,
+        story_points_field=story_points_field,
+        sprint_ids_field=sprint_ids_field,
+    )
 
 
 def create_issue_via_rest(
@@ -187,20 +187,20 @@ def create_issue_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        data = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": summary,
-                "issuetype": {"name": issue_type},
-            }
+    client = get_shared_client(base_url, auth=auth)
+    data = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": summary,
+            "issuetype": {"name": issue_type},
         }
-        if description:
-            data["fields"]["description"] = description
+    }
+    if description:
+        data["fields"]["description"] = description
 
-        payload = client.post_json("/rest/api/3/issue", json_data=data)
-        issue_bean = api.IssueBean.from_dict(payload, "data")
-        return map_issue(cloud_id=cloud_id, issue=issue_bean)
+    payload = client.post_json("/rest/api/3/issue", json_data=data)
+    issue_bean = api.IssueBean.from_dict(payload, "data")
+    return map_issue(cloud_id=cloud_id, issue=issue_bean)
 
 
 def delete_issue_via_rest(
@@ -215,5 +215,5 @@ def delete_issue_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        client.delete(f"/rest/api/3/issue/{issue_key_or_id}")
+    client = get_shared_client(base_url, auth=auth)
+    client.delete(f"/rest/api/3/issue/{issue_key_or_id}")
@@ -8,6 +8,7 @@ from ..client import JiraRestClient
 from ..env import auth_from_env, jira_rest_base_url_from_env
 from ..gen import jira_api as api
 from ..mappers.jira_projects import map_rest_project
+from ._client_pool import get_shared_client
 
 
 def _normalize_project_types(project_types: Sequence[str]) -> List[str]:
@@ -38,14 +39,14 @@ def iter_projects_via_rest(
 
     normalized_types = set(_normalize_project_types(project_types))
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
+        if start_at <= prev_start_at:
             raise SerializationError(
-                "Pagination startAt repeated; aborting to prevent infinite loop"
+                "Pagination startAt did not advance; aborting to prevent infinite loop"
             )
-        seen_start_at.add(start_at)
+        prev_start_at = start_at
 
         payload = client.get_json(
             "/rest/api/3/project/search",
@@ -62,7 +63,7 @@ def iter_projects_via_rest(
                 continue
             if project.type not in normalized_types:
                 continue
-            yield CanonicalProjectWithOpsgenieTeams(project=project, opsgenie_teams=[])
+            yield CanonicalProjectWithOpsgenieTeams(project=project, opsgenie_teams=())
 
         has_is_last = isinstance(page.is_last, bool)
         if has_is_last and page.is_last:
@@ -111,12 +112,10 @@ def list_projects_via_rest(
             "ATLASSIAN_GQL_BASE_URL for tenanted auth so it can be derived."
         )
 
-    with JiraRestClient(
-        base_url, auth=auth, timeout_seconds=30.0, max_retries_429=1
-    ) as client:
-        yield from iter_projects_via_rest(
-            client, cloud_id_clean, project_types, page_size
-        )
+    client = get_shared_client(base_url, auth=auth, timeout_seconds=30.0, max_retries_429=1)
+    yield from iter_projects_via_rest(
+        client, cloud_id_clean, project_types, page_size
+    )
 
 
 def create_project_via_rest(
@@ -131,19 +130,19 @@ def create_project_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        data = {
-            "key": project.key,
-            "name": project.name,
-            "projectTypeKey": project.type or "software",
-            "leadAccountId": "...",  # Need more info or handle via terraform?
-        }
-        # In practice, and for Terraform automation, leadAccountId is often required.
-        # But maybe we just post what we have for now.
-        payload = client.post_json("/rest/api/3/project", json_data=data)
-        return map_rest_project(
-            cloud_id=cloud_id, project=api.Project.from_dict(payload, "data")
-        )
+    client = get_shared_client(base_url, auth=auth)
+    data = {
+        "key": project.key,
+        "name": project.name,
+        "projectTypeKey": project.type or "software",
+        "leadAccountId": "...",  # Need more info or handle via terraform?
+    }
+    # In practice, and for Terraform automation, leadAccountId is often required.
+    # But maybe we just post what we have for now.
+    payload = client.post_json("/rest/api/3/project", json_data=data)
+    return map_rest_project(
+        cloud_id=cloud_id, project=api.Project.from_dict(payload, "data")
+    )
 
 
 def delete_project_via_rest(
@@ -158,5 +157,5 @@ def delete_project_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        client.delete(f"/rest/api/3/project/{project_key_or_id}")
+    client = get_shared_client(base_url, auth=auth)
+    client.delete(f"/rest/api/3/project/{project_key_or_id}")
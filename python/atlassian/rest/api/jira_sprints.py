@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, Iterator, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, Optional, Sequence, Union
 
 from ...canonical_models import JiraSprint
 from ...errors import SerializationError
 from ..client import JiraRestClient
-from ..gen.jira_agile_api import SprintPage
-from ..mappers.jira_sprints import map_sprint
+from ..mappers.jira_sprints import map_sprint_from_dict, read_sprint_page
 
 
 def iter_board_sprints_via_rest(
@@ -46,12 +46,12 @@ def iter_board_sprints_via_rest(
             raise ValueError("state must be one of: future, active, closed")
 
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
-            raise SerializationError("Pagination startAt repeated; aborting to prevent infinite loop")
-        seen_start_at.add(start_at)
+        if start_at <= prev_start_at:
+            raise SerializationError("Pagination startAt did not advance; aborting to prevent infinite loop")
+        prev_start_at = start_at
 
         params: Dict[str, Union[int, str]] = {"startAt": start_at, "maxResults": page_size}
         if state_clean is not None:
@@ -61,23 +61,74 @@ def iter_board_sprints_via_rest(
             f"/rest/agile/1.0/board/{board_id}/sprint",
             params=params,
         )
-        page = SprintPage.from_dict(payload, "data")
-        values = page.values
+        values, is_last = read_sprint_page(payload)
 
-        for item in values:
-            yield map_sprint(sprint=item)
+        yield from [
+            map_sprint_from_dict(item, f"data.values[{idx}]")
+            for idx, item in enumerate(values)
+        ]
 
-        has_is_last = isinstance(page.is_last, bool)
-        if has_is_last and page.is_last:
+        has_is_last = is_last is not None
+        if has_is_last and is_last:
             break
 
         if len(values) < page_size:
             break
 
         if len(values) == 0:
-            if has_is_last and not page.is_last:
+            if has_is_last and not is_last:
                 raise SerializationError(
                     "Received empty page with isLast=false; cannot continue pagination"
                 )
             break
         start_at += len(values)
+
+
+def iter_many_sprints(
+    client: JiraRestClient,
+    board_ids: Sequence[int],
+    *,
+    state: Optional[str] = None,
+    page_size: int = 50,
+    max_workers: int = 8,
+) -> Iterator[JiraSprint]:
+    """Iterate over sprints for several boards, fetching boards in parallel.
+
+    Each board's pages are still fetched sequentially (cursor-free startAt
+    paging), but up to `max_workers` boards are synced concurrently; the
+    blocking HTTP GETs release the GIL, so multi-board syncs scale with
+    workers. Sprints are yielded per board as that board's fetch completes,
+    so cross-board ordering is not guaranteed.
+
+    Args:
+        client: JiraRestClient instance (shared across workers; its 429
+            handling applies per request)
+        board_ids: IDs of the Jira Agile boards to sync
+        state: Optional filter by sprint state (future, active, closed)
+        page_size: Number of sprints per page (default: 50)
+        max_workers: Maximum boards fetched concurrently (default: 8)
+
+    Yields:
+        JiraSprint: Canonical sprint objects
+
+    Raises:
+        ValueError: If max_workers is <= 0, or any board_id/page_size is
+            invalid
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be > 0")
+    ids = list(board_ids)
+    if not ids:
+        return
+
+    def fetch(board_id: int) -> list[JiraSprint]:
+        return list(
+            iter_board_sprints_via_rest(
+                client, board_id=board_id, state=state, page_size=page_size
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+        futures = [executor.submit(fetch, board_id) for board_id in ids]
+        for future in as_completed(futures):
+            yield from future.result()
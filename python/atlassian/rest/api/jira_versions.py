@@ -7,7 +7,12 @@ from ...errors import SerializationError
 from ..client import JiraRestClient
 from ..env import auth_from_env, jira_rest_base_url_from_env
 from ..gen import jira_api as api
-from ..mappers.jira_versions import map_rest_version
+from ..mappers.jira_versions import (
+    map_rest_version,
+    map_rest_version_from_dict,
+    read_version_page,
+)
+from ._client_pool import get_shared_client
 
 
 def iter_versions_via_rest(
@@ -22,39 +27,40 @@ def iter_versions_via_rest(
         raise ValueError("page_size must be > 0")
 
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
+        if start_at <= prev_start_at:
             raise SerializationError(
-                "Pagination startAt repeated; aborting to prevent infinite loop"
+                "Pagination startAt did not advance; aborting to prevent infinite loop"
             )
-        seen_start_at.add(start_at)
+        prev_start_at = start_at
 
         payload = client.get_json(
             f"/rest/api/3/project/{project_clean}/version",
             params={"startAt": start_at, "maxResults": page_size},
         )
-        page = api.PageBeanVersion.from_dict(payload, "data")
-        values = page.values
+        values, is_last, total = read_version_page(payload)
 
-        for item in values:
-            yield map_rest_version(project_key=project_clean, version=item)
+        yield from [
+            map_rest_version_from_dict(project_clean, item, f"data.values[{idx}]")
+            for idx, item in enumerate(values)
+        ]
 
-        has_is_last = isinstance(page.is_last, bool)
-        if has_is_last and page.is_last:
+        has_is_last = is_last is not None
+        if has_is_last and is_last:
             break
 
-        has_total = isinstance(page.total, int) and page.total >= 0
+        has_total = total is not None and total >= 0
         if has_total:
-            if start_at + len(values) >= page.total:
+            if start_at + len(values) >= total:
                 break
         else:
             if len(values) < page_size:
                 break
 
         if len(values) == 0:
-            if has_is_last and not page.is_last:
+            if has_is_last and not is_last:
                 raise SerializationError(
                     "Received empty page with isLast=false; cannot continue pagination"
                 )
@@ -79,8 +85,8 @@ def list_versions_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        yield from iter_versions_via_rest(client, project_clean, page_size)
+    client = get_shared_client(base_url, auth=auth)
+    yield from iter_versions_via_rest(client, project_clean, page_size)
 
 
 def create_version_via_rest(
@@ -94,20 +100,20 @@ def create_version_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        data = {
-            "name": version.name,
-            "project": version.project_key,
-            "released": version.released,
-        }
-        if version.release_date:
-            data["releaseDate"] = version.release_date
-
-        payload = client.post_json("/rest/api/3/version", json_data=data)
-        return map_rest_version(
-            project_key=version.project_key,
-            version=api.Version.from_dict(payload, "data"),
-        )
+    client = get_shared_client(base_url, auth=auth)
+    data = {
+        "name": version.name,
+        "project": version.project_key,
+        "released": version.released,
+    }
+    if version.release_date:
+        data["releaseDate"] = version.release_date
+
+    payload = client.post_json("/rest/api/3/version", json_data=data)
+    return map_rest_version(
+        project_key=version.project_key,
+        version=api.Version.from_dict(payload, "data"),
+    )
 
 
 def update_version_via_rest(
@@ -124,19 +130,19 @@ def update_version_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        data = {
-            "name": version.name,
-            "released": version.released,
-        }
-        if version.release_date:
-            data["releaseDate"] = version.release_date
-
-        payload = client.put_json(f"/rest/api/3/version/{version.id}", json_data=data)
-        return map_rest_version(
-            project_key=version.project_key,
-            version=api.Version.from_dict(payload, "data"),
-        )
+    client = get_shared_client(base_url, auth=auth)
+    data = {
+        "name": version.name,
+        "released": version.released,
+    }
+    if version.release_date:
+        data["releaseDate"] = version.release_date
+
+    payload = client.put_json(f"/rest/api/3/version/{version.id}", json_data=data)
+    return map_rest_version(
+        project_key=version.project_key,
+        version=api.Version.from_dict(payload, "data"),
+    )
 
 
 def delete_version_via_rest(
@@ -153,5 +159,5 @@ def delete_version_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        client.delete(f"/rest/api/3/version/{version_id}")
+    client = get_shared_client(base_url, auth=auth)
+    client.delete(f"/rest/api/3/version/{version_id}")
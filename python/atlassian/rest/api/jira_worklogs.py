@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Iterator
 
 from ...canonical_models import JiraWorklog
@@ -8,6 +9,7 @@ from ..client import JiraRestClient
 from ..env import auth_from_env, jira_rest_base_url_from_env
 from ..gen import jira_api as api
 from ..mappers.jira_worklogs import map_worklog
+from ._client_pool import get_shared_client
 
 
 def iter_issue_worklogs_via_rest(
@@ -22,15 +24,16 @@ def iter_issue_worklogs_via_rest(
     if page_size <= 0:
         raise ValueError("page_size must be > 0")
 
+    _map_worklog = partial(map_worklog, issue_key=issue_key_clean)
     start_at = 0
-    seen_start_at: set[int] = set()
+    prev_start_at = -1
 
     while True:
-        if start_at in seen_start_at:
+        if start_at <= prev_start_at:
             raise SerializationError(
-                "Pagination startAt repeated; aborting to prevent infinite loop"
+                "Pagination startAt did not advance; aborting to prevent infinite loop"
             )
-        seen_start_at.add(start_at)
+        prev_start_at = start_at
 
         payload = client.get_json(
             f"/rest/api/3/issue/{issue_key_clean}/worklog",
@@ -39,8 +42,7 @@ def iter_issue_worklogs_via_rest(
         page = api.PageOfWorklogs.from_dict(payload, "data")
         worklogs = page.worklogs
 
-        for wl in worklogs:
-            yield map_worklog(issue_key=issue_key_clean, worklog=wl)
+        yield from [_map_worklog(worklog=wl) for wl in worklogs]
 
         has_total = isinstance(page.total, int) and page.total >= 0
         if has_total:
@@ -68,16 +70,16 @@ def create_worklog_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        data = {
-            "timeSpentSeconds": time_spent_seconds,
-            "started": started_at,
-        }
-        payload = client.post_json(
-            f"/rest/api/3/issue/{issue_key}/worklog", json_data=data
-        )
-        wl = api.Worklog.from_dict(payload, "data")
-        return map_worklog(issue_key=issue_key, worklog=wl)
+    client = get_shared_client(base_url, auth=auth)
+    data = {
+        "timeSpentSeconds": time_spent_seconds,
+        "started": started_at,
+    }
+    payload = client.post_json(
+        f"/rest/api/3/issue/{issue_key}/worklog", json_data=data
+    )
+    wl = api.Worklog.from_dict(payload, "data")
+    return map_worklog(issue_key=issue_key, worklog=wl)
 
 
 def delete_worklog_via_rest(
@@ -92,5 +94,5 @@ def delete_worklog_via_rest(
     if not base_url:
         raise ValueError("Missing Jira REST base URL.")
 
-    with JiraRestClient(base_url, auth=auth) as client:
-        client.delete(f"/rest/api/3/issue/{issue_key}/worklog/{worklog_id}")
+    client = get_shared_client(base_url, auth=auth)
+    client.delete(f"/rest/api/3/issue/{issue_key}/worklog/{worklog_id}")
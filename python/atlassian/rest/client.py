@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Callable, Dict, Optional, Tuple, Union
@@ -12,6 +11,25 @@ from ..errors import RateLimitError, SerializationError, TransportError
 from ..logging import get_logger, sanitize_headers
 from ..retry import parse_retry_after
 
+try:  # optional speedup for large paginated payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = None
+
+
+def _parse_json_body(response: httpx.Response) -> Dict:
+    """Parse a JSON object body, via orjson when available."""
+    try:
+        if _json_loads is not None:
+            body = _json_loads(response.content)
+        else:
+            body = response.json()
+    except ValueError as exc:
+        raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+    if not isinstance(body, dict):
+        raise SerializationError("Expected object JSON response")
+    return body
+
 
 class JiraRestClient:
     def __init__(
@@ -194,14 +212,7 @@ class JiraRestClient:
                         body_snippet=response.text[:200],
                     )
 
-                try:
-                    body = response.json()
-                except json.JSONDecodeError as exc:
-                    raise SerializationError(f"Failed to parse JSON: {exc}") from exc
-
-                if not isinstance(body, dict):
-                    raise SerializationError("Expected object JSON response")
-                return body
+                return _parse_json_body(response)
             finally:
                 response.close()
 
@@ -265,14 +276,7 @@ class JiraRestClient:
             if response.status_code == 204 or not response.text:
                 return {}
 
-            try:
-                body = response.json()
-            except json.JSONDecodeError as exc:
-                raise SerializationError(f"Failed to parse JSON: {exc}") from exc
-
-            if not isinstance(body, dict):
-                raise SerializationError("Expected object JSON response")
-            return body
+            return _parse_json_body(response)
         except httpx.RequestError as exc:
             raise TransportError(status_code=0, body_snippet=str(exc)) from exc
 
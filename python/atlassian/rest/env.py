@@ -1,21 +1,49 @@
+"""Environment-based auth and base-URL resolution for the REST helpers.
+
+Resolution is cached on a snapshot of the relevant environment variables, so
+the one-shot ``list_*``/``create_*`` helpers reuse the same auth object and
+base URL instead of re-reading ``os.environ`` and re-parsing credentials on
+every call. Call :func:`reload_env` after mutating the environment (e.g. in
+tests) to force a re-read.
+"""
+
 from __future__ import annotations
 
+import functools
 import json
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..auth import BasicApiTokenAuth, CookieAuth, OAuthBearerAuth
 from ..oauth_3lo import OAuthRefreshTokenAuth
 
+_AUTH_ENV_VARS = (
+    "ATLASSIAN_OAUTH_ACCESS_TOKEN",
+    "ATLASSIAN_OAUTH_REFRESH_TOKEN",
+    "ATLASSIAN_CLIENT_ID",
+    "ATLASSIAN_CLIENT_SECRET",
+    "ATLASSIAN_EMAIL",
+    "ATLASSIAN_API_TOKEN",
+    "ATLASSIAN_COOKIES_JSON",
+)
 
-def auth_from_env():
-    token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
-    refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
-    client_id = os.getenv("ATLASSIAN_CLIENT_ID")
-    client_secret = os.getenv("ATLASSIAN_CLIENT_SECRET")
-    email = os.getenv("ATLASSIAN_EMAIL")
-    api_token = os.getenv("ATLASSIAN_API_TOKEN")
-    cookies_json = os.getenv("ATLASSIAN_COOKIES_JSON")
+_BASE_URL_ENV_VARS = (
+    "ATLASSIAN_JIRA_BASE_URL",
+    "ATLASSIAN_OAUTH_ACCESS_TOKEN",
+    "ATLASSIAN_OAUTH_REFRESH_TOKEN",
+    "ATLASSIAN_GQL_BASE_URL",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_env_snapshot() -> Tuple[Optional[str], ...]:
+    environ = os.environ
+    return tuple(environ.get(name) for name in _AUTH_ENV_VARS)
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_from_snapshot(snapshot: Tuple[Optional[str], ...]):
+    token, refresh_token, client_id, client_secret, email, api_token, cookies_json = snapshot
 
     if refresh_token and client_id and client_secret:
         return OAuthRefreshTokenAuth(
@@ -44,6 +72,10 @@ def auth_from_env():
     return None
 
 
+def auth_from_env():
+    return _auth_from_snapshot(_auth_env_snapshot())
+
+
 def _derive_site_base_url_from_gql_base(gql_base_url: str) -> Optional[str]:
     candidate = (gql_base_url or "").strip().rstrip("/")
     if not candidate:
@@ -55,18 +87,44 @@ def _derive_site_base_url_from_gql_base(gql_base_url: str) -> Optional[str]:
     return None
 
 
-def jira_rest_base_url_from_env(cloud_id: str) -> Optional[str]:
-    explicit = os.getenv("ATLASSIAN_JIRA_BASE_URL")
+@functools.lru_cache(maxsize=1)
+def _base_url_env_snapshot() -> Tuple[Optional[str], ...]:
+    environ = os.environ
+    return tuple(environ.get(name) for name in _BASE_URL_ENV_VARS)
+
+
+@functools.lru_cache(maxsize=16)
+def _base_url_from_snapshot(
+    snapshot: Tuple[Optional[str], ...], cloud_id: str
+) -> Optional[str]:
+    explicit, access_token, refresh_token, gql_base = snapshot
+
     if explicit and explicit.strip():
         return explicit.strip().rstrip("/")
 
-    if os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN") or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN"):
+    if access_token or refresh_token:
         cloud_id_clean = (cloud_id or "").strip()
         if not cloud_id_clean:
             return None
         return f"https://api.atlassian.com/ex/jira/{cloud_id_clean}"
 
-    gql_base = os.getenv("ATLASSIAN_GQL_BASE_URL")
     if gql_base:
         return _derive_site_base_url_from_gql_base(gql_base)
     return None
+
+
+def jira_rest_base_url_from_env(cloud_id: str) -> Optional[str]:
+    return _base_url_from_snapshot(_base_url_env_snapshot(), cloud_id)
+
+
+def reload_env() -> None:
+    """Forget the cached environment snapshots.
+
+    The snapshots are taken once per process; call this after mutating
+    os.environ (e.g. in tests) so the next helper call re-reads the
+    environment.
+    """
+    _auth_env_snapshot.cache_clear()
+    _auth_from_snapshot.cache_clear()
+    _base_url_env_snapshot.cache_clear()
+    _base_url_from_snapshot.cache_clear()
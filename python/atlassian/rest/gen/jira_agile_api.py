@@ -9,33 +9,33 @@ from typing import Any, Dict, List, Optional
 from atlassian.errors import SerializationError
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
+        raise SerializationError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = "") -> List[Any]:
     if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {path}")
+        raise SerializationError(f"Expected list at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
+def _expect_bool(obj: Any, path: str, suffix: str = "") -> bool:
     if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {path}")
+        raise SerializationError(f"Expected boolean at {path}{suffix}")
     return obj
 
 
-def _expect_int(obj: Any, path: str) -> int:
+def _expect_int(obj: Any, path: str, suffix: str = "") -> int:
     if isinstance(obj, bool) or not isinstance(obj, int):
-        raise SerializationError(f"Expected integer at {path}")
+        raise SerializationError(f"Expected integer at {path}{suffix}")
     return obj
 
 
@@ -59,30 +59,32 @@ class Sprint:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Sprint":
         raw = _expect_dict(obj, path)
-        sprint_id: Optional[int] = None
-        if raw.get("id") is not None:
-            sprint_id = _expect_int(raw.get("id"), f"{path}.id")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{path}.name")
-        state: Optional[str] = None
-        if raw.get("state") is not None:
-            state = _expect_str(raw.get("state"), f"{path}.state")
-        start_date: Optional[str] = None
-        if raw.get("startDate") is not None:
-            start_date = _expect_str(raw.get("startDate"), f"{path}.startDate")
-        end_date: Optional[str] = None
-        if raw.get("endDate") is not None:
-            end_date = _expect_str(raw.get("endDate"), f"{path}.endDate")
-        complete_date: Optional[str] = None
-        if raw.get("completeDate") is not None:
-            complete_date = _expect_str(raw.get("completeDate"), f"{path}.completeDate")
-        origin_board_id: Optional[int] = None
-        if raw.get("originBoardId") is not None:
-            origin_board_id = _expect_int(raw.get("originBoardId"), f"{path}.originBoardId")
-        goal: Optional[str] = None
-        if raw.get("goal") is not None:
-            goal = _expect_str(raw.get("goal"), f"{path}.goal")
+        # Each field is read once into a local; the duplicate raw.get() per
+        # field was the bulk of the happy-path cost on large pages.
+        sprint_id = raw.get("id")
+        if sprint_id is not None:
+            sprint_id = _expect_int(sprint_id, path, ".id")
+        name = raw.get("name")
+        if name is not None:
+            name = _expect_str(name, path, ".name")
+        state = raw.get("state")
+        if state is not None:
+            state = _expect_str(state, path, ".state")
+        start_date = raw.get("startDate")
+        if start_date is not None:
+            start_date = _expect_str(start_date, path, ".startDate")
+        end_date = raw.get("endDate")
+        if end_date is not None:
+            end_date = _expect_str(end_date, path, ".endDate")
+        complete_date = raw.get("completeDate")
+        if complete_date is not None:
+            complete_date = _expect_str(complete_date, path, ".completeDate")
+        origin_board_id = raw.get("originBoardId")
+        if origin_board_id is not None:
+            origin_board_id = _expect_int(origin_board_id, path, ".originBoardId")
+        goal = raw.get("goal")
+        if goal is not None:
+            goal = _expect_str(goal, path, ".goal")
         return Sprint(
             id=sprint_id,
             name=name,
@@ -110,21 +112,29 @@ class SprintPage:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "SprintPage":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        is_last = raw.get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, path, ".isLast")
         values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Sprint.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values_list = _expect_list(values_raw, path, ".values") if values_raw is not None else []
+        values = []
+        _append = values.append
+        values_path = f"{path}.values"
+        for idx, item in enumerate(values_list):
+            try:
+                _append(Sprint.from_dict(item, values_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.values)"
+                ) from exc
         return SprintPage(
             start_at=start_at,
             max_results=max_results,
@@ -148,15 +158,15 @@ class Board:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Board":
         raw = _expect_dict(obj, path)
-        board_id: Optional[int] = None
-        if raw.get("id") is not None:
-            board_id = _expect_int(raw.get("id"), f"{path}.id")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{path}.name")
-        board_type: Optional[str] = None
-        if raw.get("type") is not None:
-            board_type = _expect_str(raw.get("type"), f"{path}.type")
+        board_id = raw.get("id")
+        if board_id is not None:
+            board_id = _expect_int(board_id, path, ".id")
+        name = raw.get("name")
+        if name is not None:
+            name = _expect_str(name, path, ".name")
+        board_type = raw.get("type")
+        if board_type is not None:
+            board_type = _expect_str(board_type, path, ".type")
         return Board(
             id=board_id,
             name=name,
@@ -179,21 +189,29 @@ class BoardPage:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "BoardPage":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        is_last = raw.get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, path, ".isLast")
         values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Board.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values_list = _expect_list(values_raw, path, ".values") if values_raw is not None else []
+        values = []
+        _append = values.append
+        values_path = f"{path}.values"
+        for idx, item in enumerate(values_list):
+            try:
+                _append(Board.from_dict(item, values_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.values)"
+                ) from exc
         return BoardPage(
             start_at=start_at,
             max_results=max_results,
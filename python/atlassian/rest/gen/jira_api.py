@@ -6,39 +6,39 @@ from typing import Any, Dict, List, Optional
 
 from atlassian.errors import SerializationError
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
+        raise SerializationError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = "") -> List[Any]:
     if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {path}")
+        raise SerializationError(f"Expected list at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+        raise SerializationError(f"Expected string at {path}{suffix}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
+def _expect_bool(obj: Any, path: str, suffix: str = "") -> bool:
     if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {path}")
+        raise SerializationError(f"Expected boolean at {path}{suffix}")
     return obj
 
 
-def _expect_int(obj: Any, path: str) -> int:
+def _expect_int(obj: Any, path: str, suffix: str = "") -> int:
     if isinstance(obj, bool) or not isinstance(obj, int):
-        raise SerializationError(f"Expected integer at {path}")
+        raise SerializationError(f"Expected integer at {path}{suffix}")
     return obj
 
 
-def _expect_obj(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_obj(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     # Jira issue fields are modeled as a free-form object in the OpenAPI spec.
-    return _expect_dict(obj, path)
+    return _expect_dict(obj, path, suffix)
 
 @dataclass(frozen=True)
 class UserDetails:
@@ -49,15 +49,15 @@ class UserDetails:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "UserDetails":
         raw = _expect_dict(obj, path)
-        account_id: Optional[str] = None
-        if raw.get("accountId") is not None:
-            account_id = _expect_str(raw.get("accountId"), f"{path}.accountId")
-        display_name: Optional[str] = None
-        if raw.get("displayName") is not None:
-            display_name = _expect_str(raw.get("displayName"), f"{path}.displayName")
-        email_address: Optional[str] = None
-        if raw.get("emailAddress") is not None:
-            email_address = _expect_str(raw.get("emailAddress"), f"{path}.emailAddress")
+        account_id = raw.get("accountId")
+        if account_id is not None:
+            account_id = _expect_str(account_id, path, ".accountId")
+        display_name = raw.get("displayName")
+        if display_name is not None:
+            display_name = _expect_str(display_name, path, ".displayName")
+        email_address = raw.get("emailAddress")
+        if email_address is not None:
+            email_address = _expect_str(email_address, path, ".emailAddress")
         return UserDetails(
             account_id=account_id,
             display_name=display_name,
@@ -75,18 +75,18 @@ class Project:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Project":
         raw = _expect_dict(obj, path)
-        project_id: Optional[str] = None
-        if raw.get("id") is not None:
-            project_id = _expect_str(raw.get("id"), f"{path}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{path}.key")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{path}.name")
-        project_type_key: Optional[str] = None
-        if raw.get("projectTypeKey") is not None:
-            project_type_key = _expect_str(raw.get("projectTypeKey"), f"{path}.projectTypeKey")
+        project_id = raw.get("id")
+        if project_id is not None:
+            project_id = _expect_str(project_id, path, ".id")
+        key = raw.get("key")
+        if key is not None:
+            key = _expect_str(key, path, ".key")
+        name = raw.get("name")
+        if name is not None:
+            name = _expect_str(name, path, ".name")
+        project_type_key = raw.get("projectTypeKey")
+        if project_type_key is not None:
+            project_type_key = _expect_str(project_type_key, path, ".projectTypeKey")
         return Project(
             id=project_id,
             key=key,
@@ -106,24 +106,32 @@ class PageBeanProject:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageBeanProject":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        total = raw.get("total")
+        if total is not None:
+            total = _expect_int(total, path, ".total")
+        is_last = raw.get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, path, ".isLast")
         values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Project.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values_list = _expect_list(values_raw, path, ".values") if values_raw is not None else []
+        values = []
+        _append = values.append
+        values_path = f"{path}.values"
+        for idx, item in enumerate(values_list):
+            try:
+                _append(Project.from_dict(item, values_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.values)"
+                ) from exc
         return PageBeanProject(
             start_at=start_at,
             max_results=max_results,
@@ -142,14 +150,14 @@ class IssueBean:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "IssueBean":
         raw = _expect_dict(obj, path)
-        issue_id: Optional[str] = None
-        if raw.get("id") is not None:
-            issue_id = _expect_str(raw.get("id"), f"{path}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{path}.key")
+        issue_id = raw.get("id")
+        if issue_id is not None:
+            issue_id = _expect_str(issue_id, path, ".id")
+        key = raw.get("key")
+        if key is not None:
+            key = _expect_str(key, path, ".key")
         fields_raw = raw.get("fields")
-        fields = _expect_obj(fields_raw, f"{path}.fields") if fields_raw is not None else {}
+        fields = _expect_obj(fields_raw, path, ".fields") if fields_raw is not None else {}
         return IssueBean(id=issue_id, key=key, fields=fields)
 
 
@@ -163,21 +171,29 @@ class SearchResults:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "SearchResults":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        total = raw.get("total")
+        if total is not None:
+            total = _expect_int(total, path, ".total")
         issues_raw = raw.get("issues")
-        issues_list = _expect_list(issues_raw, f"{path}.issues") if issues_raw is not None else []
-        issues = [
-            IssueBean.from_dict(item, f"{path}.issues[{idx}]")
-            for idx, item in enumerate(issues_list)
-        ]
+        issues_list = _expect_list(issues_raw, path, ".issues") if issues_raw is not None else []
+        issues = []
+        _append = issues.append
+        issues_path = f"{path}.issues"
+        for idx, item in enumerate(issues_list):
+            try:
+                _append(IssueBean.from_dict(item, issues_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.issues)"
+                ) from exc
         return SearchResults(
             start_at=start_at,
             max_results=max_results,
@@ -197,21 +213,21 @@ class ChangeDetails:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "ChangeDetails":
         raw = _expect_dict(obj, path)
-        field: Optional[str] = None
-        if raw.get("field") is not None:
-            field = _expect_str(raw.get("field"), f"{path}.field")
-        from_value: Optional[str] = None
-        if raw.get("from") is not None:
-            from_value = _expect_str(raw.get("from"), f"{path}.from")
-        to_value: Optional[str] = None
-        if raw.get("to") is not None:
-            to_value = _expect_str(raw.get("to"), f"{path}.to")
-        from_string: Optional[str] = None
-        if raw.get("fromString") is not None:
-            from_string = _expect_str(raw.get("fromString"), f"{path}.fromString")
-        to_string: Optional[str] = None
-        if raw.get("toString") is not None:
-            to_string = _expect_str(raw.get("toString"), f"{path}.toString")
+        field = raw.get("field")
+        if field is not None:
+            field = _expect_str(field, path, ".field")
+        from_value = raw.get("from")
+        if from_value is not None:
+            from_value = _expect_str(from_value, path, ".from")
+        to_value = raw.get("to")
+        if to_value is not None:
+            to_value = _expect_str(to_value, path, ".to")
+        from_string = raw.get("fromString")
+        if from_string is not None:
+            from_string = _expect_str(from_string, path, ".fromString")
+        to_string = raw.get("toString")
+        if to_string is not None:
+            to_string = _expect_str(to_string, path, ".toString")
         return ChangeDetails(
             field=field,
             from_value=from_value,
@@ -231,21 +247,29 @@ class Changelog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Changelog":
         raw = _expect_dict(obj, path)
-        event_id: Optional[str] = None
-        if raw.get("id") is not None:
-            event_id = _expect_str(raw.get("id"), f"{path}.id")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{path}.created")
-        author: Optional[UserDetails] = None
-        if raw.get("author") is not None:
-            author = UserDetails.from_dict(raw.get("author"), f"{path}.author")
+        event_id = raw.get("id")
+        if event_id is not None:
+            event_id = _expect_str(event_id, path, ".id")
+        created = raw.get("created")
+        if created is not None:
+            created = _expect_str(created, path, ".created")
+        author = raw.get("author")
+        if author is not None:
+            author = UserDetails.from_dict(author, f"{path}.author")
         items_raw = raw.get("items")
-        items_list = _expect_list(items_raw, f"{path}.items") if items_raw is not None else []
-        items = [
-            ChangeDetails.from_dict(item, f"{path}.items[{idx}]")
-            for idx, item in enumerate(items_list)
-        ]
+        items_list = _expect_list(items_raw, path, ".items") if items_raw is not None else []
+        items = []
+        _append = items.append
+        items_path = f"{path}.items"
+        for idx, item in enumerate(items_list):
+            try:
+                _append(ChangeDetails.from_dict(item, items_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.items)"
+                ) from exc
         return Changelog(
             id=event_id,
             created=created,
@@ -265,24 +289,32 @@ class PageBeanChangelog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageBeanChangelog":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        total = raw.get("total")
+        if total is not None:
+            total = _expect_int(total, path, ".total")
+        is_last = raw.get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, path, ".isLast")
         values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Changelog.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values_list = _expect_list(values_raw, path, ".values") if values_raw is not None else []
+        values = []
+        _append = values.append
+        values_path = f"{path}.values"
+        for idx, item in enumerate(values_list):
+            try:
+                _append(Changelog.from_dict(item, values_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.values)"
+                ) from exc
         return PageBeanChangelog(
             start_at=start_at,
             max_results=max_results,
@@ -304,24 +336,24 @@ class Worklog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Worklog":
         raw = _expect_dict(obj, path)
-        worklog_id: Optional[str] = None
-        if raw.get("id") is not None:
-            worklog_id = _expect_str(raw.get("id"), f"{path}.id")
-        started: Optional[str] = None
-        if raw.get("started") is not None:
-            started = _expect_str(raw.get("started"), f"{path}.started")
-        time_spent_seconds: Optional[int] = None
-        if raw.get("timeSpentSeconds") is not None:
-            time_spent_seconds = _expect_int(raw.get("timeSpentSeconds"), f"{path}.timeSpentSeconds")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{path}.created")
-        updated: Optional[str] = None
-        if raw.get("updated") is not None:
-            updated = _expect_str(raw.get("updated"), f"{path}.updated")
-        author: Optional[UserDetails] = None
-        if raw.get("author") is not None:
-            author = UserDetails.from_dict(raw.get("author"), f"{path}.author")
+        worklog_id = raw.get("id")
+        if worklog_id is not None:
+            worklog_id = _expect_str(worklog_id, path, ".id")
+        started = raw.get("started")
+        if started is not None:
+            started = _expect_str(started, path, ".started")
+        time_spent_seconds = raw.get("timeSpentSeconds")
+        if time_spent_seconds is not None:
+            time_spent_seconds = _expect_int(time_spent_seconds, path, ".timeSpentSeconds")
+        created = raw.get("created")
+        if created is not None:
+            created = _expect_str(created, path, ".created")
+        updated = raw.get("updated")
+        if updated is not None:
+            updated = _expect_str(updated, path, ".updated")
+        author = raw.get("author")
+        if author is not None:
+            author = UserDetails.from_dict(author, f"{path}.author")
         return Worklog(
             id=worklog_id,
             started=started,
@@ -342,21 +374,29 @@ class PageOfWorklogs:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageOfWorklogs":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        total = raw.get("total")
+        if total is not None:
+            total = _expect_int(total, path, ".total")
         worklogs_raw = raw.get("worklogs")
-        worklogs_list = _expect_list(worklogs_raw, f"{path}.worklogs") if worklogs_raw is not None else []
-        worklogs = [
-            Worklog.from_dict(item, f"{path}.worklogs[{idx}]")
-            for idx, item in enumerate(worklogs_list)
-        ]
+        worklogs_list = _expect_list(worklogs_raw, path, ".worklogs") if worklogs_raw is not None else []
+        worklogs = []
+        _append = worklogs.append
+        worklogs_path = f"{path}.worklogs"
+        for idx, item in enumerate(worklogs_list):
+            try:
+                _append(Worklog.from_dict(item, worklogs_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.worklogs)"
+                ) from exc
         return PageOfWorklogs(
             start_at=start_at,
             max_results=max_results,
@@ -376,24 +416,32 @@ class PageBeanVersion:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageBeanVersion":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
+        start_at = raw.get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, path, ".startAt")
+        max_results = raw.get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, path, ".maxResults")
+        total = raw.get("total")
+        if total is not None:
+            total = _expect_int(total, path, ".total")
+        is_last = raw.get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, path, ".isLast")
         values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Version.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values_list = _expect_list(values_raw, path, ".values") if values_raw is not None else []
+        values = []
+        _append = values.append
+        values_path = f"{path}.values"
+        for idx, item in enumerate(values_list):
+            try:
+                _append(Version.from_dict(item, values_path))
+            except SerializationError as exc:
+                # Element index is attached only on failure; the happy path
+                # allocates no per-item path strings.
+                raise SerializationError(
+                    f"{exc} (element {idx} of {path}.values)"
+                ) from exc
         return PageBeanVersion(
             start_at=start_at,
             max_results=max_results,
@@ -414,22 +462,22 @@ class Version:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Version":
         raw = _expect_dict(obj, path)
-        version_id: Optional[str] = None
-        if raw.get("id") is not None:
-            version_id = _expect_str(raw.get("id"), f"{path}.id")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{path}.name")
-        project_id: Optional[int] = None
-        if raw.get("projectId") is not None:
-            project_id = _expect_int(raw.get("projectId"), f"{path}.projectId")
-        released: Optional[bool] = None
-        if raw.get("released") is not None:
-            released = _expect_bool(raw.get("released"), f"{path}.released")
-        release_date: Optional[str] = None
-        if raw.get("releaseDate") is not None:
+        version_id = raw.get("id")
+        if version_id is not None:
+            version_id = _expect_str(version_id, path, ".id")
+        name = raw.get("name")
+        if name is not None:
+            name = _expect_str(name, path, ".name")
+        project_id = raw.get("projectId")
+        if project_id is not None:
+            project_id = _expect_int(project_id, path, ".projectId")
+        released = raw.get("released")
+        if released is not None:
+            released = _expect_bool(released, path, ".released")
+        release_date = raw.get("releaseDate")
+        if release_date is not None:
             # Versions can have date-only strings "2010-07-06"
-            release_date = _expect_str(raw.get("releaseDate"), f"{path}.releaseDate")
+            release_date = _expect_str(release_date, path, ".releaseDate")
         return Version(
             id=version_id,
             name=name,
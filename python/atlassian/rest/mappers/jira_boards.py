@@ -1,12 +1,52 @@
 from __future__ import annotations
 
+import functools
+from typing import Any, List, Optional, Tuple
+
 from ...canonical_models import JiraBoard
 from ..gen import jira_agile_api as api
 
 
+@functools.lru_cache(maxsize=1024)
 def map_rest_board(board: api.Board) -> JiraBoard:
+    # Pure function of a frozen Board; syncs that re-encounter the same
+    # board reuse one canonical JiraBoard instead of re-allocating it.
     return JiraBoard(
         id=str(board.id) if board.id is not None else "",
         name=board.name or "",
         type=board.board_type or "",
     )
+
+
+def read_board_page(payload: Any) -> Tuple[List[Any], Optional[bool]]:
+    """Return (raw board dicts, isLast) from a board page payload.
+
+    Skips constructing api.BoardPage on the pagination hot path; the page
+    bookkeeping fields pagination does not read are left unvalidated.
+    """
+    raw = api._expect_dict(payload, "data")
+    values_raw = raw.get("values")
+    values = api._expect_list(values_raw, "data.values") if values_raw is not None else []
+    is_last = raw.get("isLast")
+    if is_last is not None:
+        is_last = api._expect_bool(is_last, "data.isLast")
+    return values, is_last
+
+
+def map_rest_board_from_dict(obj: Any, path: str) -> JiraBoard:
+    """Map a raw board dict straight to JiraBoard, skipping the api.Board hop."""
+    raw = api._expect_dict(obj, path)
+    board_id = raw.get("id")
+    if board_id is not None:
+        board_id = api._expect_int(board_id, path, ".id")
+    name = raw.get("name")
+    if name is not None:
+        name = api._expect_str(name, path, ".name")
+    board_type = raw.get("type")
+    if board_type is not None:
+        board_type = api._expect_str(board_type, path, ".type")
+    return JiraBoard(
+        id=str(board_id) if board_id is not None else "",
+        name=name or "",
+        type=board_type or "",
+    )
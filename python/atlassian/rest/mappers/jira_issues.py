@@ -1,29 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ...canonical_models import JiraIssue, JiraUser
 from ..gen.jira_api import IssueBean
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise ValueError(f"Expected object at {path}")
+        raise ValueError(f"Expected object at {path}{suffix}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise ValueError(f"Expected string at {path}")
+        raise ValueError(f"Expected string at {path}{suffix}")
     value = obj.strip()
     if not value:
-        raise ValueError(f"Expected non-empty string at {path}")
+        raise ValueError(f"Expected non-empty string at {path}{suffix}")
     return value
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = "") -> List[Any]:
     if not isinstance(obj, list):
-        raise ValueError(f"Expected list at {path}")
+        raise ValueError(f"Expected list at {path}{suffix}")
     return obj
 
 
@@ -38,29 +40,44 @@ def _maybe_user(obj: Any, path: str) -> Optional[JiraUser]:
     if email is not None:
         if not isinstance(email, str):
             raise ValueError(f"Expected string at {path}.emailAddress")
-        if email.strip():
-            email_value = email.strip()
+        email_value = email.strip() or None
     return JiraUser(
-        account_id=_expect_str(account_id, f"{path}.accountId"),
-        display_name=_expect_str(display_name, f"{path}.displayName"),
+        account_id=_expect_str(account_id, path, ".accountId"),
+        display_name=_expect_str(display_name, path, ".displayName"),
         email=email_value,
     )
 
 
-def _parse_story_points(fields: Dict[str, Any], field_name: Optional[str]) -> Optional[float]:
+@functools.lru_cache(maxsize=128)
+def _validated_field_key(field_name: Optional[str], label: str) -> Optional[str]:
+    """Strip and intern a custom-field key once per distinct configured name.
+
+    map_issue runs once per issue with the same configured field names, so
+    the strip/empty check is cached rather than repeated per issue; interning
+    speeds up the fields dict probe.
+    """
     if not field_name:
         return None
     field_key = field_name.strip()
     if not field_key:
-        raise ValueError("story_points_field must be non-empty when provided")
+        raise ValueError(f"{label} must be non-empty when provided")
+    return sys.intern(field_key)
+
+
+def _parse_story_points(fields: Dict[str, Any], field_key: Optional[str]) -> Optional[float]:
+    if field_key is None:
+        return None
     raw = fields.get(field_key)
     if raw is None:
         return None
-    if isinstance(raw, bool):
-        raise ValueError(f"issue.fields.{field_key} must be a number when present")
-    if isinstance(raw, (int, float)):
+    # Exact type compares ordered by frequency: the field is almost always a
+    # float already; `tp is int` also rejects bool without its own branch.
+    tp = type(raw)
+    if tp is float:
+        return raw
+    if tp is int:
         return float(raw)
-    if isinstance(raw, str):
+    if tp is str:
         if not raw.strip():
             return None
         try:
@@ -71,43 +88,44 @@ def _parse_story_points(fields: Dict[str, Any], field_name: Optional[str]) -> Op
 
 
 def _coerce_sprint_id(value: Any, path: str) -> str:
-    if isinstance(value, bool):
-        raise ValueError(f"{path} must be a string or integer")
-    if isinstance(value, int):
-        return str(value)
-    if isinstance(value, float):
-        if value.is_integer():
-            return str(int(value))
-        raise ValueError(f"{path} must be an integer")
-    if isinstance(value, str):
+    # Exact type compares with the common cases first; `tp is int` also
+    # rejects bool without a separate check.
+    tp = type(value)
+    if tp is str:
         cleaned = value.strip()
         if not cleaned:
             raise ValueError(f"{path} must be non-empty")
         return cleaned
+    if tp is int:
+        return str(value)
+    if tp is float:
+        if value.is_integer():
+            return str(int(value))
+        raise ValueError(f"{path} must be an integer")
     raise ValueError(f"{path} must be a string or integer")
 
 
-def _parse_sprint_ids(fields: Dict[str, Any], field_name: Optional[str]) -> List[str]:
-    if not field_name:
-        return []
-    field_key = field_name.strip()
-    if not field_key:
-        raise ValueError("sprint_ids_field must be non-empty when provided")
+def _parse_sprint_ids(fields: Dict[str, Any], field_key: Optional[str]) -> Tuple[str, ...]:
+    if field_key is None:
+        return ()
     raw = fields.get(field_key)
     if raw is None:
-        return []
-    items = _expect_list(raw, f"issue.fields.{field_key}")
+        return ()
+    # Exact type checks: the JSON parser only ever yields plain list/dict
+    # here, and type() is skips the MRO walk isinstance would do per issue.
+    if type(raw) is not list:
+        raise ValueError(f"Expected list at issue.fields.{field_key}")
     out: List[str] = []
-    for idx, item in enumerate(items):
+    for idx, item in enumerate(raw):
         path = f"issue.fields.{field_key}[{idx}]"
-        if isinstance(item, dict):
+        if type(item) is dict:
             sprint_id = item.get("id")
             if sprint_id is None:
                 raise ValueError(f"{path}.id is required")
             out.append(_coerce_sprint_id(sprint_id, f"{path}.id"))
         else:
             out.append(_coerce_sprint_id(item, path))
-    return out
+    return tuple(out)
 
 
 def map_issue(
@@ -120,6 +138,39 @@ def map_issue(
     cloud_id_clean = (cloud_id or "").strip()
     if not cloud_id_clean:
         raise ValueError("cloud_id is required")
+    return _map_issue_validated(
+        cloud_id_clean,
+        issue,
+        _validated_field_key(story_points_field, "story_points_field"),
+        _validated_field_key(sprint_ids_field, "sprint_ids_field"),
+    )
+
+
+def map_issues(
+    *,
+    cloud_id: str,
+    issues: Sequence[IssueBean],
+    story_points_field: Optional[str] = None,
+    sprint_ids_field: Optional[str] = None,
+) -> List[JiraIssue]:
+    """Map a batch of issues, validating the shared arguments once."""
+    cloud_id_clean = (cloud_id or "").strip()
+    if not cloud_id_clean:
+        raise ValueError("cloud_id is required")
+    story_points_key = _validated_field_key(story_points_field, "story_points_field")
+    sprint_ids_key = _validated_field_key(sprint_ids_field, "sprint_ids_field")
+    return [
+        _map_issue_validated(cloud_id_clean, issue, story_points_key, sprint_ids_key)
+        for issue in issues
+    ]
+
+
+def _map_issue_validated(
+    cloud_id_clean: str,
+    issue: IssueBean,
+    story_points_key: Optional[str],
+    sprint_ids_key: Optional[str],
+) -> JiraIssue:
     if issue is None:
         raise ValueError("issue is required")
 
@@ -143,27 +194,45 @@ def map_issue(
     if resolutiondate is not None:
         if not isinstance(resolutiondate, str):
             raise ValueError("issue.fields.resolutiondate must be a string when present")
-        if resolutiondate.strip():
-            resolved_at = resolutiondate.strip()
+        resolved_at = resolutiondate.strip() or None
 
     labels: List[str] = []
     raw_labels = fields.get("labels")
     if raw_labels is not None:
-        for idx, item in enumerate(_expect_list(raw_labels, "issue.fields.labels")):
-            labels.append(_expect_str(item, f"issue.fields.labels[{idx}]"))
+        items = _expect_list(raw_labels, "issue.fields.labels")
+        # Strip each label exactly once; a falsy entry (non-str or empty)
+        # sends the whole list down the indexed re-scan purely to raise.
+        stripped_labels = [
+            item.strip() if isinstance(item, str) else None for item in items
+        ]
+        if all(stripped_labels):
+            labels = stripped_labels
+        else:
+            for idx, item in enumerate(items):
+                _expect_str(item, f"issue.fields.labels[{idx}]")
 
     components: List[str] = []
     raw_components = fields.get("components")
     if raw_components is not None:
-        for idx, comp in enumerate(_expect_list(raw_components, "issue.fields.components")):
-            comp_obj = _expect_dict(comp, f"issue.fields.components[{idx}]")
-            components.append(_expect_str(comp_obj.get("name"), f"issue.fields.components[{idx}].name"))
+        comps = _expect_list(raw_components, "issue.fields.components")
+        stripped_names = [
+            name.strip()
+            if isinstance(comp, dict) and isinstance(name := comp.get("name"), str)
+            else None
+            for comp in comps
+        ]
+        if all(stripped_names):
+            components = stripped_names
+        else:
+            for idx, comp in enumerate(comps):
+                comp_obj = _expect_dict(comp, f"issue.fields.components[{idx}]")
+                _expect_str(comp_obj.get("name"), f"issue.fields.components[{idx}]", ".name")
 
     assignee = _maybe_user(fields.get("assignee"), "issue.fields.assignee")
     reporter = _maybe_user(fields.get("reporter"), "issue.fields.reporter")
 
-    story_points = _parse_story_points(fields, story_points_field)
-    sprint_ids = _parse_sprint_ids(fields, sprint_ids_field)
+    story_points = _parse_story_points(fields, story_points_key)
+    sprint_ids = _parse_sprint_ids(fields, sprint_ids_key)
 
     return JiraIssue(
         cloud_id=cloud_id_clean,
@@ -176,8 +245,8 @@ def map_issue(
         resolved_at=resolved_at,
         assignee=assignee,
         reporter=reporter,
-        labels=labels,
-        components=components,
+        labels=tuple(labels),
+        components=tuple(components),
         story_points=story_points,
         sprint_ids=sprint_ids,
     )
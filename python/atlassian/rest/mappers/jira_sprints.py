@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 from ...canonical_models import JiraSprint
-from ..gen.jira_agile_api import Sprint
+from ..gen.jira_agile_api import (
+    Sprint,
+    _expect_bool,
+    _expect_dict,
+    _expect_int,
+    _expect_list,
+    _expect_str,
+)
 
 
 def map_sprint(*, sprint: Sprint) -> JiraSprint:
@@ -15,30 +22,90 @@ def map_sprint(*, sprint: Sprint) -> JiraSprint:
     if sprint_id is None:
         raise ValueError("sprint.id is required")
 
-    name = sprint.name
-    if name is None or not name.strip():
+    # Strip each field once and reuse the result; stripping again in the
+    # constructor allocated a second copy of every string.
+    name = sprint.name.strip() if sprint.name is not None else ""
+    if not name:
         raise ValueError("sprint.name is required")
 
-    state = sprint.state
-    if state is None or not state.strip():
+    state = sprint.state.strip() if sprint.state is not None else ""
+    if not state:
+        raise ValueError("sprint.state is required")
+
+    start_at = sprint.start_date.strip() or None if sprint.start_date is not None else None
+    end_at = sprint.end_date.strip() or None if sprint.end_date is not None else None
+    complete_at = sprint.complete_date.strip() or None if sprint.complete_date is not None else None
+
+    return JiraSprint(
+        id=str(sprint_id),
+        name=name,
+        state=state,
+        start_at=start_at,
+        end_at=end_at,
+        complete_at=complete_at,
+    )
+
+
+def read_sprint_page(payload: Any) -> Tuple[List[Any], Optional[bool]]:
+    """Return (raw sprint dicts, isLast) from a sprint page payload.
+
+    Skips constructing api-level SprintPage on the pagination hot path; the
+    page bookkeeping fields pagination does not read are left unvalidated.
+    """
+    raw = _expect_dict(payload, "data")
+    values_raw = raw.get("values")
+    values = _expect_list(values_raw, "data.values") if values_raw is not None else []
+    is_last = raw.get("isLast")
+    if is_last is not None:
+        is_last = _expect_bool(is_last, "data.isLast")
+    return values, is_last
+
+
+def map_sprint_from_dict(obj: Any, path: str) -> JiraSprint:
+    """Map a raw sprint dict straight to JiraSprint, skipping the Sprint hop.
+
+    Validation and error messages mirror Sprint.from_dict plus map_sprint;
+    fields the canonical model does not carry (goal, originBoardId) are not
+    read at all.
+    """
+    raw = _expect_dict(obj, path)
+
+    sprint_id = raw.get("id")
+    if sprint_id is None:
+        raise ValueError("sprint.id is required")
+    sprint_id = _expect_int(sprint_id, path, ".id")
+
+    name = raw.get("name")
+    if name is not None:
+        name = _expect_str(name, path, ".name").strip()
+    if not name:
+        raise ValueError("sprint.name is required")
+
+    state = raw.get("state")
+    if state is not None:
+        state = _expect_str(state, path, ".state").strip()
+    if not state:
         raise ValueError("sprint.state is required")
 
     start_at: Optional[str] = None
-    if sprint.start_date is not None and sprint.start_date.strip():
-        start_at = sprint.start_date.strip()
+    start_date = raw.get("startDate")
+    if start_date is not None:
+        start_at = _expect_str(start_date, path, ".startDate").strip() or None
 
     end_at: Optional[str] = None
-    if sprint.end_date is not None and sprint.end_date.strip():
-        end_at = sprint.end_date.strip()
+    end_date = raw.get("endDate")
+    if end_date is not None:
+        end_at = _expect_str(end_date, path, ".endDate").strip() or None
 
     complete_at: Optional[str] = None
-    if sprint.complete_date is not None and sprint.complete_date.strip():
-        complete_at = sprint.complete_date.strip()
+    complete_date = raw.get("completeDate")
+    if complete_date is not None:
+        complete_at = _expect_str(complete_date, path, ".completeDate").strip() or None
 
     return JiraSprint(
         id=str(sprint_id),
-        name=name.strip(),
-        state=state.strip(),
+        name=name,
+        state=state,
         start_at=start_at,
         end_at=end_at,
         complete_at=complete_at,
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import functools
+from typing import Any, List, Optional, Tuple
+
 from ...canonical_models import JiraVersion
 from ..gen import jira_api as api
 
 
+@functools.lru_cache(maxsize=1024)
 def map_rest_version(project_key: str, version: api.Version) -> JiraVersion:
     return JiraVersion(
         id=version.id or "",
@@ -12,3 +16,45 @@ def map_rest_version(project_key: str, version: api.Version) -> JiraVersion:
         released=version.released or False,
         release_date=version.release_date,
     )
+
+
+def read_version_page(payload: Any) -> Tuple[List[Any], Optional[bool], Optional[int]]:
+    """Return (raw version dicts, isLast, total) from a version page payload.
+
+    Skips constructing api.PageBeanVersion on the pagination hot path; the
+    page bookkeeping fields pagination does not read are left unvalidated.
+    """
+    raw = api._expect_dict(payload, "data")
+    values_raw = raw.get("values")
+    values = api._expect_list(values_raw, "data.values") if values_raw is not None else []
+    is_last = raw.get("isLast")
+    if is_last is not None:
+        is_last = api._expect_bool(is_last, "data.isLast")
+    total = raw.get("total")
+    if total is not None:
+        total = api._expect_int(total, "data.total")
+    return values, is_last, total
+
+
+def map_rest_version_from_dict(project_key: str, obj: Any, path: str) -> JiraVersion:
+    """Map a raw version dict straight to JiraVersion, skipping the api.Version hop."""
+    raw = api._expect_dict(obj, path)
+    version_id = raw.get("id")
+    if version_id is not None:
+        version_id = api._expect_str(version_id, path, ".id")
+    name = raw.get("name")
+    if name is not None:
+        name = api._expect_str(name, path, ".name")
+    released = raw.get("released")
+    if released is not None:
+        released = api._expect_bool(released, path, ".released")
+    release_date = raw.get("releaseDate")
+    if release_date is not None:
+        release_date = api._expect_str(release_date, path, ".releaseDate")
+    return JiraVersion(
+        id=version_id or "",
+        name=name or "",
+        project_key=project_key,
+        released=released or False,
+        release_date=release_date,
+    )
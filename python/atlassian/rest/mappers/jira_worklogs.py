@@ -38,7 +38,7 @@ def map_worklog(*, issue_key: str, worklog: Worklog) -> JiraWorklog:
     updated_at = _require_non_empty(worklog.updated, "worklog.updated")
 
     tss = worklog.time_spent_seconds
-    if not isinstance(tss, int) or isinstance(tss, bool) or tss < 0:
+    if type(tss) is not int or tss < 0:
         raise ValueError("worklog.timeSpentSeconds is required and must be >= 0")
 
     return JiraWorklog(
@@ -137,6 +137,6 @@ def test_live_jira_projects_rest_smoke():
             assert first.project.key
             assert first.project.name
             assert first.project.type == "SOFTWARE"
-            assert first.opsgenie_teams == []
+            assert first.opsgenie_teams == ()
     finally:
         client.close()
@@ -4,6 +4,9 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.graph.api.jira_projects import iter_projects_with_opsgenie_linkable_teams
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_beta_headers_sent_multiple_times():
     captured = {}
@@ -16,7 +19,7 @@ def test_beta_headers_sent_multiple_times():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://beta.example.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         client.execute("query { ok }", experimental_apis=["featureA", "featureB"])
@@ -49,7 +52,7 @@ def test_beta_headers_sent_on_jira_projects_requests():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://beta.example.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         list(
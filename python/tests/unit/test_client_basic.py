@@ -13,6 +13,9 @@ from atlassian.errors import (
 )
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_execute_returns_data():
     def handler(request: httpx.Request):
@@ -22,7 +25,7 @@ def test_execute_returns_data():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         result = client.execute("query { ok }")
@@ -41,7 +44,7 @@ def test_strict_mode_raises_on_errors():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             strict=True,
             http_client=http_client,
         )
@@ -78,7 +81,7 @@ def test_retries_on_429_with_retry_after_timestamp():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=1,
             time_provider=now_fn,
             sleeper=sleeper,
@@ -101,7 +104,7 @@ def test_raises_rate_limit_error_on_invalid_retry_after():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=0,
             http_client=http_client,
         )
@@ -140,7 +143,7 @@ def test_retry_after_in_past_retries_immediately():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=1,
             time_provider=now_fn,
             sleeper=sleeper,
@@ -163,7 +166,7 @@ def test_does_not_retry_on_5xx(status_code):
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=2,
             http_client=http_client,
         )
@@ -195,7 +198,7 @@ def test_local_throttling_fails_when_wait_exceeds_max():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             enable_local_throttling=True,
             max_wait_seconds=5,
             time_provider=now_fn,
@@ -216,7 +219,7 @@ def test_invalid_json_raises_serialization_error():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(SerializationError):
@@ -1,5 +1,13 @@
+import functools
+import hashlib
+import importlib.util
+import os
+import py_compile
+import sys
+import tempfile
 from dataclasses import dataclass
-from typing import Any, Callable, cast
+from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -7,13 +15,13 @@ from atlassian.graph.mappers.compass_components import map_compass_component
 from tools.generate_compass_component_models import _Config, _render_python
 
 
-@dataclass
+@dataclass(slots=True)
 class MockTeam:
     id: str | None = None
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MockComponent:
     id: str | None = None
     name: str | None = None
@@ -27,7 +35,10 @@ class MockComponent:
     updated_at: str | None = None
 
 
+@functools.lru_cache(maxsize=None)
 def _build_compass_api() -> dict[str, Any]:
+    # Codegen + compile + exec once per test run; the tests only read from
+    # the namespace, so sharing one dict across them is safe.
     cfg = _Config(
         cloud_id_type="ID!",
         query_input_type="CompassSearchComponentsInput!",
@@ -48,10 +59,40 @@ def _build_compass_api() -> dict[str, Any]:
         owner_team_id_field="id",
         owner_team_name_field="displayName",
     )
-    namespace: dict[str, Any] = {}
     code = _render_python(cfg)
-    exec(compile(code, "<compass_components_api>", "exec"), namespace)
-    return namespace
+    # Import from an on-disk cache keyed by the rendered source hash instead
+    # of exec'ing a string: Python writes a .pyc alongside on first import,
+    # so later test sessions load bytecode and skip parse+compile entirely.
+    code_bytes = code.encode("utf-8")
+    digest = hashlib.sha256(code_bytes).hexdigest()[:16]
+    module_name = f"_compass_api_{digest}"
+    # The cache lives under the user's home, not the world-shared tempdir,
+    # so other local users cannot pre-plant a module we would then execute.
+    cache_dir = Path.home() / ".cache" / "atlassian_codegen"
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    module_path = cache_dir / f"{module_name}.py"
+    # Never trust the hash embedded in the filename: compare the on-disk
+    # bytes against the rendered source and rewrite on any mismatch.
+    if not module_path.exists() or module_path.read_bytes() != code_bytes:
+        # Write-then-rename so concurrent workers (pytest-xdist) never
+        # import a half-written module.
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".py")
+        try:
+            os.write(fd, code_bytes)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, module_path)
+        # pytest sets sys.dont_write_bytecode, so compile the .pyc here;
+        # the import machinery still reads it on later sessions.
+        py_compile.compile(str(module_path), doraise=True)
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclass decorators in the generated code resolve cls.__module__
+    # through sys.modules, so register the module before executing it.
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return vars(module)
 
 
 class TestMapCompassComponent:
@@ -76,7 +117,7 @@ class TestMapCompassComponent:
         assert mapped.description is None
         assert mapped.owner_team_id is None
         assert mapped.owner_team_name is None
-        assert mapped.labels == []
+        assert mapped.labels == ()
 
     def test_labels_empty_list(self):
         component = MockComponent(
@@ -86,7 +127,7 @@ class TestMapCompassComponent:
             labels=[],
         )
         mapped = map_compass_component(cloud_id="cloud", component=component)
-        assert mapped.labels == []
+        assert mapped.labels == ()
 
     def test_labels_trim_and_filter(self):
         component = MockComponent(
@@ -96,7 +137,7 @@ class TestMapCompassComponent:
             labels=["  alpha ", "", "beta", "  "],
         )
         mapped = map_compass_component(cloud_id="cloud", component=component)
-        assert mapped.labels == ["alpha", "beta"]
+        assert mapped.labels == ("alpha", "beta")
 
     def test_owner_team_object_overrides_fields(self):
         component = MockComponent(
@@ -114,7 +155,7 @@ class TestMapCompassComponent:
 
 def test_compass_components_pagination_parses_page_info_and_edges():
     api = _build_compass_api()
-    parse = cast(Callable[[Any], Any], api["parse_compass_search_components"])
+    parse = api["parse_compass_search_components"]
     data = {
         "compass": {
             "searchComponents": {
@@ -151,8 +192,8 @@ def test_compass_components_pagination_parses_page_info_and_edges():
 
 def test_compass_components_handles_query_error_union():
     api = _build_compass_api()
-    parse = cast(Callable[[Any], Any], api["parse_compass_search_components"])
-    query_error = cast(type, api["QueryError"])
+    parse = api["parse_compass_search_components"]
+    query_error = api["QueryError"]
     data = {
         "compass": {
             "searchComponents": {
@@ -170,8 +211,8 @@ def test_compass_components_handles_query_error_union():
 
 def test_compass_components_handles_component_error_nodes():
     api = _build_compass_api()
-    parse = cast(Callable[[Any], Any], api["parse_compass_search_components"])
-    query_error = cast(type, api["QueryError"])
+    parse = api["parse_compass_search_components"]
+    query_error = api["QueryError"]
     data = {
         "compass": {
             "searchComponents": {
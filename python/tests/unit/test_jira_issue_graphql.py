@@ -3,13 +3,16 @@ import json
 import httpx
 
 from atlassian.auth import OAuthBearerAuth
-from atlassian.graph.api.jira_issues import get_issue_by_key
+from atlassian.graph.api.jira_issues import get_issue_by_key, get_issues_by_keys
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_issue_by_key_graphql_mapping():
     def handler(request: httpx.Request) -> httpx.Response:
-        payload = json.loads(request.content.decode("utf-8"))
+        payload = json.loads(request.content)
         assert payload.get("operationName") == "JiraIssueByKey"
         assert payload.get("variables") == {"cloudId": "cloud-123", "key": "A-1"}
         return httpx.Response(
@@ -36,7 +39,7 @@ def test_jira_issue_by_key_graphql_mapping():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         issue = get_issue_by_key(client, "cloud-123", "A-1")
@@ -48,3 +51,103 @@ def test_jira_issue_by_key_graphql_mapping():
     assert issue.assignee and issue.assignee.account_id == "u1"
     assert issue.reporter and issue.reporter.account_id == "u2"
     assert issue.resolved_at == "2021-01-03T00:00:00Z"
+
+
+def test_jira_issues_by_keys_batched_single_request():
+    def issue_payload(key: str) -> dict:
+        return {
+            "key": key,
+            "issueType": {"name": "Bug"},
+            "status": {"name": "Done"},
+            "projectField": {"project": {"key": "A", "cloudId": "cloud-123"}},
+            "createdField": {"dateTime": "2021-01-01T00:00:00Z"},
+            "updatedField": {"dateTime": "2021-01-02T00:00:00Z"},
+            "resolutionDateField": None,
+            "assigneeField": None,
+            "reporter": None,
+        }
+
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests_seen.append(payload)
+        assert payload.get("operationName") == "JiraIssuesByKeys"
+        assert payload.get("variables") == {"cloudId": "cloud-123", "k0": "A-1", "k1": "A-2"}
+        assert "i0: issueByKey(key: $k0, cloudId: $cloudId)" in payload["query"]
+        assert "i1: issueByKey(key: $k1, cloudId: $cloudId)" in payload["query"]
+        return httpx.Response(
+            200,
+            json={"data": {"i0": issue_payload("A-1"), "i1": issue_payload("A-2")}},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=_STATIC_AUTH,
+            http_client=http_client,
+        )
+        issues = get_issues_by_keys(client, "cloud-123", ["A-1", "A-2"])
+
+    assert len(requests_seen) == 1
+    assert [issue.key for issue in issues] == ["A-1", "A-2"]
+    assert all(issue.project_key == "A" for issue in issues)
+
+
+def test_jira_issues_by_keys_empty_list_short_circuits():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected for empty key list")
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=_STATIC_AUTH,
+            http_client=http_client,
+        )
+        assert get_issues_by_keys(client, "cloud-123", []) == []
+
+
+def test_jira_issues_async_gather_fetches_concurrently():
+    import asyncio
+
+    from atlassian.graph.api.jira_issues import aget_issues_by_keys
+    from atlassian.graph.async_client import AsyncGraphQLClient
+
+    def issue_payload(key: str) -> dict:
+        return {
+            "key": key,
+            "issueType": {"name": "Bug"},
+            "status": {"name": "Done"},
+            "projectField": {"project": {"key": "A", "cloudId": "cloud-123"}},
+            "createdField": {"dateTime": "2021-01-01T00:00:00Z"},
+            "updatedField": {"dateTime": "2021-01-02T00:00:00Z"},
+            "resolutionDateField": None,
+            "assigneeField": None,
+            "reporter": None,
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        assert payload.get("operationName") == "JiraIssueByKey"
+        key = payload["variables"]["key"]
+        return httpx.Response(
+            200, json={"data": {"issueByKey": issue_payload(key)}}, request=request
+        )
+
+    async def run() -> list:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, timeout=5.0) as http_client:
+            client = AsyncGraphQLClient(
+                "https://api.atlassian.com",
+                auth=_STATIC_AUTH,
+                http_client=http_client,
+            )
+            return await aget_issues_by_keys(
+                client, "cloud-123", ["A-1", "A-2", "A-3"], concurrency=2
+            )
+
+    issues = asyncio.run(run())
+    assert [issue.key for issue in issues] == ["A-1", "A-2", "A-3"]
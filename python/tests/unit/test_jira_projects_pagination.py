@@ -7,6 +7,9 @@ from atlassian.graph.api.jira_projects import iter_projects_with_opsgenie_linkab
 from atlassian.graph.client import GraphQLClient
 from atlassian.graph.gen import jira_projects_api as api
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def _resp(request: httpx.Request, payload: dict, status_code: int = 200, headers: dict | None = None) -> httpx.Response:
     return httpx.Response(
@@ -21,7 +24,7 @@ def test_jira_projects_pagination_outer_and_nested():
     calls: list[dict] = []
 
     def handler(request: httpx.Request) -> httpx.Response:
-        body = json.loads(request.content.decode("utf-8"))
+        body = json.loads(request.content)
         op = body.get("operationName")
         vars = body.get("variables") or {}
         calls.append({"op": op, "vars": vars})
@@ -171,7 +174,7 @@ def test_jira_projects_pagination_outer_and_nested():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         results = list(
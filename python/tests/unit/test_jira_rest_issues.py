@@ -1,3 +1,5 @@
+import json
+
 import httpx
 import pytest
 
@@ -5,91 +7,98 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_issues import iter_issues_via_rest
 from atlassian.rest.client import JiraRestClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_rest_issues_pagination_and_mapping():
     story_points_field = "customfield_10016"
     sprint_ids_field = "customfield_10020"
 
+    # Serialize each page body once up front; the handler just picks the
+    # right bytes by startAt instead of re-encoding JSON per call.
+    pages = {
+        start: json.dumps(payload).encode("utf-8")
+        for start, payload in {
+            0: {
+                "startAt": 0,
+                "maxResults": 2,
+                "total": 3,
+                "issues": [
+                    {
+                        "id": "1",
+                        "key": "A-1",
+                        "fields": {
+                            "project": {"key": "A"},
+                            "issuetype": {"name": "Bug"},
+                            "status": {"name": "Done"},
+                            "created": "2021-01-01T00:00:00.000+0000",
+                            "updated": "2021-01-02T00:00:00.000+0000",
+                            "labels": ["l1"],
+                            "components": [{"name": "Comp1"}],
+                            story_points_field: 5,
+                            sprint_ids_field: [{"id": 101}, {"id": "102"}],
+                        },
+                    },
+                    {
+                        "id": "2",
+                        "key": "A-2",
+                        "fields": {
+                            "project": {"key": "A"},
+                            "issuetype": {"name": "Task"},
+                            "status": {"name": "To Do"},
+                            "created": "2021-01-03T00:00:00.000+0000",
+                            "updated": "2021-01-04T00:00:00.000+0000",
+                            "assignee": {"accountId": "u1", "displayName": "User 1"},
+                            "reporter": {"accountId": "u2", "displayName": "User 2"},
+                            story_points_field: 3.5,
+                        },
+                    },
+                ],
+            },
+            2: {
+                "startAt": 2,
+                "maxResults": 2,
+                "total": 3,
+                "issues": [
+                    {
+                        "id": "3",
+                        "key": "A-3",
+                        "fields": {
+                            "project": {"key": "A"},
+                            "issuetype": {"name": "Story"},
+                            "status": {"name": "In Progress"},
+                            "created": "2021-01-05T00:00:00.000+0000",
+                            "updated": "2021-01-06T00:00:00.000+0000",
+                            "resolutiondate": "2021-01-07T00:00:00.000+0000",
+                        },
+                    }
+                ],
+            },
+        }.items()
+    }
+    json_headers = {"Content-Type": "application/json"}
+
     def handler(request: httpx.Request) -> httpx.Response:
         assert request.url.path.endswith("/rest/api/3/search")
-        start_at = int(request.url.params.get("startAt", "0"))
-        assert request.url.params.get("jql")
-        fields_param = request.url.params.get("fields")
+        # Parse the query string once; each .params access re-parses it.
+        params = request.url.params
+        start_at = int(params.get("startAt", "0"))
+        assert params.get("jql")
+        fields_param = params.get("fields")
         assert fields_param
         assert story_points_field in fields_param
         assert sprint_ids_field in fields_param
-        if start_at == 0:
-            return httpx.Response(
-                200,
-                json={
-                    "startAt": 0,
-                    "maxResults": 2,
-                    "total": 3,
-                    "issues": [
-                        {
-                            "id": "1",
-                            "key": "A-1",
-                            "fields": {
-                                "project": {"key": "A"},
-                                "issuetype": {"name": "Bug"},
-                                "status": {"name": "Done"},
-                                "created": "2021-01-01T00:00:00.000+0000",
-                                "updated": "2021-01-02T00:00:00.000+0000",
-                                "labels": ["l1"],
-                                "components": [{"name": "Comp1"}],
-                                story_points_field: 5,
-                                sprint_ids_field: [{"id": 101}, {"id": "102"}],
-                            },
-                        },
-                        {
-                            "id": "2",
-                            "key": "A-2",
-                            "fields": {
-                                "project": {"key": "A"},
-                                "issuetype": {"name": "Task"},
-                                "status": {"name": "To Do"},
-                                "created": "2021-01-03T00:00:00.000+0000",
-                                "updated": "2021-01-04T00:00:00.000+0000",
-                                "assignee": {"accountId": "u1", "displayName": "User 1"},
-                                "reporter": {"accountId": "u2", "displayName": "User 2"},
-                                story_points_field: 3.5,
-                            },
-                        },
-                    ],
-                },
-                request=request,
-            )
-        if start_at == 2:
-            return httpx.Response(
-                200,
-                json={
-                    "startAt": 2,
-                    "maxResults": 2,
-                    "total": 3,
-                    "issues": [
-                        {
-                            "id": "3",
-                            "key": "A-3",
-                            "fields": {
-                                "project": {"key": "A"},
-                                "issuetype": {"name": "Story"},
-                                "status": {"name": "In Progress"},
-                                "created": "2021-01-05T00:00:00.000+0000",
-                                "updated": "2021-01-06T00:00:00.000+0000",
-                                "resolutiondate": "2021-01-07T00:00:00.000+0000",
-                            },
-                        }
-                    ],
-                },
-                request=request,
-            )
-        raise AssertionError(f"unexpected startAt={start_at}")
+        body = pages.get(start_at)
+        if body is None:
+            raise AssertionError(f"unexpected startAt={start_at}")
+        return httpx.Response(200, content=body, headers=json_headers, request=request)
 
     transport = httpx.MockTransport(handler)
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         issues = list(
@@ -109,10 +118,10 @@ def test_jira_rest_issues_pagination_and_mapping():
     assert issues[0].project_key == "A"
     assert issues[0].issue_type == "Bug"
     assert issues[0].status == "Done"
-    assert issues[0].labels == ["l1"]
-    assert issues[0].components == ["Comp1"]
+    assert issues[0].labels == ("l1",)
+    assert issues[0].components == ("Comp1",)
     assert issues[0].story_points == 5.0
-    assert issues[0].sprint_ids == ["101", "102"]
+    assert issues[0].sprint_ids == ("101", "102")
     assert issues[1].assignee and issues[1].assignee.account_id == "u1"
     assert issues[1].story_points == 3.5
     assert issues[2].resolved_at == "2021-01-07T00:00:00.000+0000"
@@ -123,7 +132,7 @@ def test_iter_issues_via_rest_requires_cloud_id():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(ValueError):
@@ -160,7 +169,7 @@ def test_iter_issues_via_rest_rejects_invalid_sprint_field():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(ValueError):
@@ -213,7 +222,7 @@ def test_iter_issues_via_rest_uses_env_fields(monkeypatch):
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         issues = list(
@@ -226,4 +235,4 @@ def test_iter_issues_via_rest_uses_env_fields(monkeypatch):
         )
 
     assert issues[0].story_points == 13.0
-    assert issues[0].sprint_ids == ["101", "102"]
+    assert issues[0].sprint_ids == ("101", "102")
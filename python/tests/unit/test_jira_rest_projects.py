@@ -7,6 +7,9 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_projects import iter_projects_via_rest
 from atlassian.rest.client import JiraRestClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_rest_projects_pagination_and_type_filtering():
     calls: list[int] = []
@@ -15,8 +18,9 @@ def test_jira_rest_projects_pagination_and_type_filtering():
         assert request.headers.get("Authorization") == "Bearer token"
         assert request.url.path.endswith("/rest/api/3/project/search")
 
-        start_at = int(request.url.params.get("startAt", "0"))
-        max_results = int(request.url.params.get("maxResults", "0"))
+        params = request.url.params
+        start_at = int(params.get("startAt", "0"))
+        max_results = int(params.get("maxResults", "0"))
         assert max_results == 2
         calls.append(start_at)
 
@@ -55,7 +59,7 @@ def test_jira_rest_projects_pagination_and_type_filtering():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         results = list(
@@ -70,7 +74,7 @@ def test_jira_rest_projects_pagination_and_type_filtering():
     assert [r.project.key for r in results] == ["A", "C"]
     assert results[0].project.name == "Project A"
     assert results[0].project.cloud_id == "cloud-123"
-    assert results[0].opsgenie_teams == []
+    assert results[0].opsgenie_teams == ()
     assert calls == [0, 2]
 
 
@@ -103,7 +107,7 @@ def test_jira_rest_client_retries_on_429_retry_after_seconds():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=1,
             time_provider=now_fn,
             sleeper=sleeper,
@@ -120,7 +124,7 @@ def test_iter_projects_via_rest_requires_cloud_id():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(ValueError):
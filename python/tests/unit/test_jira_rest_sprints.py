@@ -2,9 +2,15 @@ import httpx
 import pytest
 
 from atlassian.auth import OAuthBearerAuth
-from atlassian.rest.api.jira_sprints import iter_board_sprints_via_rest
+from atlassian.rest.api.jira_sprints import (
+    iter_board_sprints_via_rest,
+    iter_many_sprints,
+)
 from atlassian.rest.client import JiraRestClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_rest_sprints_pagination_and_mapping():
     """Test pagination and mapping of sprints from Jira Agile API."""
@@ -57,7 +63,7 @@ def test_jira_rest_sprints_pagination_and_mapping():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         sprints = list(iter_board_sprints_via_rest(client, board_id=10, page_size=1))
@@ -82,7 +88,7 @@ def test_iter_board_sprints_requires_positive_board_id():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(ValueError, match="board_id must be a positive integer"):
@@ -98,7 +104,7 @@ def test_iter_board_sprints_validates_state_filter():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         with pytest.raises(ValueError, match="state must be one of"):
@@ -131,7 +137,7 @@ def test_iter_board_sprints_with_state_filter():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         sprints = list(iter_board_sprints_via_rest(client, board_id=10, state="active"))
@@ -167,9 +173,59 @@ def test_iter_board_sprints_empty_state_treated_as_no_filter():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         sprints = list(iter_board_sprints_via_rest(client, board_id=10, state=""))
 
     assert len(sprints) == 1
+
+
+def test_iter_many_sprints_fans_out_across_boards():
+    """Test that the multi-board helper yields every board's sprints."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        board_id = int(request.url.path.split("/board/")[1].split("/")[0])
+        return httpx.Response(
+            200,
+            json={
+                "startAt": 0,
+                "maxResults": 50,
+                "isLast": True,
+                "values": [
+                    {
+                        "id": board_id * 100,
+                        "name": f"Sprint for board {board_id}",
+                        "state": "active",
+                    }
+                ],
+            },
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport)
+    client = JiraRestClient(
+        "https://api.atlassian.com/ex/jira/cloud-123",
+        auth=_STATIC_AUTH,
+        http_client=http_client,
+    )
+
+    sprints = list(iter_many_sprints(client, [1, 2, 3], max_workers=2))
+
+    assert len(sprints) == 3
+    assert {sprint.id for sprint in sprints} == {"100", "200", "300"}
+    assert {sprint.name for sprint in sprints} == {
+        "Sprint for board 1",
+        "Sprint for board 2",
+        "Sprint for board 3",
+    }
+
+
+def test_iter_many_sprints_requires_positive_max_workers():
+    client = JiraRestClient(
+        "https://api.atlassian.com/ex/jira/cloud-123",
+        auth=_STATIC_AUTH,
+    )
+    with pytest.raises(ValueError, match="max_workers must be > 0"):
+        list(iter_many_sprints(client, [1], max_workers=0))
@@ -4,6 +4,9 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_worklogs import iter_issue_worklogs_via_rest
 from atlassian.rest.client import JiraRestClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_rest_worklogs_pagination_and_mapping():
     def handler(request: httpx.Request) -> httpx.Response:
@@ -54,7 +57,7 @@ def test_jira_rest_worklogs_pagination_and_mapping():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         worklogs = list(iter_issue_worklogs_via_rest(client, issue_key="A-1", page_size=1))
@@ -3,13 +3,16 @@ import json
 import httpx
 
 from atlassian.auth import OAuthBearerAuth
-from atlassian.graph.api.jira_sprints import get_sprint_by_id
+from atlassian.graph.api.jira_sprints import get_sprint_by_id, get_sprints_by_ids
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_sprint_by_id_graphql_mapping():
     def handler(request: httpx.Request) -> httpx.Response:
-        payload = json.loads(request.content.decode("utf-8"))
+        payload = json.loads(request.content)
         assert payload.get("operationName") == "JiraSprintById"
         assert payload.get("variables") == {"id": "sprint-1"}
         return httpx.Response(
@@ -33,7 +36,7 @@ def test_jira_sprint_by_id_graphql_mapping():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         sprint = get_sprint_by_id(client, "sprint-1")
@@ -42,3 +45,48 @@ def test_jira_sprint_by_id_graphql_mapping():
     assert sprint.name == "Sprint 42"
     assert sprint.state == "ACTIVE"
     assert sprint.start_at == "2021-01-01T00:00:00Z"
+
+
+def test_jira_sprints_by_ids_batched_single_request():
+    def sprint_payload(sprint_id: str, name: str) -> dict:
+        return {
+            "sprintId": sprint_id,
+            "name": name,
+            "state": "ACTIVE",
+            "startDate": "2021-01-01T00:00:00Z",
+            "endDate": "2021-01-14T00:00:00Z",
+            "completionDate": None,
+        }
+
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        requests_seen.append(payload)
+        assert payload.get("operationName") == "JiraSprintsByIds"
+        assert payload.get("variables") == {"id0": "sprint-1", "id1": "sprint-2"}
+        assert "s0: sprintById(id: $id0)" in payload["query"]
+        assert "s1: sprintById(id: $id1)" in payload["query"]
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "s0": sprint_payload("42", "Sprint 42"),
+                    "s1": sprint_payload("43", "Sprint 43"),
+                }
+            },
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=_STATIC_AUTH,
+            http_client=http_client,
+        )
+        sprints = get_sprints_by_ids(client, ["sprint-1", "sprint-2"])
+
+    assert len(requests_seen) == 1
+    assert [sprint.id for sprint in sprints] == ["42", "43"]
+    assert [sprint.name for sprint in sprints] == ["Sprint 42", "Sprint 43"]
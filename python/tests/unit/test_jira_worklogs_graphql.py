@@ -3,70 +3,88 @@ import json
 import httpx
 
 from atlassian.auth import OAuthBearerAuth
-from atlassian.graph.api.jira_worklogs import iter_issue_worklogs_via_graphql
+from atlassian.graph.api.jira_worklogs import (
+    iter_issue_worklogs_via_graphql,
+    iter_issue_worklogs_via_graphql_parallel,
+)
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
 
-def test_jira_worklogs_graphql_pagination():
-    calls = []
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-    def handler(request: httpx.Request) -> httpx.Response:
-        payload = json.loads(request.content.decode("utf-8"))
-        calls.append(payload)
-        after = (payload.get("variables") or {}).get("after")
-        if after in (None, ""):
-            data = {
-                "data": {
-                    "issue": {
-                        "worklogs": {
-                            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
-                            "edges": [
-                                {
-                                    "cursor": "e1",
-                                    "node": {
-                                        "worklogId": "w1",
-                                        "author": {"accountId": "u1", "name": "User One"},
-                                        "timeSpent": {"timeInSeconds": 60},
-                                        "created": "2021-01-01T00:00:00Z",
-                                        "updated": "2021-01-01T01:00:00Z",
-                                        "startDate": "2021-01-01T00:00:00Z",
-                                    },
-                                }
-                            ],
+# Constant page payloads serialized once at import; the handlers return the
+# cached bytes instead of re-encoding the nested dicts per call.
+_WORKLOGS_PAGE_1 = json.dumps(
+    {
+        "data": {
+            "issue": {
+                "worklogs": {
+                    "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                    "edges": [
+                        {
+                            "cursor": "e1",
+                            "node": {
+                                "worklogId": "w1",
+                                "author": {"accountId": "u1", "name": "User One"},
+                                "timeSpent": {"timeInSeconds": 60},
+                                "created": "2021-01-01T00:00:00Z",
+                                "updated": "2021-01-01T01:00:00Z",
+                                "startDate": "2021-01-01T00:00:00Z",
+                            },
                         }
-                    }
+                    ],
                 }
             }
-        else:
-            data = {
-                "data": {
-                    "issue": {
-                        "worklogs": {
-                            "pageInfo": {"hasNextPage": False, "endCursor": None},
-                            "edges": [
-                                {
-                                    "cursor": "e2",
-                                    "node": {
-                                        "worklogId": "w2",
-                                        "author": {"accountId": "u2", "name": "User Two"},
-                                        "timeSpent": {"timeInSeconds": 120},
-                                        "created": "2021-01-02T00:00:00Z",
-                                        "updated": "2021-01-02T01:00:00Z",
-                                        "startDate": "2021-01-02T00:00:00Z",
-                                    },
-                                }
-                            ],
+        }
+    }
+).encode("utf-8")
+
+_WORKLOGS_PAGE_2 = json.dumps(
+    {
+        "data": {
+            "issue": {
+                "worklogs": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "edges": [
+                        {
+                            "cursor": "e2",
+                            "node": {
+                                "worklogId": "w2",
+                                "author": {"accountId": "u2", "name": "User Two"},
+                                "timeSpent": {"timeInSeconds": 120},
+                                "created": "2021-01-02T00:00:00Z",
+                                "updated": "2021-01-02T01:00:00Z",
+                                "startDate": "2021-01-02T00:00:00Z",
+                            },
                         }
-                    }
+                    ],
                 }
             }
-        return httpx.Response(200, json=data, request=request)
+        }
+    }
+).encode("utf-8")
+
+
+def test_jira_worklogs_graphql_pagination():
+    calls = []
+    # The call sequence is statically known, so the handler just advances a
+    # page iterator instead of parsing each request body; the raw bodies are
+    # kept for the cursor assertion below.
+    pages_iter = iter((_WORKLOGS_PAGE_1, _WORKLOGS_PAGE_2))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.content)
+        return httpx.Response(
+            200, content=next(pages_iter), headers=_JSON_HEADERS, request=request
+        )
 
     transport = httpx.MockTransport(handler)
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             http_client=http_client,
         )
         worklogs = list(
@@ -82,3 +100,67 @@ def test_jira_worklogs_graphql_pagination():
     assert worklogs[0].author and worklogs[0].author.account_id == "u1"
     assert worklogs[1].time_spent_seconds == 120
     assert len(calls) == 2
+    # The second request must carry the cursor from page one.
+    assert b'"after":"c1"' in calls[1] or b'"after": "c1"' in calls[1]
+
+
+def test_jira_worklogs_graphql_parallel_prefetch_matches_sequential():
+    def page(worklog_id: str, account_id: str, seconds: int, cursor: str, has_next: bool) -> dict:
+        return {
+            "data": {
+                "issue": {
+                    "worklogs": {
+                        "pageInfo": {
+                            "hasNextPage": has_next,
+                            "endCursor": cursor if has_next else None,
+                        },
+                        "edges": [
+                            {
+                                "cursor": cursor,
+                                "node": {
+                                    "worklogId": worklog_id,
+                                    "author": {"accountId": account_id, "name": account_id},
+                                    "timeSpent": {"timeInSeconds": seconds},
+                                    "created": "2021-01-01T00:00:00Z",
+                                    "updated": "2021-01-01T01:00:00Z",
+                                    "startDate": "2021-01-01T00:00:00Z",
+                                },
+                            }
+                        ],
+                    }
+                }
+            }
+        }
+
+    pages = {
+        None: json.dumps(page("w1", "u1", 60, "c1", True)).encode("utf-8"),
+        "c1": json.dumps(page("w2", "u2", 120, "c2", True)).encode("utf-8"),
+        "c2": json.dumps(page("w3", "u3", 180, "c3", False)).encode("utf-8"),
+    }
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        after = (payload.get("variables") or {}).get("after")
+        calls.append(after)
+        return httpx.Response(200, content=pages[after], headers=_JSON_HEADERS, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=_STATIC_AUTH,
+            http_client=http_client,
+        )
+        worklogs = list(
+            iter_issue_worklogs_via_graphql_parallel(
+                client,
+                cloud_id="cloud-123",
+                issue_key="A-1",
+                page_size=1,
+            )
+        )
+
+    assert [wl.worklog_id for wl in worklogs] == ["w1", "w2", "w3"]
+    assert worklogs[2].time_spent_seconds == 180
+    assert calls == [None, "c1", "c2"]
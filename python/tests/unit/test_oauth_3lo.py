@@ -12,7 +12,7 @@ def test_oauth_refresh_token_auth_applies_and_caches_token():
     def handler(request: httpx.Request) -> httpx.Response:
         if request.url.path == "/oauth/token":
             calls["token"] += 1
-            payload = json.loads(request.content.decode("utf-8"))
+            payload = json.loads(request.content)
             assert payload["grant_type"] == "refresh_token"
             assert payload["client_id"] == "client-id"
             assert payload["client_secret"] == "client-secret"
@@ -8,6 +8,9 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.graph.api.jira_projects import iter_projects_with_opsgenie_linkable_teams
 from atlassian.graph.client import GraphQLClient
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_jira_projects_retries_on_429_retry_after_timestamp():
     now = datetime(2021, 5, 10, 10, 59, 58, tzinfo=timezone.utc)
@@ -46,7 +49,7 @@ def test_jira_projects_retries_on_429_retry_after_timestamp():
     ]
 
     def handler(request: httpx.Request) -> httpx.Response:
-        payload = json.loads(request.content.decode("utf-8"))
+        payload = json.loads(request.content)
         assert payload.get("operationName") == "JiraProjectsPage"
         return responses.pop(0)(request)
 
@@ -54,7 +57,7 @@ def test_jira_projects_retries_on_429_retry_after_timestamp():
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = GraphQLClient(
             "https://api.atlassian.com",
-            auth=OAuthBearerAuth(lambda: "token"),
+            auth=_STATIC_AUTH,
             max_retries_429=1,
             time_provider=now_fn,
             sleeper=sleeper,
@@ -5,13 +5,16 @@ import httpx
 from atlassian.auth import OAuthBearerAuth
 from atlassian.graph.schema_fetcher import fetch_schema_introspection
 
+# OAuthBearerAuth is stateless, so one shared instance serves every test.
+_STATIC_AUTH = OAuthBearerAuth(lambda: "token")
+
 
 def test_schema_fetcher_writes_introspection_json(tmp_path):
     captured: dict[str, object] = {}
 
     def handler(request: httpx.Request):
         captured["beta"] = request.headers.get_list("X-ExperimentalApi")
-        payload = json.loads(request.content.decode("utf-8")) if request.content else {}
+        payload = json.loads(request.content) if request.content else {}
         captured["query"] = payload.get("query")
         return httpx.Response(
             200,
@@ -30,7 +33,7 @@ def test_schema_fetcher_writes_introspection_json(tmp_path):
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         result = fetch_schema_introspection(
             "https://api.atlassian.com",
-            OAuthBearerAuth(lambda: "token"),
+            _STATIC_AUTH,
             output_dir=tmp_path,
             experimental_apis=["featureA", "featureB"],
             timeout_seconds=5.0,
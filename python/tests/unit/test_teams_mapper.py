@@ -1,23 +1,83 @@
+import copy
+import re
+
 import pytest
 
 from atlassian.canonical_models import AtlassianTeam, AtlassianTeamMember
 from atlassian.graph.mappers.teams import map_team, map_team_member
 
+# Sentinel for parametrized cases that exercise a *missing* attribute rather
+# than a falsy value.
+_MISSING = object()
+
+# Error patterns compiled once; pytest.raises(match=...) re-compiles string
+# patterns per use, and the literal dots need escaping anyway.
+_ERR_TEAM_ID = re.compile(r"team\.id is required")
+_ERR_TEAM_DISPLAY_NAME = re.compile(r"team\.displayName is required")
+_ERR_TEAM_STATE = re.compile(r"team\.state is required")
+_ERR_TEAM = re.compile(r"team is required")
+_ERR_MEMBER_ACCOUNT_ID = re.compile(r"member\.accountId is required")
+_ERR_TEAM_ID_ARG = re.compile(r"teamId is required")
+_ERR_MEMBER = re.compile(r"member is required")
+
+
+class _Stub:
+    """Slotted attribute stub: no per-instance dict, and an unset slot raises
+    AttributeError exactly like an absent field on a parser node."""
+
+    __slots__ = (
+        "id",
+        "display_name",
+        "state",
+        "description",
+        "avatar_url",
+        "member_count",
+        "account_id",
+        "role",
+    )
+
+
+def _namespace(**fields):
+    stub = _Stub()
+    for key, value in fields.items():
+        setattr(stub, key, value)
+    return stub
+
+
+# Canonical stubs built once; variants are a shallow copy plus the overridden
+# attributes instead of rebuilding the full namespace per test.
+_BASE_TEAM = _namespace(
+    id="ari:cloud:identity::team/abc123",
+    display_name="Engineering",
+    state="ACTIVE",
+)
+_BASE_MEMBER = _namespace(account_id="user123")
+
+
+def _variant(base, overrides):
+    stub = copy.copy(base)
+    for key, value in overrides.items():
+        if value is _MISSING:
+            delattr(stub, key)
+        else:
+            setattr(stub, key, value)
+    return stub
+
+
+def _make_team(**overrides):
+    return _variant(_BASE_TEAM, overrides)
+
+
+def _make_member(**overrides):
+    return _variant(_BASE_MEMBER, overrides)
+
 
 class TestMapTeam:
     """Tests for map_team() function."""
 
     def test_map_team_with_required_fields_only(self):
         """Test mapping team with only required fields."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-            },
-        )()
+        team = _make_team()
 
         result = map_team(team)
 
@@ -31,18 +91,14 @@ class TestMapTeam:
 
     def test_map_team_with_all_fields(self):
         """Test mapping team with all fields populated."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/xyz789",
-                "display_name": "Platform Team",
-                "state": "ACTIVE",
-                "description": "Responsible for platform infrastructure",
-                "avatar_url": "https://example.com/avatar.png",
-                "member_count": 5,
-            },
-        )()
+        team = _namespace(
+            id="ari:cloud:identity::team/xyz789",
+            display_name="Platform Team",
+            state="ACTIVE",
+            description="Responsible for platform infrastructure",
+            avatar_url="https://example.com/avatar.png",
+            member_count=5,
+        )
 
         result = map_team(team)
 
@@ -55,15 +111,11 @@ class TestMapTeam:
 
     def test_map_team_trims_whitespace(self):
         """Test that required fields are trimmed."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "  ari:cloud:identity::team/abc123  ",
-                "display_name": "  Engineering  ",
-                "state": "  ACTIVE  ",
-            },
-        )()
+        team = _make_team(
+            id="  ari:cloud:identity::team/abc123  ",
+            display_name="  Engineering  ",
+            state="  ACTIVE  ",
+        )
 
         result = map_team(team)
 
@@ -71,277 +123,74 @@ class TestMapTeam:
         assert result.display_name == "Engineering"
         assert result.state == "ACTIVE"
 
-    def test_map_team_optional_fields_trimmed(self):
-        """Test that optional string fields are trimmed."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "description": "  A team  ",
-                "avatar_url": "  https://example.com/avatar.png  ",
-            },
-        )()
+    @pytest.mark.parametrize(
+        "field,value,expected",
+        [
+            ("description", "  A team  ", "A team"),
+            ("avatar_url", "  https://example.com/avatar.png  ", "https://example.com/avatar.png"),
+            ("description", "   ", None),
+            ("avatar_url", "", None),
+        ],
+    )
+    def test_map_team_optional_string_fields(self, field, value, expected):
+        """Optional strings are trimmed; empty/whitespace-only become None."""
+        team = _make_team(**{field: value})
 
         result = map_team(team)
 
-        assert result.description == "A team"
-        assert result.avatar_url == "https://example.com/avatar.png"
-
-    def test_map_team_optional_fields_empty_string_becomes_none(self):
-        """Test that empty/whitespace-only optional fields become None."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "description": "   ",
-                "avatar_url": "",
-            },
-        )()
+        assert getattr(result, field) == expected
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (10, 10),
+            (0, 0),
+            ("10", None),  # string instead of int
+            (True, None),  # bool is not treated as int
+        ],
+    )
+    def test_map_team_member_count(self, value, expected):
+        """Only plain ints survive member_count validation."""
+        team = _make_team(member_count=value)
 
         result = map_team(team)
 
-        assert result.description is None
-        assert result.avatar_url is None
-
-    def test_map_team_member_count_valid_int(self):
-        """Test that valid integer member_count is preserved."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "member_count": 10,
-            },
-        )()
-
-        result = map_team(team)
-
-        assert result.member_count == 10
-
-    def test_map_team_member_count_zero(self):
-        """Test that zero member_count is preserved."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "member_count": 0,
-            },
-        )()
-
-        result = map_team(team)
-
-        assert result.member_count == 0
-
-    def test_map_team_member_count_non_int_becomes_none(self):
-        """Test that non-integer member_count becomes None."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "member_count": "10",  # string instead of int
-            },
-        )()
-
-        result = map_team(team)
-
-        assert result.member_count is None
-
-    def test_map_team_member_count_bool_becomes_none(self):
-        """Test that boolean member_count becomes None (not treated as int)."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-                "member_count": True,
-            },
-        )()
-
-        result = map_team(team)
-
-        assert result.member_count is None
-
-    def test_map_team_missing_id_raises_error(self):
-        """Test that missing id raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.id is required"):
-            map_team(team)
-
-    def test_map_team_empty_id_raises_error(self):
-        """Test that empty id raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.id is required"):
-            map_team(team)
-
-    def test_map_team_whitespace_only_id_raises_error(self):
-        """Test that whitespace-only id raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "   ",
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.id is required"):
-            map_team(team)
-
-    def test_map_team_missing_display_name_raises_error(self):
-        """Test that missing display_name raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.displayName is required"):
-            map_team(team)
-
-    def test_map_team_empty_display_name_raises_error(self):
-        """Test that empty display_name raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.displayName is required"):
-            map_team(team)
-
-    def test_map_team_missing_state_raises_error(self):
-        """Test that missing state raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.state is required"):
-            map_team(team)
-
-    def test_map_team_empty_state_raises_error(self):
-        """Test that empty state raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": "",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.state is required"):
+        assert result.member_count == expected
+
+    @pytest.mark.parametrize(
+        "overrides,error_match",
+        [
+            ({"id": _MISSING}, _ERR_TEAM_ID),
+            ({"id": ""}, _ERR_TEAM_ID),
+            ({"id": "   "}, _ERR_TEAM_ID),
+            ({"id": 123}, _ERR_TEAM_ID),
+            ({"display_name": _MISSING}, _ERR_TEAM_DISPLAY_NAME),
+            ({"display_name": ""}, _ERR_TEAM_DISPLAY_NAME),
+            ({"display_name": 123}, _ERR_TEAM_DISPLAY_NAME),
+            ({"state": _MISSING}, _ERR_TEAM_STATE),
+            ({"state": ""}, _ERR_TEAM_STATE),
+            ({"state": 123}, _ERR_TEAM_STATE),
+        ],
+    )
+    def test_map_team_invalid_required_field_raises_error(self, overrides, error_match):
+        """Missing, empty, whitespace-only, or non-string required fields raise."""
+        team = _make_team(**overrides)
+
+        with pytest.raises(ValueError, match=error_match):
             map_team(team)
 
     def test_map_team_none_input_raises_error(self):
         """Test that None input raises ValueError."""
-        with pytest.raises(ValueError, match="team is required"):
+        with pytest.raises(ValueError, match=_ERR_TEAM):
             map_team(None)
 
-    def test_map_team_non_string_id_raises_error(self):
-        """Test that non-string id raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": 123,
-                "display_name": "Engineering",
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.id is required"):
-            map_team(team)
-
-    def test_map_team_non_string_display_name_raises_error(self):
-        """Test that non-string display_name raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": 123,
-                "state": "ACTIVE",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.displayName is required"):
-            map_team(team)
-
-    def test_map_team_non_string_state_raises_error(self):
-        """Test that non-string state raises ValueError."""
-        team = type(
-            "Team",
-            (),
-            {
-                "id": "ari:cloud:identity::team/abc123",
-                "display_name": "Engineering",
-                "state": 123,
-            },
-        )()
-
-        with pytest.raises(ValueError, match="team.state is required"):
-            map_team(team)
-
 
 class TestMapTeamMember:
     """Tests for map_team_member() function."""
 
     def test_map_team_member_with_required_fields_only(self):
         """Test mapping team member with only required fields."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-            },
-        )()
+        member = _make_member()
 
         result = map_team_member(team_id="team-abc", member=member)
 
@@ -353,15 +202,11 @@ class TestMapTeamMember:
 
     def test_map_team_member_with_all_fields(self):
         """Test mapping team member with all fields populated."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user456",
-                "display_name": "Alice Smith",
-                "role": "ADMIN",
-            },
-        )()
+        member = _namespace(
+            account_id="user456",
+            display_name="Alice Smith",
+            role="ADMIN",
+        )
 
         result = map_team_member(team_id="team-xyz", member=member)
 
@@ -372,169 +217,55 @@ class TestMapTeamMember:
 
     def test_map_team_member_trims_whitespace(self):
         """Test that required fields are trimmed."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "  user123  ",
-            },
-        )()
+        member = _make_member(account_id="  user123  ")
 
         result = map_team_member(team_id="  team-abc  ", member=member)
 
         assert result.team_id == "team-abc"
         assert result.account_id == "user123"
 
-    def test_map_team_member_optional_fields_trimmed(self):
-        """Test that optional string fields are trimmed."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-                "display_name": "  Alice Smith  ",
-                "role": "  ADMIN  ",
-            },
-        )()
+    @pytest.mark.parametrize(
+        "field,value,expected",
+        [
+            ("display_name", "  Alice Smith  ", "Alice Smith"),
+            ("role", "  ADMIN  ", "ADMIN"),
+            ("display_name", "   ", None),
+            ("role", "", None),
+            ("display_name", 123, None),  # non-string becomes None
+            ("role", 123, None),
+        ],
+    )
+    def test_map_team_member_optional_fields(self, field, value, expected):
+        """Optional strings are trimmed; empty or non-string values become None."""
+        member = _make_member(**{field: value})
 
         result = map_team_member(team_id="team-abc", member=member)
 
-        assert result.display_name == "Alice Smith"
-        assert result.role == "ADMIN"
+        assert getattr(result, field) == expected
 
-    def test_map_team_member_optional_fields_empty_string_becomes_none(self):
-        """Test that empty/whitespace-only optional fields become None."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-                "display_name": "   ",
-                "role": "",
-            },
-        )()
-
-        result = map_team_member(team_id="team-abc", member=member)
+    @pytest.mark.parametrize(
+        "account_id",
+        [_MISSING, "", "   ", 123],
+    )
+    def test_map_team_member_invalid_account_id_raises_error(self, account_id):
+        """Missing, empty, whitespace-only, or non-string account_id raises."""
+        member = _make_member(account_id=account_id)
 
-        assert result.display_name is None
-        assert result.role is None
-
-    def test_map_team_member_missing_account_id_raises_error(self):
-        """Test that missing account_id raises ValueError."""
-        member = type("Member", (), {})()
-
-        with pytest.raises(ValueError, match="member.accountId is required"):
-            map_team_member(team_id="team-abc", member=member)
-
-    def test_map_team_member_empty_account_id_raises_error(self):
-        """Test that empty account_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="member.accountId is required"):
+        with pytest.raises(ValueError, match=_ERR_MEMBER_ACCOUNT_ID):
             map_team_member(team_id="team-abc", member=member)
 
-    def test_map_team_member_whitespace_only_account_id_raises_error(self):
-        """Test that whitespace-only account_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "   ",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="member.accountId is required"):
-            map_team_member(team_id="team-abc", member=member)
+    @pytest.mark.parametrize(
+        "team_id",
+        ["", "   ", 123],
+    )
+    def test_map_team_member_invalid_team_id_raises_error(self, team_id):
+        """Empty, whitespace-only, or non-string team_id raises."""
+        member = _make_member()
 
-    def test_map_team_member_missing_team_id_raises_error(self):
-        """Test that missing team_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="teamId is required"):
-            map_team_member(team_id="", member=member)
-
-    def test_map_team_member_whitespace_only_team_id_raises_error(self):
-        """Test that whitespace-only team_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="teamId is required"):
-            map_team_member(team_id="   ", member=member)
+        with pytest.raises(ValueError, match=_ERR_TEAM_ID_ARG):
+            map_team_member(team_id=team_id, member=member)
 
     def test_map_team_member_none_member_raises_error(self):
         """Test that None member raises ValueError."""
-        with pytest.raises(ValueError, match="member is required"):
+        with pytest.raises(ValueError, match=_ERR_MEMBER):
             map_team_member(team_id="team-abc", member=None)
-
-    def test_map_team_member_non_string_account_id_raises_error(self):
-        """Test that non-string account_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": 123,
-            },
-        )()
-
-        with pytest.raises(ValueError, match="member.accountId is required"):
-            map_team_member(team_id="team-abc", member=member)
-
-    def test_map_team_member_non_string_team_id_raises_error(self):
-        """Test that non-string team_id raises ValueError."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-            },
-        )()
-
-        with pytest.raises(ValueError, match="teamId is required"):
-            map_team_member(team_id=123, member=member)
-
-    def test_map_team_member_non_string_display_name_becomes_none(self):
-        """Test that non-string display_name becomes None."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-                "display_name": 123,
-            },
-        )()
-
-        result = map_team_member(team_id="team-abc", member=member)
-
-        assert result.display_name is None
-
-    def test_map_team_member_non_string_role_becomes_none(self):
-        """Test that non-string role becomes None."""
-        member = type(
-            "Member",
-            (),
-            {
-                "account_id": "user123",
-                "role": 123,
-            },
-        )()
-
-        result = map_team_member(team_id="team-abc", member=member)
-
-        assert result.role is None
@@ -0,0 +1,84 @@
+"""Optionally compile hot pure-Python modules with mypyc.
+
+Every mapper allocates frozen dataclasses from `atlassian.canonical_models`;
+on large pages the per-field `__init__`/`__setattr__` bytecode dominates.
+Compiling the module ahead of time replaces that with C-level constructors.
+
+This is strictly opt-in: run the script in an environment with `mypy[mypyc]`
+installed and the resulting extension module shadows `canonical_models.py`
+on import. Without it (or after `--clean`) the pure-Python module is used
+unchanged, so no runtime dependency on mypyc is introduced.
+
+Usage:
+  python python/tools/build_speedups.py          # compile
+  python python/tools/build_speedups.py --clean  # remove compiled artifacts
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+SPEEDUP_MODULES = (
+    "atlassian/canonical_models.py",
+    "atlassian/graph/api/jira_worklogs.py",
+    "atlassian/graph/mappers/_validate.py",
+    "atlassian/graph/mappers/jira_issues.py",
+    "atlassian/graph/mappers/jira_sprints.py",
+    "atlassian/graph/mappers/jira_worklogs.py",
+    "atlassian/graph/mappers/teams.py",
+    "atlassian/rest/gen/jira_agile_api.py",
+    "atlassian/rest/mappers/jira_boards.py",
+    "atlassian/rest/mappers/jira_issues.py",
+    "atlassian/rest/mappers/jira_sprints.py",
+    "atlassian/rest/mappers/jira_versions.py",
+)
+
+
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def _clean(root: Path) -> None:
+    removed = 0
+    for module in SPEEDUP_MODULES:
+        stem = Path(module).stem
+        parent = root / Path(module).parent
+        for artifact in parent.glob(f"{stem}.*.so"):
+            artifact.unlink()
+            removed += 1
+        for artifact in parent.glob(f"{stem}.*.pyd"):
+            artifact.unlink()
+            removed += 1
+    build_dir = root / "build"
+    print(f"Removed {removed} compiled artifact(s); build/ left at {build_dir} if present")
+
+
+def main() -> int:
+    root = _project_root()
+    if "--clean" in sys.argv[1:]:
+        _clean(root)
+        return 0
+
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        print(
+            "mypyc is not installed; skipping speedups build. "
+            "Install with: pip install 'mypy'",
+            file=sys.stderr,
+        )
+        return 1
+
+    cmd = [sys.executable, "-m", "mypyc", *SPEEDUP_MODULES]
+    print("Running:", " ".join(cmd))
+    result = subprocess.run(cmd, cwd=root)
+    if result.returncode != 0:
+        return result.returncode
+    print("Compiled speedups in place; delete with --clean to fall back to pure Python")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
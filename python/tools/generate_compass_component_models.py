@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -111,8 +112,8 @@ def _build_auth_from_env():
     return None
 
 
-def _load_introspection(path: Path) -> Dict[str, Any]:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+def _load_introspection(raw_bytes: bytes) -> Dict[str, Any]:
+    raw = json.loads(raw_bytes)
     if isinstance(raw, dict) and "data" in raw and isinstance(raw["data"], dict):
         data = raw["data"]
     else:
@@ -125,6 +126,41 @@ def _load_introspection(path: Path) -> Dict[str, Any]:
     return schema
 
 
+def _schema_cache_path(schema_path: Path) -> Path:
+    return schema_path.with_suffix(".cfg-cache.json")
+
+
+def _schema_hash(schema_bytes: bytes) -> str:
+    return hashlib.blake2b(schema_bytes, digest_size=16).hexdigest()
+
+
+def _load_cached_config(schema_path: Path, schema_bytes: bytes) -> Optional[_Config]:
+    """Return the cached _Config when the schema bytes are unchanged.
+
+    The introspection JSON is large and _discover_config walks it in full;
+    the no-change rebuild skips both by keying a tiny JSON cache on the
+    schema hash. Any malformed or stale cache falls through to a re-parse.
+    """
+    try:
+        cached = json.loads(_schema_cache_path(schema_path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get("hash") != _schema_hash(schema_bytes):
+        return None
+    fields = cached.get("cfg")
+    if not isinstance(fields, dict):
+        return None
+    try:
+        return _Config(**fields)
+    except TypeError:
+        return None
+
+
+def _store_cached_config(schema_path: Path, schema_bytes: bytes, cfg: _Config) -> None:
+    payload = {"hash": _schema_hash(schema_bytes), "cfg": asdict(cfg)}
+    _schema_cache_path(schema_path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
 def _types_map(schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     types = schema.get("types")
     if not isinstance(types, list):
@@ -584,7 +620,7 @@ def _expect_int(obj: Any, path: str) -> int:
     return obj
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageInfo:
     has_next_page: bool
     end_cursor: Optional[str] = None
@@ -601,7 +637,7 @@ class PageInfo:
         return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryError:
     message: str
     status_code: Optional[int] = None
@@ -622,7 +658,7 @@ class QueryError:
         return QueryError(message=message, status_code=status_code)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassTeamRef:
     id: str
     display_name: str
@@ -636,7 +672,7 @@ class CompassTeamRef:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassComponent:
     id: str
     name: str
@@ -661,7 +697,7 @@ class CompassComponent:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassComponentNode:
     component: Optional[CompassComponent]
     error: Optional[QueryError]
@@ -673,31 +709,36 @@ class CompassComponentNode:
         if component_raw is None:
             raise SerializationError(f"Missing {{path}}.component")
         component_obj = _expect_dict(component_raw, f"{{path}}.component")
-        typename = component_obj.get("__typename")
-        if typename == COMPONENT_TYPE_NAME or (COMPONENT_RESULT_KIND == "OBJECT" and typename is None):
-            return CompassComponentNode(
-                component=CompassComponent.from_dict(component_obj, f"{{path}}.component"),
-                error=None,
-            )
-        if ERROR_TYPE_NAME and typename == ERROR_TYPE_NAME:
-            return CompassComponentNode(
-                component=None,
-                error=QueryError.from_dict(component_obj, f"{{path}}.component"),
-            )
+        # O(1) dispatch on __typename; the structural fallbacks only run for
+        # payloads that omit it.
+        handler = _COMPONENT_DISPATCH.get(component_obj.get("__typename"))
+        if handler is not None:
+            return handler(component_obj, f"{{path}}.component")
         if "message" in component_obj and ERROR_TYPE_NAME:
-            return CompassComponentNode(
-                component=None,
-                error=QueryError.from_dict(component_obj, f"{{path}}.component"),
-            )
+            return _node_from_error(component_obj, f"{{path}}.component")
         if "id" in component_obj and "name" in component_obj:
-            return CompassComponentNode(
-                component=CompassComponent.from_dict(component_obj, f"{{path}}.component"),
-                error=None,
-            )
+            return _node_from_component(component_obj, f"{{path}}.component")
         raise SerializationError(f"Unexpected component type at {{path}}.component")
 
 
-@dataclass(frozen=True)
+def _node_from_component(obj: Any, path: str) -> "CompassComponentNode":
+    return CompassComponentNode(component=CompassComponent.from_dict(obj, path), error=None)
+
+
+def _node_from_error(obj: Any, path: str) -> "CompassComponentNode":
+    return CompassComponentNode(component=None, error=QueryError.from_dict(obj, path))
+
+
+# Precomputed __typename dispatch tables: one dict probe replaces the
+# per-node if/elif chain on pages with many edges.
+_COMPONENT_DISPATCH = {{COMPONENT_TYPE_NAME: _node_from_component}}
+if ERROR_TYPE_NAME:
+    _COMPONENT_DISPATCH[ERROR_TYPE_NAME] = _node_from_error
+if COMPONENT_RESULT_KIND == "OBJECT":
+    _COMPONENT_DISPATCH[None] = _node_from_component
+
+
+@dataclass(frozen=True, slots=True)
 class CompassComponentEdge:
     cursor: Optional[str]
     node: CompassComponentNode
@@ -714,7 +755,7 @@ class CompassComponentEdge:
         return CompassComponentEdge(cursor=cursor, node=node)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompassSearchComponentConnection:
     page_info: PageInfo
     edges: List[CompassComponentEdge]
@@ -739,21 +780,34 @@ class CompassSearchComponentConnection:
         return CompassSearchComponentConnection(page_info=page_info, edges=edges, nodes=nodes)
 
 
+_SEARCH_DISPATCH = {{CONNECTION_TYPE_NAME: CompassSearchComponentConnection.from_dict}}
+if ERROR_TYPE_NAME:
+    _SEARCH_DISPATCH[ERROR_TYPE_NAME] = QueryError.from_dict
+if SEARCH_RESULT_KIND == "OBJECT":
+    _SEARCH_DISPATCH[None] = CompassSearchComponentConnection.from_dict
+
+
 def parse_compass_search_components(data: Any) -> Union[CompassSearchComponentConnection, QueryError]:
-    root = _expect_dict(data, "data")
-    compass = root.get("compass")
-    if compass is None:
-        raise SerializationError("Missing data.compass")
-    compass_obj = _expect_dict(compass, "data.compass")
-    result = compass_obj.get("searchComponents")
-    if result is None:
-        raise SerializationError("Missing data.compass.searchComponents")
-    result_obj = _expect_dict(result, "data.compass.searchComponents")
-    typename = result_obj.get("__typename")
-    if typename == CONNECTION_TYPE_NAME or (SEARCH_RESULT_KIND == "OBJECT" and typename is None):
-        return CompassSearchComponentConnection.from_dict(result_obj, "data.compass.searchComponents")
-    if ERROR_TYPE_NAME and typename == ERROR_TYPE_NAME:
-        return QueryError.from_dict(result_obj, "data.compass.searchComponents")
+    # Happy path: one chained subscript resolves the connection object at C
+    # level. The validating walk below runs only when that fails, purely to
+    # raise the SerializationError naming the exact missing/invalid step.
+    try:
+        result_obj = data["compass"]["searchComponents"]
+    except (TypeError, KeyError):
+        result_obj = None
+    if not isinstance(result_obj, dict):
+        root = _expect_dict(data, "data")
+        compass = root.get("compass")
+        if compass is None:
+            raise SerializationError("Missing data.compass")
+        compass_obj = _expect_dict(compass, "data.compass")
+        result = compass_obj.get("searchComponents")
+        if result is None:
+            raise SerializationError("Missing data.compass.searchComponents")
+        result_obj = _expect_dict(result, "data.compass.searchComponents")
+    handler = _SEARCH_DISPATCH.get(result_obj.get("__typename"))
+    if handler is not None:
+        return handler(result_obj, "data.compass.searchComponents")
     if "pageInfo" in result_obj and "edges" in result_obj:
         return CompassSearchComponentConnection.from_dict(result_obj, "data.compass.searchComponents")
     if ERROR_TYPE_NAME and "message" in result_obj:
@@ -796,8 +850,12 @@ def main(argv: Sequence[str]) -> int:
             experimental_apis=_env_experimental_apis(),
         )
 
-    schema = _load_introspection(schema_path)
-    cfg = _discover_config(schema)
+    schema_bytes = schema_path.read_bytes()
+    cfg = _load_cached_config(schema_path, schema_bytes)
+    if cfg is None:
+        schema = _load_introspection(schema_bytes)
+        cfg = _discover_config(schema)
+        _store_cached_config(schema_path, schema_bytes, cfg)
     output_py = (
         repo_root
         / "python"
@@ -806,9 +864,14 @@ def main(argv: Sequence[str]) -> int:
         / "gen"
         / "compass_components_api.py"
     )
+    rendered = _render_python(cfg)
     output_py.parent.mkdir(parents=True, exist_ok=True)
-    output_py.write_text(_render_python(cfg), encoding="utf-8")
-    print(f"Wrote {output_py}")
+    # Leave the file (and its mtime) alone when the output has not changed.
+    if output_py.exists() and output_py.read_text(encoding="utf-8") == rendered:
+        print(f"Unchanged {output_py}")
+    else:
+        output_py.write_text(rendered, encoding="utf-8")
+        print(f"Wrote {output_py}")
     return 0
 
 
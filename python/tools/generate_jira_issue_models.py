@@ -266,25 +266,25 @@ JIRA_ISSUE_BY_KEY_QUERY = \"\"\"query JiraIssueByKey(
 \"\"\"
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = \"\") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f\"Expected object at {path}\")
+        raise SerializationError(f\"Expected object at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = \"\") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f\"Expected string at {path}\")
+        raise SerializationError(f\"Expected string at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_optional_str(obj: Any, path: str) -> Optional[str]:
+def _expect_optional_str(obj: Any, path: str, suffix: str = \"\") -> Optional[str]:
     if obj is None:
         return None
     if not isinstance(obj, str):
-        raise SerializationError(f\"Expected string at {path}\")
+        raise SerializationError(f\"Expected string at {{path}}{{suffix}}\")
     if not obj:
-        raise SerializationError(f\"Expected non-empty string at {path}\")
+        raise SerializationError(f\"Expected non-empty string at {{path}}{{suffix}}\")
     return obj
 
 
@@ -297,8 +297,8 @@ class JiraUser:
     def from_dict(obj: Any, path: str) -> \"JiraUser\":
         raw = _expect_dict(obj, path)
         return JiraUser(
-            account_id=_expect_str(raw.get(\"accountId\"), f\"{path}.accountId\"),
-            name=_expect_str(raw.get(\"name\"), f\"{path}.name\"),
+            account_id=_expect_str(raw.get(\"accountId\"), path, \".accountId\"),
+            name=_expect_str(raw.get(\"name\"), path, \".name\"),
         )
 
 
@@ -309,7 +309,7 @@ class JiraIssueType:
     @staticmethod
     def from_dict(obj: Any, path: str) -> \"JiraIssueType\":
         raw = _expect_dict(obj, path)
-        return JiraIssueType(name=_expect_str(raw.get(\"name\"), f\"{path}.name\"))
+        return JiraIssueType(name=_expect_str(raw.get(\"name\"), path, \".name\"))
 
 
 @dataclass(frozen=True)
@@ -319,7 +319,7 @@ class JiraStatus:
     @staticmethod
     def from_dict(obj: Any, path: str) -> \"JiraStatus\":
         raw = _expect_dict(obj, path)
-        return JiraStatus(name=_expect_str(raw.get(\"name\"), f\"{path}.name\"))
+        return JiraStatus(name=_expect_str(raw.get(\"name\"), path, \".name\"))
 
 
 @dataclass(frozen=True)
@@ -331,8 +331,8 @@ class JiraProject:
     def from_dict(obj: Any, path: str) -> \"JiraProject\":
         raw = _expect_dict(obj, path)
         return JiraProject(
-            key=_expect_str(raw.get(\"key\"), f\"{path}.key\"),
-            cloud_id=_expect_str(raw.get(\"cloudId\"), f\"{path}.cloudId\"),
+            key=_expect_str(raw.get(\"key\"), path, \".key\"),
+            cloud_id=_expect_str(raw.get(\"cloudId\"), path, \".cloudId\"),
         )
 
 
@@ -344,7 +344,7 @@ class JiraProjectField:
     def from_dict(obj: Any, path: str) -> \"JiraProjectField\":
         raw = _expect_dict(obj, path)
         return JiraProjectField(
-            project=JiraProject.from_dict(raw.get(\"project\"), f\"{path}.project\"),
+            project=JiraProject.from_dict(raw.get(\"project\"), f\"{{path}}.project\"),
         )
 
 
@@ -356,7 +356,7 @@ class JiraDateTimePickerField:
     def from_dict(obj: Any, path: str) -> \"JiraDateTimePickerField\":
         raw = _expect_dict(obj, path)
         return JiraDateTimePickerField(
-            date_time=_expect_optional_str(raw.get(\"dateTime\"), f\"{path}.dateTime\")
+            date_time=_expect_optional_str(raw.get(\"dateTime\"), f\"{{path}}.dateTime\")
         )
 
 
@@ -368,7 +368,7 @@ class JiraSingleSelectUserPickerField:
     def from_dict(obj: Any, path: str) -> \"JiraSingleSelectUserPickerField\":
         raw = _expect_dict(obj, path)
         user_raw = raw.get(\"user\")
-        user = JiraUser.from_dict(user_raw, f\"{path}.user\") if user_raw is not None else None
+        user = JiraUser.from_dict(user_raw, f\"{{path}}.user\") if user_raw is not None else None
         return JiraSingleSelectUserPickerField(user=user)
 
 
@@ -391,19 +391,23 @@ class JiraIssueNode:
         assignee_raw = raw.get(\"assigneeField\")
         reporter_raw = raw.get(\"reporter\")
         return JiraIssueNode(
-            key=_expect_str(raw.get(\"key\"), f\"{path}.key\"),
-            issue_type=JiraIssueType.from_dict(raw.get(\"issueType\"), f\"{path}.issueType\"),
-            status=JiraStatus.from_dict(raw.get(\"status\"), f\"{path}.status\"),
-            project_field=JiraProjectField.from_dict(raw.get(\"projectField\"), f\"{path}.projectField\"),
-            created_field=JiraDateTimePickerField.from_dict(raw.get(\"createdField\"), f\"{path}.createdField\"),
-            updated_field=JiraDateTimePickerField.from_dict(raw.get(\"updatedField\"), f\"{path}.updatedField\"),
-            resolution_date_field=JiraDateTimePickerField.from_dict(resolution_raw, f\"{path}.resolutionDateField\")
+            key=_expect_str(raw.get(\"key\"), path, \".key\"),
+            issue_type=JiraIssueType.from_dict(raw.get(\"issueType\"), f\"{{path}}.issueType\"),
+            status=JiraStatus.from_dict(raw.get(\"status\"), f\"{{path}}.status\"),
+            project_field=JiraProjectField.from_dict(raw.get(\"projectField\"), f\"{{path}}.projectField\"),
+            created_field=JiraDateTimePickerField.from_dict(raw.get(\"createdField\"), f\"{{path}}.createdField\"),
+            updated_field=JiraDateTimePickerField.from_dict(raw.get(\"updatedField\"), f\"{{path}}.updatedField\"),
+            resolution_date_field=JiraDateTimePickerField.from_dict(
+                resolution_raw, f\"{{path}}.resolutionDateField\"
+            )
             if resolution_raw is not None
             else None,
-            assignee_field=JiraSingleSelectUserPickerField.from_dict(assignee_raw, f\"{path}.assigneeField\")
+            assignee_field=JiraSingleSelectUserPickerField.from_dict(
+                assignee_raw, f\"{{path}}.assigneeField\"
+            )
             if assignee_raw is not None
             else None,
-            reporter=JiraUser.from_dict(reporter_raw, f\"{path}.reporter\") if reporter_raw is not None else None,
+            reporter=JiraUser.from_dict(reporter_raw, f\"{{path}}.reporter\") if reporter_raw is not None else None,
         )
 
 
@@ -278,37 +278,37 @@ JIRA_ISSUE_WORKLOGS_PAGE_QUERY = \"\"\"query JiraIssueWorklogsPage(
 \"\"\"
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = \"\") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f\"Expected object at {{path}}\")
+        raise SerializationError(f\"Expected object at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = \"\") -> List[Any]:
     if not isinstance(obj, list):
-        raise SerializationError(f\"Expected list at {{path}}\")
+        raise SerializationError(f\"Expected list at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = \"\") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f\"Expected string at {{path}}\")
+        raise SerializationError(f\"Expected string at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_optional_str(obj: Any, path: str) -> Optional[str]:
+def _expect_optional_str(obj: Any, path: str, suffix: str = \"\") -> Optional[str]:
     if obj is None:
         return None
     if not isinstance(obj, str):
-        raise SerializationError(f\"Expected string at {{path}}\")
+        raise SerializationError(f\"Expected string at {{path}}{{suffix}}\")
     if not obj:
-        raise SerializationError(f\"Expected non-empty string at {{path}}\")
+        raise SerializationError(f\"Expected non-empty string at {{path}}{{suffix}}\")
     return obj
 
 
-def _expect_int(obj: Any, path: str) -> int:
+def _expect_int(obj: Any, path: str, suffix: str = \"\") -> int:
     if not isinstance(obj, int) or isinstance(obj, bool):
-        raise SerializationError(f\"Expected integer at {{path}}\")
+        raise SerializationError(f\"Expected integer at {{path}}{{suffix}}\")
     return obj
 
 
@@ -327,7 +327,7 @@ class PageInfo:
         if PAGEINFO_HAS_END_CURSOR:
             value = raw.get(\"endCursor\")
             if value is not None:
-                end_cursor = _expect_str(value, f\"{{path}}.endCursor\")
+                end_cursor = _expect_str(value, path, \".endCursor\")
         return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
 
 
@@ -340,8 +340,8 @@ class JiraUser:
     def from_dict(obj: Any, path: str) -> \"JiraUser\":
         raw = _expect_dict(obj, path)
         return JiraUser(
-            account_id=_expect_str(raw.get(\"accountId\"), f\"{{path}}.accountId\"),
-            name=_expect_str(raw.get(\"name\"), f\"{{path}}.name\"),
+            account_id=_expect_str(raw.get(\"accountId\"), path, \".accountId\"),
+            name=_expect_str(raw.get(\"name\"), path, \".name\"),
         )
 
 
@@ -355,7 +355,7 @@ class JiraEstimate:
         value = raw.get(\"timeInSeconds\")
         if value is None:
             return JiraEstimate(time_in_seconds=None)
-        return JiraEstimate(time_in_seconds=_expect_int(value, f\"{{path}}.timeInSeconds\"))
+        return JiraEstimate(time_in_seconds=_expect_int(value, path, \".timeInSeconds\"))
 
 
 @dataclass(frozen=True)
@@ -372,10 +372,10 @@ class JiraWorklogNode:
         raw = _expect_dict(obj, path)
         author_raw = raw.get(\"author\")
         return JiraWorklogNode(
-            worklog_id=_expect_str(raw.get(\"worklogId\"), f\"{{path}}.worklogId\"),
+            worklog_id=_expect_str(raw.get(\"worklogId\"), path, \".worklogId\"),
             author=JiraUser.from_dict(author_raw, f\"{{path}}.author\") if author_raw is not None else None,
             time_spent=JiraEstimate.from_dict(raw.get(\"timeSpent\"), f\"{{path}}.timeSpent\"),
-            created=_expect_str(raw.get(\"created\"), f\"{{path}}.created\"),
+            created=_expect_str(raw.get(\"created\"), path, \".created\"),
             updated=_expect_optional_str(raw.get(\"updated\"), f\"{{path}}.updated\"),
             started=_expect_optional_str(raw.get(\"startDate\"), f\"{{path}}.startDate\"),
         )
@@ -393,7 +393,7 @@ class JiraWorklogEdge:
         if WORKLOGS_EDGE_HAS_CURSOR:
             value = raw.get(\"cursor\")
             if value is not None:
-                cursor = _expect_str(value, f\"{{path}}.cursor\")
+                cursor = _expect_str(value, path, \".cursor\")
         node = JiraWorklogNode.from_dict(raw.get(\"node\"), f\"{{path}}.node\")
         return JiraWorklogEdge(cursor=cursor, node=node)
 
@@ -407,7 +407,7 @@ class JiraWorklogConnection:
     def from_dict(obj: Any, path: str) -> \"JiraWorklogConnection\":
         raw = _expect_dict(obj, path)
         page_info = PageInfo.from_dict(raw.get(\"pageInfo\"), f\"{{path}}.pageInfo\")
-        edges_list = _expect_list(raw.get(\"edges\"), f\"{{path}}.edges\")
+        edges_list = _expect_list(raw.get(\"edges\"), path, \".edges\")
         edges = [
             JiraWorklogEdge.from_dict(item, f\"{{path}}.edges[{{idx}}]\")
             for idx, item in enumerate(edges_list)
@@ -666,49 +666,49 @@ TEAMWORK_GRAPH_OPT_IN = {cfg.opt_in_target!r}
 {constants_block}
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
+def _expect_dict(obj: Any, path: str, suffix: str = "") -> Dict[str, Any]:
     if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {{path}}")
+        raise SerializationError(f"Expected object at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
+def _expect_list(obj: Any, path: str, suffix: str = "") -> List[Any]:
     if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {{path}}")
+        raise SerializationError(f"Expected list at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
+def _expect_str(obj: Any, path: str, suffix: str = "") -> str:
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {{path}}")
+        raise SerializationError(f"Expected string at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_optional_str(obj: Any, path: str) -> Optional[str]:
+def _expect_optional_str(obj: Any, path: str, suffix: str = "") -> Optional[str]:
     if obj is None:
         return None
     if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {{path}}")
+        raise SerializationError(f"Expected string at {{path}}{{suffix}}")
     if not obj:
-        raise SerializationError(f"Expected non-empty string at {{path}}")
+        raise SerializationError(f"Expected non-empty string at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
+def _expect_bool(obj: Any, path: str, suffix: str = "") -> bool:
     if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {{path}}")
+        raise SerializationError(f"Expected boolean at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_int(obj: Any, path: str) -> int:
+def _expect_int(obj: Any, path: str, suffix: str = "") -> int:
     if not isinstance(obj, int):
-        raise SerializationError(f"Expected integer at {{path}}")
+        raise SerializationError(f"Expected integer at {{path}}{{suffix}}")
     return obj
 
 
-def _expect_float(obj: Any, path: str) -> float:
+def _expect_float(obj: Any, path: str, suffix: str = "") -> float:
     if not isinstance(obj, (float, int)):
-        raise SerializationError(f"Expected float at {{path}}")
+        raise SerializationError(f"Expected float at {{path}}{{suffix}}")
     return float(obj)
 
 
@@ -722,7 +722,7 @@ class PageInfo:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageInfo":
         raw = _expect_dict(obj, path)
-        has_next = _expect_bool(raw.get("hasNextPage"), f"{{path}}.hasNextPage")
+        has_next = _expect_bool(raw.get("hasNextPage"), path, ".hasNextPage")
         end_cursor = (
             _expect_optional_str(raw.get("endCursor"), f"{{path}}.endCursor")
             if {str(cfg.pageinfo_has_end_cursor)}
@@ -734,7 +734,7 @@ class PageInfo:
             else None
         )
         has_previous = (
-            _expect_bool(raw.get("hasPreviousPage"), f"{{path}}.hasPreviousPage")
+            _expect_bool(raw.get("hasPreviousPage"), path, ".hasPreviousPage")
             if {str(cfg.pageinfo_has_previous_page)}
             else None
         )
@@ -799,7 +799,7 @@ class GraphStoreCypherQueryV2AriNode:
         raw = _expect_dict(obj, path)
         data_raw = raw.get("data")
         return GraphStoreCypherQueryV2AriNode(
-            id=_expect_str(raw.get("id"), f"{{path}}.id"),
+            id=_expect_str(raw.get("id"), path, ".id"),
             data=GraphStoreCypherQueryV2AriNodeData.from_dict(
                 data_raw, f"{{path}}.data"
             )
@@ -815,7 +815,7 @@ class GraphStoreCypherQueryV2NodeList:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2NodeList":
         raw = _expect_dict(obj, path)
-        nodes_raw = _expect_list(raw.get("nodes"), f"{{path}}.nodes")
+        nodes_raw = _expect_list(raw.get("nodes"), path, ".nodes")
         return GraphStoreCypherQueryV2NodeList(
             nodes=[
                 GraphStoreCypherQueryV2AriNode.from_dict(item, f"{{path}}.nodes[{{idx}}]")
@@ -831,7 +831,7 @@ class GraphStoreCypherQueryV2Path:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2Path":
         raw = _expect_dict(obj, path)
-        elements = _expect_list(raw.get("elements"), f"{{path}}.elements")
+        elements = _expect_list(raw.get("elements"), path, ".elements")
         return GraphStoreCypherQueryV2Path(
             elements=[
                 _expect_str(item, f"{{path}}.elements[{{idx}}]")
@@ -848,7 +848,7 @@ class GraphStoreCypherQueryV2StringObject:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2StringObject":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2StringObject(
-            value=_expect_str(raw.get("value"), f"{{path}}.value")
+            value=_expect_str(raw.get("value"), path, ".value")
         )
 
 
@@ -860,7 +860,7 @@ class GraphStoreCypherQueryV2IntObject:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2IntObject":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2IntObject(
-            value=_expect_int(raw.get("value"), f"{{path}}.value")
+            value=_expect_int(raw.get("value"), path, ".value")
         )
 
 
@@ -872,7 +872,7 @@ class GraphStoreCypherQueryV2FloatObject:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2FloatObject":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2FloatObject(
-            value=_expect_float(raw.get("value"), f"{{path}}.value")
+            value=_expect_float(raw.get("value"), path, ".value")
         )
 
 
@@ -884,7 +884,7 @@ class GraphStoreCypherQueryV2BooleanObject:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2BooleanObject":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2BooleanObject(
-            value=_expect_bool(raw.get("value"), f"{{path}}.value")
+            value=_expect_bool(raw.get("value"), path, ".value")
         )
 
 
@@ -896,7 +896,7 @@ class GraphStoreCypherQueryV2TimestampObject:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2TimestampObject":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2TimestampObject(
-            value=_expect_int(raw.get("value"), f"{{path}}.value")
+            value=_expect_int(raw.get("value"), path, ".value")
         )
 
 
@@ -961,7 +961,7 @@ class GraphStoreCypherQueryV2Column:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2Column":
         raw = _expect_dict(obj, path)
         return GraphStoreCypherQueryV2Column(
-            key=_expect_str(raw.get("key"), f"{{path}}.key"),
+            key=_expect_str(raw.get("key"), path, ".key"),
             value=_parse_value(raw.get("value"), f"{{path}}.value"),
         )
 
@@ -973,7 +973,7 @@ class GraphStoreCypherQueryV2Node:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2Node":
         raw = _expect_dict(obj, path)
-        columns_raw = _expect_list(raw.get("columns"), f"{{path}}.columns")
+        columns_raw = _expect_list(raw.get("columns"), path, ".columns")
         return GraphStoreCypherQueryV2Node(
             columns=[
                 GraphStoreCypherQueryV2Column.from_dict(
@@ -1016,12 +1016,12 @@ class GraphStoreCypherQueryV2Connection:
     def from_dict(obj: Any, path: str) -> "GraphStoreCypherQueryV2Connection":
         raw = _expect_dict(obj, path)
         page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{{path}}.pageInfo")
-        edges_raw = _expect_list(raw.get("edges"), f"{{path}}.edges")
+        edges_raw = _expect_list(raw.get("edges"), path, ".edges")
         edges = [
             GraphStoreCypherQueryV2Edge.from_dict(item, f"{{path}}.edges[{{idx}}]")
             for idx, item in enumerate(edges_raw)
         ]
-        version = _expect_str(raw.get("{cfg.connection_version_field}"), f"{{path}}.{cfg.connection_version_field}")
+        version = _expect_str(raw.get("{cfg.connection_version_field}"), path, ".{cfg.connection_version_field}")
         return GraphStoreCypherQueryV2Connection(
             page_info=page_info,
             edges=edges,